@@ -1,30 +1,30 @@
 #!/usr/bin/env python3
 
-from re import fullmatch
 import numpy as np
 
 
 def solve(list_0, list_1):
-    list_0 = np.array(sorted(list_0))
-    list_1 = np.array(sorted(list_1))
+    list_0.sort()
+    list_1.sort()
     return np.abs(list_0 - list_1).sum()
 
 
-def parse(lines):
-    list_0 = []
-    list_1 = []
+def parse(data):
+    """
+    Parse both columns in one pass with numpy's C number parser, which treats
+    any run of whitespace as a separator.  Return the columns as int64 arrays.
+    """
+    numbers = np.fromstring(data, dtype=np.int64, sep=" ")
 
-    for line in lines:
-        match = fullmatch("(?P<number_0>\d+)\s+(?P<number_1>\d+)", line.strip())
-        list_0.append(int(match.group("number_0")))
-        list_1.append(int(match.group("number_1")))
+    if numbers.size % 2:
+        raise ValueError("expected two numbers per line")
 
-    return list_0, list_1
+    return tuple(numbers.reshape(-1, 2).T)
 
 
 def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+    with open(filename, "rb") as f_in:
+        return f_in.read()
 
 
 def main(filename, expected=None):
@@ -32,6 +32,7 @@ def main(filename, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
@@ -1,38 +1,52 @@
 #!/usr/bin/env python3
 
-from re import fullmatch
-from collections import defaultdict
 import numpy as np
 
+# largest value for which the frequencies are counted with np.bincount, beyond
+# this a table of max(list_1) counts costs more than a sorted join
+MAX_BINCOUNT = 2**24
+
 
 def solve(list_0, list_1):
-    frequency = defaultdict(
-        lambda: 0,
-        zip(*np.unique(list_1, return_counts=True)),
+    return (list_0 * get_frequencies(list_0, list_1)).sum()
+
+
+def get_frequencies(list_0, list_1):
+    """
+    Count the occurrences in list_1 of each element of list_0.  Small values
+    are counted into a table indexed by value, larger ones are looked up in
+    sorted list_1 as the width of their equal range.
+    """
+    if list_1.size == 0:
+        return np.zeros_like(list_0)
+
+    if list_1.min() >= 0 and list_1.max() < MAX_BINCOUNT:
+        counts = np.bincount(list_1)
+        in_range = (list_0 >= 0) & (list_0 < counts.size)
+        return np.where(in_range, counts[np.clip(list_0, 0, counts.size - 1)], 0)
+
+    list_1 = np.sort(list_1)
+    return np.searchsorted(list_1, list_0, side="right") - np.searchsorted(
+        list_1, list_0, side="left"
     )
-    similarity = 0
-
-    for element in list_0:
-        similarity += element * frequency[element]
-
-    return similarity
 
 
-def parse(lines):
-    list_0 = []
-    list_1 = []
+def parse(data):
+    """
+    Parse both columns in one pass with numpy's C number parser, which treats
+    any run of whitespace as a separator.  Return the columns as int64 arrays.
+    """
+    numbers = np.fromstring(data, dtype=np.int64, sep=" ")
 
-    for line in lines:
-        match = fullmatch("(?P<number_0>\d+)\s+(?P<number_1>\d+)", line.strip())
-        list_0.append(int(match.group("number_0")))
-        list_1.append(int(match.group("number_1")))
+    if numbers.size % 2:
+        raise ValueError("expected two numbers per line")
 
-    return list_0, list_1
+    return tuple(numbers.reshape(-1, 2).T)
 
 
 def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+    with open(filename, "rb") as f_in:
+        return f_in.read()
 
 
 def main(filename, expected=None):
@@ -40,6 +54,7 @@ def main(filename, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
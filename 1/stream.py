@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+
+"""
+Solve both parts of day 1 for inputs larger than memory.
+
+The input is read in chunks of chunk_size bytes.  Both columns of each chunk
+are sorted and spilled to .npy files as sorted runs, which are then memory
+mapped and merged block by block, so at most a block per run is in memory at
+once.  The merged columns are paired in order for the distance and joined by
+value for the similarity.
+
+usage:
+    ./stream.py input.txt
+    ./stream.py dump.txt --chunk-size 1000000000 --block-size 1000000 --tmp-dir /scratch
+"""
+
+from argparse import ArgumentParser
+from itertools import zip_longest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+CHUNK_SIZE = 2**26
+BLOCK_SIZE = 2**20
+
+
+def solve(runs_0, runs_1, block_size):
+    distance = get_distance(merge(runs_0, block_size), merge(runs_1, block_size))
+    similarity = get_similarity(
+        run_lengths(merge(runs_0, block_size)), run_lengths(merge(runs_1, block_size))
+    )
+    return distance, similarity
+
+
+def merge(runs, block_size):
+    """
+    k-way merge of sorted arrays, yielding sorted blocks.  Each step looks at
+    the next block_size elements of every run and emits everything up to the
+    smallest of their last elements, which no later element can precede.
+    """
+    positions = [0] * len(runs)
+
+    while True:
+        windows = [
+            (index, run[position : position + block_size])
+            for index, (run, position) in enumerate(zip(runs, positions))
+            if position < len(run)
+        ]
+
+        if not windows:
+            return
+
+        boundary = min(window[-1] for _, window in windows)
+        taken = []
+
+        for index, window in windows:
+            count = np.searchsorted(window, boundary, side="right")
+            taken.append(window[:count])
+            positions[index] += count
+
+        yield np.sort(np.concatenate(taken))
+
+
+def run_lengths(blocks):
+    """
+    Convert sorted blocks to (values, counts) blocks in which each value
+    appears once over the whole stream.  The last value of each block is held
+    back, as it may continue into the next block.
+    """
+    carry = None
+
+    for block in blocks:
+        values, counts = np.unique(block, return_counts=True)
+
+        if carry is not None:
+            if values[0] == carry[0]:
+                counts[0] += carry[1]
+            else:
+                values = np.concatenate(([carry[0]], values))
+                counts = np.concatenate(([carry[1]], counts))
+
+        carry = values[-1], counts[-1]
+
+        if values.size > 1:
+            yield values[:-1], counts[:-1]
+
+    if carry is not None:
+        yield np.array([carry[0]]), np.array([carry[1]])
+
+
+def get_distance(blocks_0, blocks_1):
+    """
+    Sum the absolute differences of the merged columns, pairing them in order.
+    """
+    distance = 0
+    buffer_0 = buffer_1 = empty = np.empty(0, dtype=np.int64)
+
+    for block_0, block_1 in zip_longest(blocks_0, blocks_1, fillvalue=empty):
+        buffer_0 = np.concatenate((buffer_0, block_0))
+        buffer_1 = np.concatenate((buffer_1, block_1))
+        count = min(buffer_0.size, buffer_1.size)
+        distance += int(np.abs(buffer_0[:count] - buffer_1[:count]).sum())
+        buffer_0, buffer_1 = buffer_0[count:], buffer_1[count:]
+
+    return distance
+
+
+def get_similarity(blocks_0, blocks_1):
+    """
+    Join the (values, counts) streams of both columns.  Everything up to the
+    smaller of the two buffered maximums can be matched, as neither stream
+    will produce those values again.
+    """
+    similarity = 0
+    empty = np.empty(0, dtype=np.int64)
+    values_0, counts_0 = values_1, counts_1 = empty, empty
+
+    while True:
+        if values_0.size == 0:
+            values_0, counts_0 = next(blocks_0, (None, None))
+
+        if values_1.size == 0:
+            values_1, counts_1 = next(blocks_1, (None, None))
+
+        if values_0 is None or values_1 is None:
+            return similarity
+
+        boundary = min(values_0[-1], values_1[-1])
+        end_0 = np.searchsorted(values_0, boundary, side="right")
+        end_1 = np.searchsorted(values_1, boundary, side="right")
+        _, indices_0, indices_1 = np.intersect1d(
+            values_0[:end_0], values_1[:end_1], assume_unique=True, return_indices=True
+        )
+        similarity += int(
+            (values_0[indices_0] * counts_0[indices_0] * counts_1[indices_1]).sum()
+        )
+        values_0, counts_0 = values_0[end_0:], counts_0[end_0:]
+        values_1, counts_1 = values_1[end_1:], counts_1[end_1:]
+
+
+def spill(filename, directory, chunk_size):
+    """
+    Sort each chunk of the input and save its columns as runs.  Return the
+    memory mapped runs of each column.
+    """
+    runs_0 = []
+    runs_1 = []
+
+    for index, chunk in enumerate(read_chunks(filename, chunk_size)):
+        for column, (values, runs) in enumerate(zip(parse(chunk), (runs_0, runs_1))):
+            path = Path(directory) / f"run_{index}_{column}.npy"
+            np.save(path, np.sort(values))
+            runs.append(np.load(path, mmap_mode="r"))
+
+    return runs_0, runs_1
+
+
+def parse(data):
+    """
+    Parse both columns in one pass with numpy's C number parser, which treats
+    any run of whitespace as a separator.  Return the columns as int64 arrays.
+    """
+    numbers = np.fromstring(data, dtype=np.int64, sep=" ")
+
+    if numbers.size % 2:
+        raise ValueError("expected two numbers per line")
+
+    return tuple(numbers.reshape(-1, 2).T)
+
+
+def read_chunks(filename, chunk_size):
+    """
+    Read the file in chunks of about chunk_size bytes, split on line endings.
+    """
+    remainder = b""
+
+    with open(filename, "rb") as f_in:
+        while data := f_in.read(chunk_size):
+            data = remainder + data
+            end = data.rfind(b"\n") + 1
+            remainder = data[end:]
+
+            if end:
+                yield data[:end]
+
+    if remainder.strip():
+        yield remainder
+
+
+def main(
+    filename,
+    chunk_size=CHUNK_SIZE,
+    block_size=BLOCK_SIZE,
+    tmp_dir=None,
+    expected=None,
+):
+    with TemporaryDirectory(dir=tmp_dir) as directory:
+        result = solve(*spill(filename, directory, chunk_size), block_size)
+
+    print(*result)
+    if expected is not None:
+        assert result == expected
+    return result
+
+
+def get_parser():
+    parser = ArgumentParser(description="Solve day 1 with bounded memory.")
+    parser.add_argument("filename")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--block-size", type=int, default=BLOCK_SIZE)
+    parser.add_argument("--tmp-dir")
+    return parser
+
+
+if __name__ == "__main__":
+    args = get_parser().parse_args()
+    main(args.filename, args.chunk_size, args.block_size, args.tmp_dir)
@@ -1,41 +1,51 @@
 #!/usr/bin/env python3
 
 import numpy as np
-from aoc_data_structures import VectorTuple
-from aoc_data_structures.grid_helpers import parse
+from aoc_utils.coords import PackedGrid
+from aoc_utils.counters import COUNTERS
+from aoc_utils.grid import digits, read_grid
 
 
 def solve(grid):
+    packed = PackedGrid(grid.shape)
+    cells = packed.flatten(grid)
     score = 0
 
-    for coord in np.argwhere(grid == 0):
+    for coord in np.flatnonzero(grid == 0).tolist():
         terminals = set()
-        dfs(VectorTuple(coord), grid, terminals)
+        dfs(coord, cells, packed, terminals)
         score += len(terminals)
 
     return score
 
 
-def dfs(coord, grid, terminals):
-    if grid[coord] == 9:
+def dfs(coord, cells, packed, terminals):
+    if COUNTERS.enabled:
+        COUNTERS.count("dfs.expanded")
+
+    if cells[coord] == 9:
         terminals.add(coord)
         return
 
-    for adjacency in coord.orthogonals(grid):
-        if grid[adjacency] - grid[coord] == 1:
-            dfs(adjacency, grid, terminals)
+    for adjacency in packed.orthogonals(coord):
+        if cells[adjacency] - cells[coord] == 1:
+            dfs(adjacency, cells, packed, terminals)
+
+
+def parse(grid):
+    return digits(grid)
 
 
 def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+    return read_grid(filename)
 
 
 def main(filename, expected=None):
-    result = solve(parse(read_file(filename)).astype(int))
+    result = solve(parse(read_file(filename)))
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
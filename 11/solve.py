@@ -48,6 +48,7 @@ def main(filename, steps, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
@@ -1,14 +1,19 @@
 #!/usr/bin/env python3
 
-import itertools
 import numpy as np
 from collections import deque
-from aoc_data_structures import VectorTuple
+from aoc_utils.coords import PackedGrid
+from aoc_utils.counters import COUNTERS
+from aoc_utils.grid import read_grid
+
+PADDING = ord(".")
 
 
 def solve(grid):
-    plots = get_plots(grid)
-    perimeters = get_perimeters(grid, plots)
+    packed = PackedGrid(grid.shape)
+    cells = packed.flatten(grid)
+    plots = get_plots(cells, packed)
+    perimeters = get_perimeters(cells, packed, plots)
     total = 0
 
     for plot, perimeter in zip(plots, perimeters):
@@ -17,83 +22,81 @@ def solve(grid):
     return total
 
 
-def get_perimeters(grid, plots):
+def get_perimeters(cells, packed, plots):
     perimeters = []
 
     for plot in plots:
-        coord = plot.copy().pop()
-        perimeters.append(get_perimeter(grid, plot))
+        perimeters.append(get_perimeter(cells, packed, plot))
 
     return perimeters
 
 
-def get_perimeter(grid, plot):
+def get_perimeter(cells, packed, plot):
     perimeter = list()
-    plot_type = grid[plot.copy().pop()]
+    plot_type = cells[plot.copy().pop()]
 
     for coord in plot:
-        perimeter.extend(get_external_adjacencies(coord, grid, plot_type))
+        perimeter.extend(get_external_adjacencies(coord, cells, packed, plot_type))
 
     return perimeter
 
 
-def get_external_adjacencies(coord, grid, plot_type):
+def get_external_adjacencies(coord, cells, packed, plot_type):
     external_adjacencies = []
 
-    for adjacency in coord.orthogonals(grid):
-        if grid[adjacency] != plot_type:
+    for adjacency in packed.orthogonals(coord):
+        if cells[adjacency] != plot_type:
             external_adjacencies.append(coord)
 
     return external_adjacencies
 
 
-def get_plots(grid):
+def get_plots(cells, packed):
     plots = []
     visited = set()
 
-    for y, x in itertools.product(range(grid.shape[0]), range(grid.shape[1])):
-        coord = VectorTuple(y, x)
-
+    for coord, cell in enumerate(cells):
         # skip visited and padding characters
-        if coord in visited or grid[coord] == ".":
+        if coord in visited or cell == PADDING:
             continue
 
-        plots.append(get_plot(grid, visited, coord))
+        plots.append(get_plot(cells, packed, visited, coord))
 
     return plots
 
 
-def get_plot(grid, visited, coord):
+def get_plot(cells, packed, visited, coord):
     plot = set()
-    plot_type = grid[coord]
+    plot_type = cells[coord]
     queue = deque([coord])
 
     while len(queue) > 0:
+        if COUNTERS.enabled:
+            COUNTERS.count("get_plot.expanded")
+            COUNTERS.peak("get_plot.queue_peak", len(queue))
+
         coord = queue.popleft()
 
         if coord in visited:
+            if COUNTERS.enabled:
+                COUNTERS.count("get_plot.revisited")
+
             continue
 
-        if grid[coord] == plot_type:
+        if cells[coord] == plot_type:
             visited.add(coord)
             plot.add(coord)
-            queue.extend(coord.orthogonals(grid))
+            queue.extend(packed.orthogonals(coord))
 
     return plot
 
 
-def parse(lines):
-    parsed = []
-
-    for line in lines:
-        parsed.append(list(line.strip()))
-
-    return np.pad(np.array(parsed), 1, constant_values=".")
+def parse(grid):
+    return np.pad(grid, 1, constant_values=PADDING)
 
 
 def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+    return read_grid(filename)
 
 
 def main(filename, expected=None):
@@ -101,6 +104,7 @@ def main(filename, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 
-from itertools import product, chain
+from itertools import chain
 import numpy as np
 from collections import deque
-from aoc_data_structures import VectorTuple
 from aoc_data_structures.grid_helpers import expand_grid
+from aoc_utils.coords import PackedGrid
+from aoc_utils.grid import read_grid
+
+PADDING = ord(".")
 
 
 def solve(grid):
@@ -13,46 +16,48 @@ def solve(grid):
     type edge cases, expand the grid to avoid internal corridors of size 1
     edge cases.
     """
-    plots = get_plots(grid)
+    packed = PackedGrid(grid.shape)
+    cells = packed.flatten(grid)
+    plots = get_plots(cells, packed)
     plot_lengths = [len(plot) for plot in plots]
-    relabel_plots(grid, plots)
-    grid = expand_grid(grid, 3)
+    relabel_plots(cells, plots)
+    grid = expand_grid(np.reshape(cells, grid.shape), 3)
 
-    plots = get_plots(grid)
-    perimeters = get_perimeters(grid, plots)
+    packed = PackedGrid(grid.shape)
+    cells = packed.flatten(grid)
+    plots = get_plots(cells, packed)
+    perimeters = get_perimeters(cells, packed, plots)
     total = 0
 
     for plot, perimeter, plot_length in zip(plots, perimeters, plot_lengths):
-        plot_type = grid[plot.copy().pop()]
-        total += plot_length * get_edges(grid, plot_type, perimeter)
+        plot_type = cells[plot.copy().pop()]
+        total += plot_length * get_edges(packed, plot_type, perimeter)
 
     return total
 
 
-def get_plots(grid):
+def get_plots(cells, packed):
     """
     BFS from each coordinate to find contiguous coords of the same plot type.
     """
     plots = []
     visited = set()
 
-    for y, x in product(range(grid.shape[0]), range(grid.shape[1])):
-        coord = VectorTuple(y, x)
-
-        if coord in visited or grid[coord] == ".":
+    for coord, cell in enumerate(cells):
+        if coord in visited or cell == PADDING:
             continue
 
-        plots.append(get_plot(grid, visited, coord))
+        plots.append(get_plot(cells, packed, visited, coord))
 
     return plots
 
 
-def get_plot(grid, visited, coord):
+def get_plot(cells, packed, visited, coord):
     """
     BFS to find contiguous coords of the same plot type.
     """
     plot = set()
-    plot_type = grid[coord]
+    plot_type = cells[coord]
     queue = deque([coord])
 
     while len(queue) > 0:
@@ -61,97 +66,92 @@ def get_plot(grid, visited, coord):
         if coord in visited:
             continue
 
-        if grid[coord] == plot_type:
+        if cells[coord] == plot_type:
             visited.add(coord)
             plot.add(coord)
-            queue.extend(coord.orthogonals(grid))
+            queue.extend(packed.orthogonals(coord))
 
     return plot
 
 
-def get_perimeters(grid, plots):
+def get_perimeters(cells, packed, plots):
     perimeters = []
 
     for plot in plots:
-        perimeters.append(get_perimeter(grid, plot))
+        perimeters.append(get_perimeter(cells, packed, plot))
 
     return perimeters
 
 
-def get_perimeter(grid, plot):
+def get_perimeter(cells, packed, plot):
     """
     Gather the external adjacencies of each plot coordinate.
     """
     perimeter = set()
-    plot_type = grid[plot.copy().pop()]
+    plot_type = cells[plot.copy().pop()]
 
     for coord in plot:
-        perimeter |= get_external_adjacencies(coord, grid, plot_type)
+        perimeter |= get_external_adjacencies(coord, cells, packed, plot_type)
 
     return perimeter
 
 
-def get_external_adjacencies(coord, grid, plot_type):
+def get_external_adjacencies(coord, cells, packed, plot_type):
     """
     Get the external adjacencies of a coordinate, including diagonals.
     """
     external_adjacencies = set()
 
-    for adjacency in chain(coord.orthogonals(grid), coord.diagonals(grid)):
-        if grid[adjacency] != plot_type:
+    for adjacency in chain(packed.orthogonals(coord), packed.diagonals(coord)):
+        if cells[adjacency] != plot_type:
             external_adjacencies.add(coord)
 
     return external_adjacencies
 
 
-def get_edges(grid, plot_type, perimeter):
+def get_edges(packed, plot_type, perimeter):
     """
     Count straight sections of perimeter by counting corners of perimeter.
     """
     corners = 0
-    up_left = VectorTuple(-1, 0), VectorTuple(0, -1)
-    up_right = VectorTuple(-1, 0), VectorTuple(0, 1)
-    down_right = VectorTuple(1, 0), VectorTuple(0, 1)
-    down_left = VectorTuple(1, 0), VectorTuple(0, -1)
+    up_left = (-1, 0), (0, -1)
+    up_right = (-1, 0), (0, 1)
+    down_right = (1, 0), (0, 1)
+    down_left = (1, 0), (0, -1)
 
     for coord in perimeter:
-        if is_corner(coord, perimeter, *up_left):
+        if is_corner(coord, packed, perimeter, *up_left):
             corners += 1
-        elif is_corner(coord, perimeter, *up_right):
+        elif is_corner(coord, packed, perimeter, *up_right):
             corners += 1
-        elif is_corner(coord, perimeter, *down_right):
+        elif is_corner(coord, packed, perimeter, *down_right):
             corners += 1
-        elif is_corner(coord, perimeter, *down_left):
+        elif is_corner(coord, packed, perimeter, *down_left):
             corners += 1
 
     return corners
 
 
-def is_corner(coord, perimeter, *deltas):
-    return all(coord + delta in perimeter for delta in deltas)
+def is_corner(coord, packed, perimeter, *deltas):
+    return all(packed.step(coord, delta) in perimeter for delta in deltas)
 
 
-def relabel_plots(grid, plots):
+def relabel_plots(cells, plots):
     """
     Relabel plots so non-contiguous plots of same type are labeled uniquely.
+    Labels are negative so they can't collide with the padding character.
     """
     for idx, plot in enumerate(plots, start=1):
         for coord in plot:
-            grid[coord] = idx
-
-
-def parse(lines):
-    parsed = []
+            cells[coord] = -idx
 
-    for line in lines:
-        parsed.append(list(line.strip()))
 
-    return np.pad(np.array(parsed), 1, constant_values=".").astype(object)
+def parse(grid):
+    return np.pad(grid, 1, constant_values=PADDING).astype(np.int32)
 
 
 def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+    return read_grid(filename)
 
 
 def main(filename, expected=None):
@@ -159,6 +159,7 @@ def main(filename, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 from re import search
-from z3 import *
+import z3
 
 
 def solve(games):
@@ -13,13 +13,13 @@ def solve_game(game):
     target_y += 10000000000000
     target_x += 10000000000000
 
-    presses_a, presses_b = Ints("presses_a presses_b")
+    presses_a, presses_b = z3.Ints("presses_a presses_b")
 
-    solver = Solver()
+    solver = z3.Solver()
     solver.add(dy_a * presses_a + dy_b * presses_b == target_y)
     solver.add(dx_a * presses_a + dx_b * presses_b == target_x)
 
-    if solver.check() == sat:
+    if solver.check() == z3.sat:
         model = solver.model()
         return model[presses_a].as_long() * 3 + model[presses_b].as_long()
 
@@ -57,6 +57,7 @@ def main(filename, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
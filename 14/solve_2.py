@@ -121,6 +121,7 @@ def main(filename, height, width, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
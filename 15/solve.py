@@ -6,6 +6,7 @@ import numpy as np
 from dataclasses import dataclass
 from time import sleep
 from aoc_data_structures import VectorTuple
+from aoc_utils.grid import to_grid
 
 
 @dataclass
@@ -26,7 +27,7 @@ class Wall:
 
 def solve(board, directions):
     coords = get_coords(board)
-    robot = VectorTuple(*np.argwhere(board == "@"))
+    robot = VectorTuple(*np.argwhere(board == ord("@")))
     animate = "ANIMATE" in environ
 
     for direction in directions:
@@ -125,11 +126,11 @@ def get_coords(board):
     """
     coords = {}
 
-    for wall in np.argwhere(board == "#"):
+    for wall in np.argwhere(board == ord("#")):
         wall = VectorTuple(wall)
         coords[wall] = Wall(wall)
 
-    for box in np.argwhere(board == "O"):
+    for box in np.argwhere(board == ord("O")):
         coord = VectorTuple(box)
         box = Box(coord)
         coords[coord] = box
@@ -164,17 +165,10 @@ def board_str(board):
 
 
 def parse(data):
-    board = []
-    directions = []
-
     board_data, directions_data = data.split("\n\n")
-
-    for line in board_data.split("\n"):
-        board.append(list(line.strip()))
-
     directions = list(directions_data.replace("\n", ""))
 
-    return np.array(board), directions
+    return to_grid(board_data), directions
 
 
 def read_file(filename):
@@ -187,6 +181,7 @@ def main(filename, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
@@ -6,6 +6,13 @@ import numpy as np
 from dataclasses import dataclass
 from time import sleep
 from aoc_data_structures import VectorTuple
+from aoc_utils.grid import to_grid
+
+# each character of the original board expands to two characters
+EXPANSIONS = np.zeros((256, 2), dtype=np.uint8)
+
+for char, expansion in (("#", "##"), ("O", "[]"), (".", ".."), ("@", "@.")):
+    EXPANSIONS[ord(char)] = tuple(map(ord, expansion))
 
 
 @dataclass
@@ -27,7 +34,7 @@ class Wall:
 
 def solve(board, directions):
     coords = get_coords(board)
-    robot = VectorTuple(*np.argwhere(board == "@"))
+    robot = VectorTuple(*np.argwhere(board == ord("@")))
     animate = "ANIMATE" in environ
 
     for direction in directions:
@@ -129,11 +136,11 @@ def get_coords(board):
     """
     coords = {}
 
-    for wall in np.argwhere(board == "#"):
+    for wall in np.argwhere(board == ord("#")):
         wall = VectorTuple(wall)
         coords[wall] = Wall(wall)
 
-    for box in np.argwhere(board == "["):
+    for box in np.argwhere(board == ord("[")):
         left = VectorTuple(box)
         right = VectorTuple(box + VectorTuple(0, 1))
         box = Box(left, right)
@@ -171,28 +178,11 @@ def board_str(board):
 
 
 def parse(data):
-    board = []
-    directions = []
-
     board_data, directions_data = data.split("\n\n")
-
-    for line in board_data.split("\n"):
-        expanded_line = []
-        for char in list(line.strip()):
-            if char == "#":
-                expanded_line.extend(["#", "#"])
-            if char == "O":
-                expanded_line.extend(["[", "]"])
-            if char == ".":
-                expanded_line.extend([".", "."])
-            if char == "@":
-                expanded_line.extend(["@", "."])
-
-        board.append(expanded_line)
-
+    board = to_grid(board_data)
     directions = list(directions_data.replace("\n", ""))
 
-    return np.array(board), directions
+    return EXPANSIONS[board].reshape(board.shape[0], -1), directions
 
 
 def read_file(filename):
@@ -205,6 +195,7 @@ def main(filename, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
@@ -1,55 +1,30 @@
 #!/usr/bin/env python3
 
-import re
-import math
-import itertools
-import numpy as np
-import networkx as nx
-from collections import deque
-from aoc_data_structures import VectorTuple
-from aoc_data_structures.grid_helpers import grid_str, parse
+from aoc_utils.graph import UNREACHED, dijkstra_turns
+from aoc_utils.grid import find, grid_str, read_grid
+
+WALL = ord("#")
 
 
 def solve(board):
+    """
+    Dijkstra over (heading, position) states, starting east.  The end may be
+    reached facing any heading.
+    """
     print(grid_str(board))
-    pos = VectorTuple(*np.argwhere(board == "S"))
-    min_cost = bfs(board, pos)
-    return min_cost
-
-
-def bfs(board, position):
-    costs = {
-        VectorTuple(1, 0): np.full_like(board, 2**32, dtype=int),
-        VectorTuple(-1, 0): np.full_like(board, 2**32, dtype=int),
-        VectorTuple(0, 1): np.full_like(board, 2**32, dtype=int),
-        VectorTuple(0, -1): np.full_like(board, 2**32, dtype=int),
-    }
-    costs[VectorTuple(0, 1)][position] = 0
-    queue = deque([(position, VectorTuple(0, 1))])
-
-    while len(queue) > 0:
-        position, delta = queue.popleft()
-
-        for adjacency in position.orthogonals(board):
-            if board[adjacency] == "#":
-                continue
-
-            if adjacency - position == delta:
-                cost = costs[delta][position] + 1
-            else:
-                cost = costs[delta][position] + 1001
+    start = find(board, "S")
+    end = find(board, "E")
+    costs = dijkstra_turns(board != WALL, start, (0, 1), 1, 1000)
+    costs = costs[:, end[0], end[1]]
+    return costs[costs != UNREACHED].min()
 
-            if costs[adjacency - position][adjacency] > cost:
-                costs[adjacency - position][adjacency] = cost
-                queue.append((adjacency, adjacency - position))
 
-    end = VectorTuple(*np.argwhere(board == "E"))
-    return np.array(list(costs.values()))[:, end[0], end[1]].min()
+def parse(grid):
+    return grid
 
 
 def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+    return read_grid(filename)
 
 
 def main(filename, expected=None):
@@ -57,6 +32,7 @@ def main(filename, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
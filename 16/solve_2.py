@@ -4,7 +4,10 @@ import numpy as np
 from collections import deque, defaultdict
 from dataclasses import dataclass
 from aoc_data_structures import VectorTuple
-from aoc_data_structures.grid_helpers import grid_str, parse
+from aoc_utils.counters import COUNTERS
+from aoc_utils.grid import grid_str, read_grid
+
+WALL = ord("#")
 
 
 @dataclass
@@ -16,8 +19,8 @@ class Step:
 
 
 def solve(board):
-    start = VectorTuple(*np.argwhere(board == "S"))
-    end = VectorTuple(*np.argwhere(board == "E"))
+    start = VectorTuple(*np.argwhere(board == ord("S")))
+    end = VectorTuple(*np.argwhere(board == ord("E")))
     steps = get_steps(board, start)
     coord_set = get_coord_set(steps, end)
     print_board(board, coord_set)
@@ -31,16 +34,26 @@ def get_steps(board, src):
     step = 0
 
     while len(queue) > 0:
+        if COUNTERS.enabled:
+            COUNTERS.count("get_steps.expanded")
+            COUNTERS.peak("get_steps.queue_peak", len(queue))
+
         src, delta, step = queue.popleft()
 
         for dst in src.orthogonals(board):
-            if board[dst] == "#":
+            if board[dst] == WALL:
                 continue
 
             next_delta = dst - src
             cost = costs[(src, delta)] + (1 if next_delta == delta else 1000)
 
             if costs[(dst, next_delta)] > cost:
+                if COUNTERS.enabled:
+                    COUNTERS.count("get_steps.relaxed")
+
+                    if costs[(dst, next_delta)] < 2**32:
+                        COUNTERS.count("get_steps.re_relaxed")
+
                 costs[(dst, next_delta)] = cost
                 queue.append((dst, next_delta, step + 1))
                 steps[dst].append(
@@ -82,14 +95,17 @@ def gather_adjacencies(visits, target_step, target_cost):
 def print_board(board, path_coords):
     board = board.copy()
     for coord in path_coords:
-        board[coord] = "O"
-    board[board == "."] = " "
+        board[coord] = ord("O")
+    board[board == ord(".")] = ord(" ")
     print(grid_str(board))
 
 
+def parse(grid):
+    return grid
+
+
 def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+    return read_grid(filename)
 
 
 def main(filename, expected=None):
@@ -97,6 +113,7 @@ def main(filename, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
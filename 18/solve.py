@@ -1,28 +1,17 @@
 #!/usr/bin/env python3
 
-from collections import deque
+import numpy as np
 from aoc_data_structures import VectorTuple
+from aoc_utils.graph import bfs
 
 
 def solve(coords, size, steps):
     """
     BFS to find shortest unweighted path length.
     """
-    target = VectorTuple(size, size)
-    coords = set(coords[:steps])
-    position = VectorTuple(0, 0)
-    queue = deque([(position, 0)])
-    visited = set()
-
-    while len(queue) > 0 and position != target:
-        position, step = queue.popleft()
-
-        for adjacency in position.orthogonals(size + 1):
-            if adjacency not in coords and adjacency not in visited:
-                queue.append((adjacency, step + 1))
-                visited.add(adjacency)
-
-    return step
+    passable = np.ones((size + 1, size + 1), dtype=bool)
+    passable[tuple(np.array(coords[:steps]).T)] = False
+    return bfs(passable, [(0, 0)])[size, size]
 
 
 def parse(lines):
@@ -44,6 +33,7 @@ def main(filename, size, steps, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
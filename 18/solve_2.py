@@ -2,6 +2,7 @@
 
 from collections import deque
 from aoc_data_structures import VectorTuple
+from aoc_utils.counters import COUNTERS
 
 
 def solve(coords, size, steps):
@@ -38,7 +39,14 @@ def has_path(coords, size):
     queue = deque([(position, 0)])
     visited = set()
 
+    if COUNTERS.enabled:
+        COUNTERS.count("has_path.calls")
+
     while len(queue) > 0 and position != target:
+        if COUNTERS.enabled:
+            COUNTERS.count("has_path.expanded")
+            COUNTERS.peak("has_path.queue_peak", len(queue))
+
         position, step = queue.popleft()
 
         for adjacency in position.orthogonals(size + 1):
@@ -68,6 +76,7 @@ def main(filename, size, steps, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
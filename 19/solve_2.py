@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass, field
 from pprint import pprint
+from aoc_utils.counters import COUNTERS
 
 
 @dataclass
@@ -46,8 +47,14 @@ def count_solves(pattern, trie, cache):
     encountered in the pattern.  Map pattern to result in cache.
     """
     if pattern in cache:
+        if COUNTERS.enabled:
+            COUNTERS.count("count_solves.hit")
+
         return cache[pattern]
 
+    if COUNTERS.enabled:
+        COUNTERS.count("count_solves.miss")
+
     if len(pattern) == 0:
         return 1
 
@@ -84,6 +91,7 @@ def main(filename, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
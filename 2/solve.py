@@ -1,39 +1,39 @@
 #!/usr/bin/env python3
 
-import numpy as np
+from aoc_utils.ragged import get_mask, to_ragged
 
 
-def solve(reports):
-    return sum(valid(report) for report in reports)
+def solve(levels, lengths):
+    return int(valid(levels, lengths).sum())
 
 
-def valid(report):
-    report = np.array(report)
-    diff = report[1:] - report[:-1]
-    safe_increasing = ((diff >= 1) & (diff <= 3)).sum() == diff.shape[0]
-    safe_decreasing = ((diff <= -1) & (diff >= -3)).sum() == diff.shape[0]
-    return safe_increasing or safe_decreasing
+def valid(levels, lengths):
+    """
+    Check every report at once.  levels holds one report per row, padded past
+    its length, so differences beyond the end of a report are ignored.
+    """
+    diff = levels[:, 1:] - levels[:, :-1]
+    padding = ~get_mask(lengths - 1, diff.shape[1])
+    safe_increasing = ((diff >= 1) & (diff <= 3) | padding).all(axis=1)
+    safe_decreasing = ((diff <= -1) & (diff >= -3) | padding).all(axis=1)
+    return safe_increasing | safe_decreasing
 
 
-def parse(lines):
-    reports = []
-
-    for line in lines:
-        reports.append(list(map(int, line.strip().split())))
-
-    return reports
+def parse(data):
+    return to_ragged(data)
 
 
 def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+    with open(filename, "rb") as f_in:
+        return f_in.read()
 
 
 def main(filename, expected=None):
-    result = solve(parse(read_file(filename)))
+    result = solve(*parse(read_file(filename)))
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
@@ -1,50 +1,75 @@
 #!/usr/bin/env python3
 
 import numpy as np
+from aoc_utils.ragged import get_mask, to_ragged
 
 
-def solve(reports):
-    return sum(valid(report) for report in reports)
+def solve(levels, lengths):
+    return int(valid(levels, lengths).sum())
 
 
-def valid(report):
-    valid_report = valid_raw(report)
-    idx = 0
+def valid(levels, lengths):
+    """
+    A report is safe with the problem dampener if it's safe in either
+    direction with at most one level removed.
+    """
+    return valid_direction(levels, lengths, 1) | valid_direction(levels, lengths, -1)
 
-    while not valid_report and idx < len(report):
-        valid_report |= valid_raw(report[:idx] + report[idx + 1 :])
-        idx += 1
 
-    return valid_report
+def valid_direction(levels, lengths, sign):
+    """
+    Check every report at once in O(n) per report.  Removing level r leaves a
+    safe report if the levels before r are safe, the levels after r are safe,
+    and level r - 1 to level r + 1 is a safe step.  Prefix and suffix safety
+    come from running ANDs over the adjacent steps, and the bridging step from
+    the differences two levels apart.
 
+    levels holds one report per row, padded past its length.  Steps in the
+    padding count as safe so they don't break the running ANDs.
+    """
+    width = levels.shape[1]
+    columns = np.arange(width)
+    lengths = lengths[:, np.newaxis]
+    steps = is_safe(sign * (levels[:, 1:] - levels[:, :-1]))
+    steps |= ~get_mask(lengths[:, 0] - 1, width - 1)
+    bridges = is_safe(sign * (levels[:, 2:] - levels[:, :-2]))
 
-def valid_raw(report):
-    report = np.array(report)
-    diff = report[1:] - report[:-1]
-    safe_increasing = ((diff >= 1) & (diff <= 3)).sum() == diff.shape[0]
-    safe_decreasing = ((diff <= -1) & (diff >= -3)).sum() == diff.shape[0]
-    return safe_increasing or safe_decreasing
+    # prefix[:, r]: levels 0..r-1 are safe, suffix[:, r]: levels r+1.. are safe
+    prefix = np.ones(levels.shape, dtype=bool)
+    prefix[:, 2:] = np.logical_and.accumulate(steps, axis=1)[:, : width - 2]
+    safe_after = np.logical_and.accumulate(steps[:, ::-1], axis=1)[:, ::-1]
+    suffix = np.ones(levels.shape, dtype=bool)
+    suffix[:, : width - 2] = safe_after[:, 1:]
 
+    # removing the first or last level needs no bridging step
+    bridge = np.ones(levels.shape, dtype=bool)
+    bridge[:, 1 : width - 1] = bridges
+    bridge |= columns == lengths - 1
 
-def parse(lines):
-    reports = []
+    # an empty report has nothing to remove but is trivially safe
+    removable = prefix & suffix & bridge & (columns < lengths)
+    return removable.any(axis=1) | (lengths[:, 0] == 0)
 
-    for line in lines:
-        reports.append(list(map(int, line.strip().split())))
 
-    return reports
+def is_safe(diff):
+    return (diff >= 1) & (diff <= 3)
+
+
+def parse(data):
+    return to_ragged(data)
 
 
 def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+    with open(filename, "rb") as f_in:
+        return f_in.read()
 
 
 def main(filename, expected=None):
-    result = solve(parse(read_file(filename)))
+    result = solve(*parse(read_file(filename)))
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
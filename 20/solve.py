@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 
 from itertools import product
-from collections import deque, defaultdict
+from collections import defaultdict
 import numpy as np
 from aoc_data_structures import VectorTuple
-from aoc_data_structures.grid_helpers import grid_str, parse
+from aoc_utils.graph import UNREACHED, bfs
+from aoc_utils.grid import find, read_grid
+
+WALL = ord("#")
 
 
 def solve(grid, max_cheat_distance, threshold):
@@ -28,9 +31,11 @@ def get_cheats(distances, grid, max_cheat_distance, threshold):
     """
     cheats = defaultdict(lambda: set())
 
-    for position, distance in distances.items():
+    for position in np.argwhere(distances != UNREACHED):
+        position = VectorTuple(*map(int, position))
+
         for adjacency in position.radius(grid, max_cheat_distance):
-            if grid[adjacency] == "#":
+            if grid[adjacency] == WALL:
                 continue
 
             cheat_distance = distances[adjacency] - distances[position]
@@ -44,29 +49,17 @@ def get_cheats(distances, grid, max_cheat_distance, threshold):
 
 def get_distances(grid):
     """
-    Get a dictionary mapping tuple locations to distance from the start.
+    Get an array of distances from the start, UNREACHED for walls.
     """
-    distances = {}
-    start = VectorTuple(*np.argwhere(grid == "S"))
-    queue = deque([(start, 0)])
-
-    while len(queue) > 0:
-        position, distance = queue.popleft()
-
-        if position in distances or grid[position] == "#":
-            continue
-
-        distances[position] = distance
+    return bfs(grid != WALL, [find(grid, "S")])
 
-        for adjacency in position.orthogonals(grid):
-            queue.append((adjacency, distance + 1))
 
-    return distances
+def parse(grid):
+    return grid
 
 
 def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+    return read_grid(filename)
 
 
 def main(filename, max_cheat_distance, threshold, expected=None):
@@ -87,6 +80,7 @@ def main(filename, max_cheat_distance, threshold, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
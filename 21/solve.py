@@ -3,6 +3,7 @@
 import re
 import numpy as np
 from collections import deque, defaultdict
+from functools import cache
 from itertools import pairwise
 from itertools import product
 from aoc_data_structures import VectorTuple
@@ -183,6 +184,25 @@ class DirectionalKeypad(Keypad):
             }
 
 
+@cache
+def get_numeric_keypad():
+    return NumericKeypad()
+
+
+@cache
+def get_directional_caches():
+    return tuple(DirectionalKeypad().enumerate_cache_versions())
+
+
+def precompute():
+    """
+    Build the keypad path caches, which don't depend on the input.  Batch
+    workers call this once so every input they solve reuses them.
+    """
+    get_numeric_keypad()
+    get_directional_caches()
+
+
 def solve(codes, depth):
     return sum(get_complexity(code, depth) for code in codes)
 
@@ -192,12 +212,12 @@ def get_complexity(code, depth):
     Get the directional pad path length for each combination of directional
     cache and path.  Use the minimum length to find the code complexity.
     """
-    paths = NumericKeypad().get_numeric_paths(code)
+    paths = get_numeric_keypad().get_numeric_paths(code)
     lengths = []
 
-    for cache in DirectionalKeypad().enumerate_cache_versions():
+    for version in get_directional_caches():
         for path in paths:
-            lengths.append(get_directional_length(path, cache, depth))
+            lengths.append(get_directional_length(path, version, depth))
 
     code_value = int("".join(code[:-1]))
     return min(lengths) * code_value
@@ -256,6 +276,7 @@ def main(filename, depth, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
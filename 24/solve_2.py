@@ -5,7 +5,7 @@ from itertools import product, combinations
 import numpy as np
 import networkx as nx
 from random import randrange
-from tqdm import tqdm
+import tqdm
 
 
 class Circuit:
@@ -157,7 +157,7 @@ def get_swap_candidates(circuit):
     invalid_bits = get_invalid_bits(circuit)
     swap_candidates = {bit: set() for bit in invalid_bits}
 
-    for dst_0, dst_1 in tqdm(
+    for dst_0, dst_1 in tqdm.tqdm(
         list(combinations(circuit.operations.keys(), 2)),
         desc="generating swap candidates",
     ):
@@ -184,7 +184,7 @@ def get_correct_combination(circuit, swap_candidates):
     than once.  This violates the problem description and the combination is
     skipped to prevent corrupting the circuit.
     """
-    for swap_combination in tqdm(
+    for swap_combination in tqdm.tqdm(
         list(product(*swap_candidates.values())),
         desc="finding swap combination",
     ):
@@ -271,6 +271,7 @@ def main(filename, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
-import numpy as np
 from itertools import product
+from aoc_utils.grid import to_grid
 
 
 def solve(locks, keys):
@@ -45,10 +45,7 @@ def parse_arrays(data):
     arrays = []
 
     for block in data.split("\n\n"):
-        block = block.strip()
-        lines = block.split("\n")
-        array = np.array(list(map(list, lines)))
-        arrays.append((array == "#").astype(int))
+        arrays.append((to_grid(block.strip()) == ord("#")).astype(int))
 
     return arrays
 
@@ -63,6 +60,7 @@ def main(filename, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
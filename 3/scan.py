@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+
+"""
+Solve both parts of day 3 for inputs too large to scan on one core.
+
+The input is memory mapped and split into chunks which are scanned across a
+process pool.  Each chunk is scanned a little past its end so instructions
+crossing the boundary are seen, but only those starting inside the chunk are
+counted.  A chunk can't know whether mul instructions are enabled at its
+start, so it reports its sum for both starting states and the state it leaves
+behind, and the chunks are combined in order.
+
+Streams (stdin given as -, pipes and FIFOs) are scanned as they're read.  The
+bytes after the last position an instruction could start are carried into the
+next read, so memory is bounded by the block size however long the stream is.
+
+usage:
+    ./scan.py input.txt
+    ./scan.py dump.bin --workers 16 --chunk-size 64000000
+    dump_memory | ./scan.py - --block-size 1000000
+"""
+
+import mmap
+import os
+import stat
+import sys
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+CHUNK_SIZE = 2**24
+BLOCK_SIZE = 2**20
+
+# longest instruction, mul(999,999)
+MAX_LENGTH = 12
+
+
+def load_pattern():
+    """
+    Load PATTERN from the neighbouring solve2.py by path, so this module
+    imports without its directory on sys.path or a top level solve2 module.
+    """
+    spec = spec_from_file_location("solve2", Path(__file__).with_name("solve2.py"))
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.PATTERN
+
+
+PATTERN = load_pattern()
+
+
+@dataclass
+class Partial:
+    """
+    Scan results of a chunk.  enabled_sums holds the sum of enabled mul
+    instructions if the chunk starts disabled and enabled, and state the
+    enabled state at its end, or None if it contains no do() or don't().
+    """
+
+    total: int = 0
+    enabled_sums: tuple = (0, 0)
+    state: bool = None
+
+
+def scan_chunk(data, start=0, end=None):
+    """
+    Scan the instructions starting in data[start:end].  Mul instructions before
+    the first do() or don't() depend on the starting state, and are summed
+    separately from the enabled ones after it.
+    """
+    end = len(data) if end is None else end
+    total = 0
+    head = 0
+    tail = 0
+    state = None
+
+    for match in PATTERN.finditer(data, start, min(end + MAX_LENGTH - 1, len(data))):
+        if match.start() >= end:
+            break
+
+        x, y, negated = match.groups()
+
+        if x is None:
+            state = negated is None
+            continue
+
+        product = int(x) * int(y)
+        total += product
+
+        if state is None:
+            head += product
+
+        elif state:
+            tail += product
+
+    return Partial(total, (tail, head + tail), state)
+
+
+def scan_file(bounds, filename):
+    with open(filename, "rb") as f_in, mmap.mmap(
+        f_in.fileno(), 0, access=mmap.ACCESS_READ
+    ) as data:
+        return scan_chunk(data, *bounds)
+
+
+def scan_stream(stream, block_size=BLOCK_SIZE):
+    """
+    Scan a binary stream a block at a time.  Instructions starting more than
+    MAX_LENGTH - 1 bytes before the end of the buffer are complete, so they're
+    scanned and the rest of the buffer is kept for the next block.
+    """
+    buffer = b""
+
+    while block := stream.read(block_size):
+        buffer += block
+        end = len(buffer) - (MAX_LENGTH - 1)
+
+        if end > 0:
+            yield scan_chunk(buffer, 0, end)
+            buffer = buffer[end:]
+
+    yield scan_chunk(buffer)
+
+
+def combine(partials, enabled=True):
+    """
+    Combine chunk results in order.  Return the sum of every mul instruction,
+    the sum of the enabled ones and the enabled state at the end.
+    """
+    total = 0
+    enabled_total = 0
+
+    for chunk in partials:
+        total += chunk.total
+        enabled_total += chunk.enabled_sums[enabled]
+
+        if chunk.state is not None:
+            enabled = chunk.state
+
+    return total, enabled_total, enabled
+
+
+def solve(filename, chunk_size=CHUNK_SIZE, workers=None):
+    size = os.path.getsize(filename)
+
+    if size == 0:
+        return 0, 0
+
+    bounds = [(start, start + chunk_size) for start in range(0, size, chunk_size)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        total, enabled_total, _ = combine(
+            executor.map(partial(scan_file, filename=filename), bounds)
+        )
+
+    return total, enabled_total
+
+
+def solve_stream(stream, block_size=BLOCK_SIZE):
+    total, enabled_total, _ = combine(scan_stream(stream, block_size))
+    return total, enabled_total
+
+
+def is_stream(filename):
+    return filename == "-" or not stat.S_ISREG(os.stat(filename).st_mode)
+
+
+def main(
+    filename,
+    chunk_size=CHUNK_SIZE,
+    workers=None,
+    block_size=BLOCK_SIZE,
+    expected=None,
+):
+    if filename == "-":
+        result = solve_stream(sys.stdin.buffer, block_size)
+
+    elif is_stream(filename):
+        with open(filename, "rb") as f_in:
+            result = solve_stream(f_in, block_size)
+
+    else:
+        result = solve(filename, chunk_size, workers)
+
+    print(*result)
+    if expected is not None:
+        assert result == expected
+    return result
+
+
+def get_parser():
+    parser = ArgumentParser(description="Solve day 3 across a process pool.")
+    parser.add_argument("filename", help="input file, pipe or - for stdin")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--block-size", type=int, default=BLOCK_SIZE, help="stream read size"
+    )
+    return parser
+
+
+if __name__ == "__main__":
+    args = get_parser().parse_args()
+    main(args.filename, args.chunk_size, args.workers, args.block_size)
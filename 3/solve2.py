@@ -1,48 +1,41 @@
 #!/usr/bin/env python3
 
 import re
-from math import prod
-import numpy as np
 
+# a mul with its operands, or a do()/don't() with group 3 set for don't()
+PATTERN = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|do(n't)?\(\)")
 
-def solve(data):
-    pairs = []
-    enabled = True
 
-    for pair in data:
+def solve(data):
+    return scan(data)[0]
 
-        match pair:
 
-            case "do()":
-                enabled = True
+def scan(data, enabled=True):
+    """
+    Sum the enabled mul instructions in a single pass, toggling on do() and
+    don't() as they're matched.  Return the sum and whether mul instructions
+    are enabled at the end of data, so a scan can be resumed.
+    """
+    total = 0
 
-            case "don't()":
-                enabled = False
+    for match in PATTERN.finditer(data):
+        x, y, negated = match.groups()
 
-            case _:
+        if x is None:
+            enabled = negated is None
 
-                if enabled:
-                    pairs.append(pair)
+        elif enabled:
+            total += int(x) * int(y)
 
-    return sum(prod(pair) for pair in pairs)
+    return total, enabled
 
 
 def parse(data):
-    parsed = []
-
-    for match in re.findall("mul\(\d{1,3},\d{1,3}\)|do\(\)|don't\(\)", data):
-
-        if match.startswith("mul"):
-            match = re.fullmatch("mul\((\d{1,3}),(\d{1,3})\)", match)
-            match = tuple(map(int, match.groups()))
-
-        parsed.append(match)
-
-    return parsed
+    return data
 
 
 def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
+    with open(filename, "rb") as f_in:
         return f_in.read()
 
 
@@ -51,6 +44,7 @@ def main(filename, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
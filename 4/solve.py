@@ -1,47 +1,47 @@
 #!/usr/bin/env python3
 
-import re
-import math
 import numpy as np
-import networkx as nx
+from aoc_utils.coords import DIAGONALS, ORTHOGONALS
+from aoc_utils.grid import read_grid
 
+WORD = b"XMAS"
 
-def solve(board):
-    count = 0
-
-    for permutation in permuter(board):
-        count += len(re.findall("XMAS", permutation))
-        count += len(re.findall("SAMX", permutation))
-
-    return count
 
+def solve(board):
+    return sum(
+        int(get_starts(board, WORD, delta).sum()) for delta in ORTHOGONALS + DIAGONALS
+    )
 
-def permuter(board):
-    for row in board:
-        yield "".join(element for element in row)
-
-    for idx in range(board.shape[1]):
-        yield "".join(element for element in board[:, idx])
 
-    for idx in range(-board.shape[1], board.shape[1]):
-        yield "".join(element for element in np.diagonal(board, idx))
+def get_starts(board, word, delta):
+    """
+    Find where word starts when read from the board in the (dy, dx) direction.
+    Each letter is compared against the board shifted by its offset along the
+    direction, over the cells where the whole word fits.  Return a boolean
+    array of those cells, offset so that [0, 0] is the first such cell.
+    """
+    height, width = board.shape
+    span_y, span_x = (step * (len(word) - 1) for step in delta)
+    rows, columns = height - abs(span_y), width - abs(span_x)
+    y_0, x_0 = max(0, -span_y), max(0, -span_x)
+    starts = np.ones((max(rows, 0), max(columns, 0)), dtype=bool)
 
-    for idx in range(-board.shape[1], board.shape[1]):
-        yield "".join(element for element in np.diagonal(np.rot90(board), idx))
+    if starts.size == 0:
+        return starts
 
+    for idx, character in enumerate(word):
+        y, x = y_0 + idx * delta[0], x_0 + idx * delta[1]
+        starts &= board[y : y + rows, x : x + columns] == character
 
-def parse(lines):
-    parsed = []
+    return starts
 
-    for line in lines:
-        parsed.append(list(line.strip()))
 
-    return np.array(parsed)
+def parse(grid):
+    return grid
 
 
 def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+    return read_grid(filename)
 
 
 def main(filename, expected=None):
@@ -49,6 +49,7 @@ def main(filename, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
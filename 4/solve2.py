@@ -1,64 +1,42 @@
 #!/usr/bin/env python3
 
-import re
-import math
-import numpy as np
-import networkx as nx
+from aoc_utils.grid import read_grid
 
 
 def solve(board):
     """
-    Map M, A, S to 1, 10, 100.  Perform a 2-d convolution with every rotation
-    of the mask.  Increment if the sum of pointwise multiplication matches the
-    expected value.
+    Compare the centre and corners of every 3x3 window at once, using slices
+    of the board offset by the corner positions.  A window holds an X-MAS if
+    its centre is A and both diagonals read MAS in either direction, which is
+    the same as matching one of the four rotations of the mask:
+        M . S
+        . A .
+        M . S
     """
-    count = 0
-    board_ = np.zeros_like(board, dtype=int)
+    if min(board.shape) < 3:
+        return 0
 
-    board_[board == "M"] = 1
-    board_[board == "A"] = 10
-    board_[board == "S"] = 100
-    board = board_
+    centre = board[1:-1, 1:-1] == ord("A")
+    diagonal = is_mas(board[:-2, :-2], board[2:, 2:])
+    anti_diagonal = is_mas(board[:-2, 2:], board[2:, :-2])
+    return int((centre & diagonal & anti_diagonal).sum())
 
-    for y in range(board.shape[0] - 2):
 
-        for x in range(board.shape[1] - 2):
-
-            for mask in mask_permuter():
-
-                res = board[y : y + 3, x : x + 3] * mask
-                if res.sum() == (mask**2).sum():
-                    count += 1
-
-    return count
-
-
-def mask_permuter():
-    mask = np.array(
-        [
-            [1, 0, 100],
-            [0, 10, 0],
-            [1, 0, 100],
-        ]
+def is_mas(end_0, end_1):
+    """
+    Check whether the ends of a diagonal are M and S, in either order.
+    """
+    return ((end_0 == ord("M")) & (end_1 == ord("S"))) | (
+        (end_0 == ord("S")) & (end_1 == ord("M"))
     )
 
-    for _ in range(4):
-        mask = np.rot90(mask)
-        yield mask
-
-
-def parse(lines):
-    parsed = []
-
-    for line in lines:
-        parsed.append(list(line.strip()))
 
-    return np.array(parsed)
+def parse(grid):
+    return grid
 
 
 def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+    return read_grid(filename)
 
 
 def main(filename, expected=None):
@@ -66,6 +44,7 @@ def main(filename, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
@@ -1,24 +1,46 @@
 #!/usr/bin/env python3
 
+from collections import defaultdict
+
 
 def solve(rules, pages):
+    successors = get_successors(rules)
     total = 0
 
     for page in pages:
-        if all(rule_satisfied(rule, page) for rule in rules):
+        if is_ordered(successors, page):
             total += page[len(page) // 2]
 
     return total
 
 
-def rule_satisfied(rule, page):
-    value_0, value_1 = rule
-    try:
-        idx_0 = page.index(value_0)
-        idx_1 = page.index(value_1)
-        return idx_0 < idx_1
-    except ValueError:
-        return True
+def get_successors(rules):
+    """
+    Index the rules by their first page, mapping each page to the set of pages
+    which must come after it.
+    """
+    successors = defaultdict(set)
+
+    for value_0, value_1 in rules:
+        successors[value_0].add(value_1)
+
+    return successors
+
+
+def is_ordered(successors, page):
+    """
+    Check an update against every rule at once.  It's out of order if any
+    value must come after a value seen before it.
+    """
+    seen = set()
+
+    for value in page:
+        if not successors[value].isdisjoint(seen):
+            return False
+
+        seen.add(value)
+
+    return True
 
 
 def parse(data):
@@ -46,6 +68,7 @@ def main(filename, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
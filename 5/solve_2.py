@@ -1,58 +1,107 @@
 #!/usr/bin/env python3
 
+from collections import defaultdict
+from heapq import heapify, heappop, heappush
 
-def solve(rules, pages):
-    invalid = get_invalid(rules, pages)
-    pages = sort_pages(rules, invalid)
-    return sum(page[len(page) // 2] for page in pages)
 
+def solve(rules, pages, median_only=True):
+    """
+    Sum the middle pages of the out of order updates once ordered.  With
+    median_only, the middle page is selected without sorting the update.
+    """
+    successors = get_successors(rules)
+    total = 0
 
-def sort_pages(rules, pages):
     for page in pages:
-        changed = True
+        if is_ordered(successors, page):
+            continue
 
-        while changed:
-            changed = sort_page(rules, page)
+        if median_only:
+            total += get_middle(successors, page)
+        else:
+            total += sort_page(successors, page)[len(page) // 2]
 
-    return pages
+    return total
 
 
-def sort_page(rules, page):
-    changed = False
+def sort_page(successors, page):
+    """
+    Kahn's topological sort of the update, over the rules between its pages.
+    Ties are broken by position in the update, so pages without rules between
+    them keep their order.
+    """
+    positions = {value: idx for idx, value in enumerate(page)}
+    in_degrees = [0] * len(page)
 
-    for rule in rules:
-        if not rule_satisfied(rule, page):
-            swap(rule, page)
-            changed = True
+    for value in page:
+        for successor in successors[value] & positions.keys():
+            in_degrees[positions[successor]] += 1
 
-    return changed
+    heap = [idx for idx, in_degree in enumerate(in_degrees) if in_degree == 0]
+    heapify(heap)
+    ordered = []
 
+    while heap:
+        value = page[heappop(heap)]
+        ordered.append(value)
 
-def swap(rule, page):
-    value_0, value_1 = rule
-    idx_0 = page.index(value_0)
-    idx_1 = page.index(value_1)
-    page[idx_0], page[idx_1] = value_1, value_0
+        for successor in successors[value] & positions.keys():
+            idx = positions[successor]
+            in_degrees[idx] -= 1
 
+            if in_degrees[idx] == 0:
+                heappush(heap, idx)
 
-def get_invalid(rules, pages):
-    invalid = []
+    if len(ordered) < len(page):
+        raise ValueError(f"rules contain a cycle among {page}")
 
-    for page in pages:
-        if not all(rule_satisfied(rule, page) for rule in rules):
-            invalid.append(page)
+    return ordered
+
+
+def get_middle(successors, page):
+    """
+    Select the middle page without sorting.  When the rules order every pair
+    of pages in the update, the number of pages which must come after each
+    page is a permutation of 0..n-1 and the middle page has n // 2 of them.
+    Otherwise fall back to sorting.
+    """
+    values = set(page)
+    after = {value: len(successors[value] & values) for value in page}
+
+    if sorted(after.values()) != list(range(len(page))):
+        return sort_page(successors, page)[len(page) // 2]
+
+    middle = len(page) - 1 - len(page) // 2
+    return next(value for value, count in after.items() if count == middle)
+
+
+def get_successors(rules):
+    """
+    Index the rules by their first page, mapping each page to the set of pages
+    which must come after it.
+    """
+    successors = defaultdict(set)
+
+    for value_0, value_1 in rules:
+        successors[value_0].add(value_1)
+
+    return successors
+
+
+def is_ordered(successors, page):
+    """
+    Check an update against every rule at once.  It's out of order if any
+    value must come after a value seen before it.
+    """
+    seen = set()
 
-    return invalid
+    for value in page:
+        if not successors[value].isdisjoint(seen):
+            return False
 
+        seen.add(value)
 
-def rule_satisfied(rule, page):
-    value_0, value_1 = rule
-    try:
-        idx_0 = page.index(value_0)
-        idx_1 = page.index(value_1)
-        return idx_0 < idx_1
-    except ValueError:
-        return True
+    return True
 
 
 def parse(data):
@@ -80,6 +129,7 @@ def main(filename, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
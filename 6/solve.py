@@ -3,12 +3,14 @@
 from collections import deque
 import numpy as np
 from aoc_data_structures import VectorTuple
-from aoc_data_structures.grid_helpers import parse
+from aoc_utils.grid import read_grid
+
+OBSTRUCTION = ord("#")
 
 
 def solve(grid):
-    coord = VectorTuple(*np.argwhere(grid == "^")[0])
-    grid[coord] = "."
+    coord = VectorTuple(*np.argwhere(grid == ord("^"))[0])
+    grid[coord] = ord(".")
     positions = {coord}
 
     for delta in delta_generator():
@@ -22,7 +24,7 @@ def solve(grid):
 
 
 def obstructed(coord, grid):
-    return grid[coord] == "#"
+    return grid[coord] == OBSTRUCTION
 
 
 def delta_generator():
@@ -41,9 +43,12 @@ def delta_generator():
         yield delta
 
 
+def parse(grid):
+    return grid
+
+
 def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+    return read_grid(filename)
 
 
 def main(filename, expected=None):
@@ -51,6 +56,7 @@ def main(filename, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
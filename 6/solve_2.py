@@ -1,43 +1,45 @@
 #!/usr/bin/env python3
 
 from collections import deque
-import numpy as np
-from aoc_data_structures import VectorTuple
-from aoc_data_structures.grid_helpers import parse
+from aoc_utils.coords import PackedGrid
+from aoc_utils.grid import read_grid
+
+OBSTRUCTION = ord("#")
+GUARD = ord("^")
 
 
 def solve(grid):
-    y_guard, x_guard = np.argwhere(grid == "^")[0]
+    packed = PackedGrid(grid.shape)
+    cells = packed.flatten(grid)
     total = 0
 
-    for y in range(grid.shape[0]):
-        for x in range(grid.shape[1]):
-            if grid[y, x] in ("#", "^"):
-                continue
+    for coord, cell in enumerate(cells):
+        if cell in (OBSTRUCTION, GUARD):
+            continue
 
-            grid_ = grid.copy()
-            grid_[y, x] = "#"
+        cells_ = cells.copy()
+        cells_[coord] = OBSTRUCTION
 
-            if is_loop(grid_):
-                total += 1
+        if is_loop(cells_, packed):
+            total += 1
 
     return total
 
 
-def is_loop(grid):
-    coord = VectorTuple(map(int, np.argwhere(grid == "^")[0]))
-    grid[coord] = "."
+def is_loop(cells, packed):
+    coord = cells.index(GUARD)
+    cells[coord] = ord(".")
     positions = set((coord,))
 
     for direction in directions_generator():
         while True:
             delta = get_delta(direction)
-            coord_ = coord + delta
+            coord_ = packed.step(coord, delta)
 
-            if not coord_.valid(grid):
+            if coord_ < 0:
                 return False
 
-            if obstruction_present(coord_, grid):
+            if obstruction_present(coord_, cells):
                 break
 
             sequence = (coord, coord_)
@@ -49,21 +51,21 @@ def is_loop(grid):
             coord = coord_
 
 
-def obstruction_present(coord, grid):
-    return grid[coord] == "#"
+def obstruction_present(coord, cells):
+    return cells[coord] == OBSTRUCTION
 
 
 def get_delta(direction):
     match direction:
 
         case "u":
-            return VectorTuple(-1, 0)
+            return (-1, 0)
         case "r":
-            return VectorTuple(0, 1)
+            return (0, 1)
         case "d":
-            return VectorTuple(1, 0)
+            return (1, 0)
         case "l":
-            return VectorTuple(0, -1)
+            return (0, -1)
 
 
 def directions_generator():
@@ -76,9 +78,12 @@ def directions_generator():
         yield direction
 
 
+def parse(grid):
+    return grid
+
+
 def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+    return read_grid(filename)
 
 
 def main(filename, expected=None):
@@ -86,6 +91,7 @@ def main(filename, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
@@ -2,11 +2,12 @@
 
 import numpy as np
 from itertools import combinations
+from aoc_utils.grid import read_grid
 
 
 def solve(board):
     antennas = set(np.unique(board))
-    antennas.remove(".")
+    antennas.remove(ord("."))
     antinodes = set()
 
     for antenna in antennas:
@@ -35,18 +36,12 @@ def within_bounds(coord, board):
     return coord[0] in range(board.shape[0]) and coord[1] in range(board.shape[1])
 
 
-def parse(lines):
-    parsed = []
-
-    for line in lines:
-        parsed.append(list(line.strip()))
-
-    return np.array(parsed)
+def parse(grid):
+    return grid
 
 
 def read_file(filename):
-    with open(filename, encoding="utf-8") as f_in:
-        return f_in.readlines()
+    return read_grid(filename)
 
 
 def main(filename, expected=None):
@@ -54,6 +49,7 @@ def main(filename, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":
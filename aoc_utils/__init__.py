@@ -0,0 +1,7 @@
+"""
+Tooling shared across the daily solvers.
+"""
+
+from .solvers import Case, Solver, discover
+
+__all__ = ["Case", "Solver", "discover"]
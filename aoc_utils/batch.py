@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+
+"""
+Run one day's solvers over many inputs and stream the results as JSON lines.
+
+Inputs are given as directories (every .txt file inside) or glob patterns and
+are mapped across a process pool in chunks, so scheduling overhead is paid
+once per chunk rather than once per file.  Each worker loads the solver once
+and, if the solver defines a precompute() function, calls it once, so work
+which doesn't depend on the input (ex. day 21's keypad paths) is amortized
+across every input the worker handles.
+
+Extra main() arguments default to those of the solver's puzzle input case and
+can be overridden with --kwargs.  Each output line looks like:
+    {"day": 21, "part": 1, "file": "in/0.txt", "result": 1234, "elapsed": 0.01}
+with "error" in place of "result" if the solver raised or timed out.
+
+usage:
+    python -m aoc_utils.batch 19 inputs/19/
+    python -m aoc_utils.batch 21 'inputs/21/*.txt' --kwargs depth=25 --output 21.jsonl
+"""
+
+import ast
+import json
+import os
+import sys
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, redirect_stderr, redirect_stdout
+from dataclasses import replace
+from functools import partial
+from glob import glob
+from io import StringIO
+from pathlib import Path
+from time import perf_counter
+
+from .runner import time_limit
+from .solvers import discover
+
+
+def get_inputs(patterns):
+    """
+    Expand directories and glob patterns into a sorted list of files.
+    """
+    inputs = set()
+
+    for pattern in patterns:
+        if Path(pattern).is_dir():
+            inputs.update(Path(pattern).glob("*.txt"))
+        else:
+            inputs.update(Path(path) for path in glob(pattern))
+
+    return sorted(path for path in inputs if path.is_file())
+
+
+def get_case(solver, overrides):
+    """
+    Get the solver's puzzle input case with its kwargs updated by overrides.
+    """
+    cases = [case for case in solver.cases if not case.is_test] or solver.cases
+    kwargs = dict(cases[0].kwargs) | overrides
+    return replace(cases[0], kwargs=tuple(kwargs.items()), expected=None)
+
+
+def parse_kwargs(pairs):
+    """
+    Parse name=value pairs, with values as python literals.
+    """
+    kwargs = {}
+
+    for pair in pairs:
+        name, _, value = pair.partition("=")
+        kwargs[name] = ast.literal_eval(value)
+
+    return kwargs
+
+
+def init_worker(solvers):
+    """
+    Load each solver once per worker and run its precompute() hook if it has
+    one.
+    """
+    for solver in solvers:
+        module = solver.module()
+
+        if hasattr(module, "precompute"):
+            module.precompute()
+
+
+def solve_input(task, timeout=None):
+    solver, case, filename = task
+    record = {"day": solver.day, "part": solver.part, "file": str(filename)}
+    start = perf_counter()
+
+    try:
+        with time_limit(timeout), redirect_stdout(StringIO()), redirect_stderr(
+            StringIO()
+        ):
+            record["result"] = solver.run(case, filename)
+
+    except TimeoutError:
+        record["error"] = "timeout"
+
+    except Exception as error:  # pylint: disable=broad-except
+        record["error"] = repr(error)
+
+    record["elapsed"] = perf_counter() - start
+    return record
+
+
+def batch(solvers, inputs, overrides=None, workers=None, chunksize=8, timeout=None):
+    """
+    Yield a result record for every (solver, input) pair, in input order.
+    """
+    tasks = [
+        (solver, get_case(solver, overrides or {}), filename)
+        for filename in inputs
+        for solver in solvers
+    ]
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker, initargs=(solvers,)
+    ) as executor:
+        yield from executor.map(
+            partial(solve_input, timeout=timeout), tasks, chunksize=chunksize
+        )
+
+
+def get_parser():
+    parser = ArgumentParser(description="Run a day's solvers over many inputs.")
+    parser.add_argument("day", type=int)
+    parser.add_argument("inputs", nargs="+", help="input directories or globs")
+    parser.add_argument(
+        "--parts", type=int, nargs="+", choices=(1, 2), help="parts to run"
+    )
+    parser.add_argument(
+        "--kwargs", nargs="+", default=[], help="main() arguments as name=value"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count(), help="worker processes"
+    )
+    parser.add_argument("--chunksize", type=int, default=8, help="inputs per task")
+    parser.add_argument(
+        "--timeout", type=float, default=600, help="per-input time limit in seconds"
+    )
+    parser.add_argument("--output", type=Path, help="write JSON lines here")
+    return parser
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    solvers = [
+        solver
+        for solver in discover([args.day])
+        if args.parts is None or solver.part in args.parts
+    ]
+    inputs = get_inputs(args.inputs)
+
+    if not solvers or not inputs:
+        print("no solvers or inputs found", file=sys.stderr)
+        return 1
+
+    start = perf_counter()
+    errors = 0
+
+    with ExitStack() as stack:
+        if args.output is None:
+            f_out = sys.stdout
+        else:
+            f_out = stack.enter_context(open(args.output, "w", encoding="utf-8"))
+
+        for record in batch(
+            solvers,
+            inputs,
+            parse_kwargs(args.kwargs),
+            args.workers,
+            args.chunksize,
+            args.timeout,
+        ):
+            errors += "error" in record
+            f_out.write(json.dumps(record, default=str) + "\n")
+            f_out.flush()
+
+    elapsed = perf_counter() - start
+    print(
+        f"{len(inputs)} inputs x {len(solvers)} solvers in {elapsed:.3f}s, "
+        f"{errors} error(s)",
+        file=sys.stderr,
+    )
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
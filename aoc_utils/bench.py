@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark the read_file, parse and solve stages of every solver.
+
+main() is left to wire the stages together, since days differ in how they call
+solve (extra arguments, unpacked parse results, ...).  The stage functions are
+temporarily replaced with timing wrappers on the loaded module, which works
+because main() looks them up as module globals at call time.  Each case is run
+warmup times untimed and then repeat times timed.
+
+Results are appended to a JSON history keyed by git commit, and the best time
+of each stage is compared with the previous commit in the history.  A stage
+slower by more than the threshold is reported as a regression.
+
+With --parse-cache the warmup run fills the parse cache, so the parse stage
+measures a cache hit rather than the parser itself.
+
+usage:
+    python -m aoc_utils.bench
+    python -m aoc_utils.bench --days 12 --repeat 5 --threshold 0.2
+    python -m aoc_utils.bench --parse-cache
+"""
+
+import json
+import subprocess
+import sys
+from argparse import ArgumentParser
+from collections import defaultdict
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from datetime import datetime, timezone
+from functools import wraps
+from io import StringIO
+from pathlib import Path
+from platform import python_version
+from statistics import median
+from time import perf_counter
+
+from .parse_cache import ParseCache
+from .runner import cache_parse, time_limit
+from .solvers import ROOT, discover
+
+STAGES = ("read_file", "parse", "solve")
+HISTORY = ROOT / "bench_history.json"
+OUTPUT = ROOT / "bench_output.txt"
+
+# ignore differences smaller than this many seconds when checking regressions
+NOISE_FLOOR = 1e-3
+
+
+class StageTimer:
+    """
+    Accumulate time spent in each stage of a solver module.
+    """
+
+    def __init__(self):
+        self.times = defaultdict(float)
+
+    def timed(self, stage, function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+
+            try:
+                return function(*args, **kwargs)
+
+            finally:
+                self.times[stage] += perf_counter() - start
+
+        return wrapper
+
+    @contextmanager
+    def patch(self, module):
+        """
+        Replace the stage functions of a module with timing wrappers for the
+        duration of the context.
+        """
+        originals = {
+            stage: getattr(module, stage) for stage in STAGES if hasattr(module, stage)
+        }
+
+        for stage, function in originals.items():
+            setattr(module, stage, self.timed(stage, function))
+
+        try:
+            yield self
+
+        finally:
+            for stage, function in originals.items():
+                setattr(module, stage, function)
+
+
+def get_key(solver, case):
+    """
+    Get a stable key for a case, ex. "20/solve.py:input.txt[2,100]".
+    """
+    key = f"{solver.name}:{case.filename}"
+
+    if case.kwargs:
+        key += f"[{','.join(str(value) for _, value in case.kwargs)}]"
+
+    return key
+
+
+def bench_case(solver, case, repeat=3, warmup=1, timeout=None, parse_cache=None):
+    """
+    Time a case and return a dict mapping each stage (plus "main" for the whole
+    call) to its best, median and sampled times.  timeout applies to each run
+    separately, warmups included.
+    """
+    module = solver.module()
+    samples = defaultdict(list)
+
+    with redirect_stdout(StringIO()), redirect_stderr(StringIO()), cache_parse(
+        solver, parse_cache
+    ):
+        for _ in range(warmup):
+            with time_limit(timeout):
+                solver.run(case)
+
+        for _ in range(repeat):
+            with StageTimer().patch(module) as timer, time_limit(timeout):
+                start = perf_counter()
+                solver.run(case)
+                samples["main"].append(perf_counter() - start)
+
+            for stage in STAGES:
+                samples[stage].append(timer.times[stage])
+
+    return {
+        stage: {"best": min(times), "median": median(times), "samples": times}
+        for stage, times in samples.items()
+    }
+
+
+def bench(solvers, tests=False, repeat=3, warmup=1, timeout=None, parse_cache=None):
+    """
+    Benchmark the puzzle input cases (and optionally the test cases) of each
+    solver.  Cases which are missing, time out or raise are recorded with an
+    error instead of timings.
+    """
+    results = {}
+
+    for solver in solvers:
+        for case in solver.cases:
+            if case.is_test and not tests:
+                continue
+
+            key = get_key(solver, case)
+
+            if not solver.filename(case).exists():
+                results[key] = {"error": "missing"}
+                continue
+
+            try:
+                results[key] = bench_case(
+                    solver, case, repeat, warmup, timeout, parse_cache
+                )
+
+            except TimeoutError:
+                results[key] = {"error": "timeout"}
+
+            except Exception as error:  # pylint: disable=broad-except
+                results[key] = {"error": repr(error)}
+
+    return results
+
+
+def get_commit():
+    """
+    Get the current commit hash, suffixed with "-dirty" if the working tree has
+    uncommitted changes.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            cwd=ROOT,
+            text=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True,
+            check=True,
+            cwd=ROOT,
+            text=True,
+        ).stdout.strip()
+
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+    return f"{commit}-dirty" if status else commit
+
+
+def load_history(path):
+    if not Path(path).exists():
+        return {}
+
+    with open(path, encoding="utf-8") as f_in:
+        return json.load(f_in)
+
+
+def save_history(history, path):
+    with open(path, "w", encoding="utf-8") as f_out:
+        json.dump(history, f_out, indent=2)
+
+
+def record(history, commit, results):
+    """
+    Record a run under its commit.  A rerun at the same commit replaces the
+    previous entry and moves it to the end of the history.  Cases which weren't
+    benchmarked in this run keep their previous results.
+    """
+    run = history.pop(commit, {"results": {}})
+    run["timestamp"] = datetime.now(timezone.utc).isoformat()
+    run["python"] = python_version()
+    run["results"].update(results)
+    history[commit] = run
+    return run
+
+
+def get_previous(history, commit):
+    """
+    Get the most recent run recorded under a different commit.
+    """
+    for key in reversed(history):
+        if key != commit:
+            return key, history[key]
+
+    return None, None
+
+
+def get_regressions(results, previous, threshold):
+    """
+    Compare best stage times with a previous run.  Return a list of (key,
+    stage, previous, current) tuples for stages slower by more than threshold.
+    """
+    regressions = []
+
+    for key, stages in results.items():
+        previous_stages = previous["results"].get(key, {})
+
+        for stage, timing in stages.items():
+            if stage == "error" or stage not in previous_stages:
+                continue
+
+            before = previous_stages[stage]["best"]
+            after = timing["best"]
+
+            if after > before * (1 + threshold) and after - before > NOISE_FLOOR:
+                regressions.append((key, stage, before, after))
+
+    return regressions
+
+
+def report(commit, results, previous_commit, regressions, threshold, file):
+    print(f"commit:  {commit}", file=file)
+    print(
+        f"{'case':<40}"
+        + "".join(f"{stage:>12}" for stage in STAGES + ("main",))
+        + "  (best, seconds)",
+        file=file,
+    )
+
+    for key, stages in results.items():
+        if "error" in stages:
+            print(f"{key:<40}{stages['error']:>12}", file=file)
+            continue
+
+        print(
+            f"{key:<40}"
+            + "".join(
+                f"{stages[stage]['best']:>12.4f}" for stage in STAGES + ("main",)
+            ),
+            file=file,
+        )
+
+    if previous_commit is None:
+        print("\nno previous run to compare against", file=file)
+        return
+
+    print(
+        f"\n{len(regressions)} regression(s) beyond {threshold:.0%} "
+        f"versus {previous_commit}",
+        file=file,
+    )
+
+    for key, stage, before, after in regressions:
+        print(
+            f"    {key} {stage}:  {before:.4f}s -> {after:.4f}s "
+            f"({after / before - 1:+.0%})",
+            file=file,
+        )
+
+
+def get_parser():
+    parser = ArgumentParser(description="Benchmark solver stages.")
+    parser.add_argument("--days", type=int, nargs="+", help="days to benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs per case")
+    parser.add_argument("--tests", action="store_true", help="include test files")
+    parser.add_argument(
+        "--parse-cache", action="store_true", help="reuse cached parse() results"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=600, help="per-run time limit in seconds"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown reported as a regression",
+    )
+    parser.add_argument("--history", type=Path, default=HISTORY)
+    parser.add_argument("--output", type=Path, default=OUTPUT)
+    return parser
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    solvers = discover(args.days)
+    results = bench(
+        solvers,
+        args.tests,
+        args.repeat,
+        args.warmup,
+        args.timeout,
+        ParseCache() if args.parse_cache else None,
+    )
+
+    commit = get_commit()
+    history = load_history(args.history)
+    previous_commit, previous = get_previous(history, commit)
+    regressions = (
+        [] if previous is None else get_regressions(results, previous, args.threshold)
+    )
+    record(history, commit, results)
+    save_history(history, args.history)
+
+    output = StringIO()
+    report(commit, results, previous_commit, regressions, args.threshold, output)
+    print(output.getvalue(), end="")
+    args.output.write_text(output.getvalue(), encoding="utf-8")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
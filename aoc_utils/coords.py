@@ -0,0 +1,126 @@
+"""
+Packed integer coordinates for 2-D grids.
+
+A (y, x) coordinate of a grid with width columns is stored as the flat index
+y * width + x.  Flat indices are plain ints, so stepping, hashing and set
+membership don't allocate a tuple per operation the way VectorTuple does, and
+they index the flattened grid directly.  Moving by a delta is integer addition
+of the packed delta, except at the edges where a step would wrap onto the
+neighbouring row, so steps go through PackedGrid.step or the neighbour tables
+which return -1 for moves leaving the grid.
+
+Solvers switch from VectorTuple by keeping their logic and swapping the
+coordinate operations:
+
+    VectorTuple                     PackedGrid
+    coord = VectorTuple(y, x)       index = packed.pack((y, x))
+    grid[coord]                     cells[index], cells = packed.flatten(grid)
+    coord.orthogonals(grid)         packed.orthogonals(index)
+    coord.diagonals(grid)           packed.diagonals(index)
+    coord + delta                   packed.step(index, delta)
+    (a - b).manhattan()             packed.manhattan(a, b)
+"""
+
+from array import array
+
+import numpy as np
+
+ORTHOGONALS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+DIAGONALS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+class PackedGrid:
+    """
+    Coordinate packing and neighbour lookup for a grid of the given shape.
+    Orthogonals and diagonals are generated in the same order as VectorTuple.
+    """
+
+    def __init__(self, shape):
+        self.height, self.width = shape
+        self.size = self.height * self.width
+        self._steps = {}
+
+    def pack(self, coord):
+        y, x = coord
+        return int(y) * self.width + int(x)
+
+    def unpack(self, index):
+        return divmod(index, self.width)
+
+    def valid(self, coord):
+        y, x = coord
+        return 0 <= y < self.height and 0 <= x < self.width
+
+    def flatten(self, grid):
+        """
+        Get a copy of the cells of a grid indexed by packed coordinate, which
+        may be modified freely.  Arrays index slowly from python loops, and a
+        list costs a pointer per cell on top of the int objects, so uint8 and
+        bool grids become a bytearray (1 byte per cell) and other integer grids
+        an array.array of the same item size.  Both index as fast as a list.
+        """
+        grid = np.ascontiguousarray(grid).reshape(self.size)
+
+        if grid.dtype == bool:
+            grid = grid.view(np.uint8)
+
+        if grid.dtype == np.uint8:
+            return bytearray(grid.tobytes())
+
+        return array(grid.dtype.char, grid.tobytes())
+
+    def step(self, index, delta):
+        """
+        Move index by a (dy, dx) delta.  Return -1 if the move leaves the grid.
+        """
+        steps = self._steps.get(delta)
+
+        if steps is None:
+            steps = self._steps[delta] = self.get_table((delta,))[:, 0].tolist()
+
+        return steps[index]
+
+    def orthogonals(self, index):
+        y, x = divmod(index, self.width)
+        adjacencies = []
+
+        if y > 0:
+            adjacencies.append(index - self.width)
+
+        if y < self.height - 1:
+            adjacencies.append(index + self.width)
+
+        if x > 0:
+            adjacencies.append(index - 1)
+
+        if x < self.width - 1:
+            adjacencies.append(index + 1)
+
+        return adjacencies
+
+    def diagonals(self, index):
+        return [
+            adjacency
+            for adjacency in (self.step(index, delta) for delta in DIAGONALS)
+            if adjacency >= 0
+        ]
+
+    def manhattan(self, index_0, index_1):
+        y_0, x_0 = divmod(index_0, self.width)
+        y_1, x_1 = divmod(index_1, self.width)
+        return abs(y_0 - y_1) + abs(x_0 - x_1)
+
+    def get_table(self, deltas=ORTHOGONALS):
+        """
+        Build a (size, len(deltas)) int32 table of the neighbour of every cell
+        in each delta direction, with -1 where the neighbour is off the grid.
+        """
+        y, x = np.divmod(np.arange(self.size, dtype=np.int32), self.width)
+        table = np.full((self.size, len(deltas)), -1, dtype=np.int32)
+
+        for column, (dy, dx) in enumerate(deltas):
+            y_, x_ = y + dy, x + dx
+            valid = (y_ >= 0) & (y_ < self.height) & (x_ >= 0) & (x_ < self.width)
+            table[valid, column] = (y_ * self.width + x_)[valid]
+
+        return table
@@ -0,0 +1,105 @@
+"""
+Lightweight counters for the search loops of the solvers.
+
+Solvers record events on the shared COUNTERS object behind an
+`if COUNTERS.enabled:` guard, so with counting off the cost is an attribute
+lookup and a branch per event.  The runner enables counting with --counters,
+resets the counters before each case and reports them after the run.
+
+Names are "<function>.<event>", ex:
+    bfs.expanded        states popped from the queue
+    bfs.relaxed         cost improvements, including the first visit
+    bfs.re_relaxed      cost improvements to a state which was already reached
+    bfs.queue_peak      longest the queue got
+    count_solves.hit    memo lookups which found an entry
+    count_solves.miss   memo lookups which didn't
+"""
+
+import sys
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+class Counters:
+    """
+    Event counts and high-water marks.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.counts = defaultdict(int)
+        self.peaks = defaultdict(int)
+
+    def count(self, name, amount=1):
+        self.counts[name] += amount
+
+    def peak(self, name, value):
+        if value > self.peaks[name]:
+            self.peaks[name] = value
+
+    def reset(self):
+        self.counts.clear()
+        self.peaks.clear()
+
+    def snapshot(self):
+        return dict(sorted({**self.counts, **self.peaks}.items()))
+
+
+COUNTERS = Counters()
+
+
+@contextmanager
+def counting(enabled, snapshot):
+    """
+    Reset and enable the counters for the duration of the context, then copy
+    them into the snapshot dict.  Does nothing if enabled is False.
+    """
+    if not enabled:
+        yield
+        return
+
+    COUNTERS.reset()
+    COUNTERS.enabled = True
+
+    try:
+        yield
+
+    finally:
+        COUNTERS.enabled = False
+        snapshot.update(COUNTERS.snapshot())
+
+
+def get_hit_rates(snapshot):
+    """
+    Get the hit rate of each "<name>.hit"/"<name>.miss" pair.
+    """
+    rates = {}
+
+    for name, hits in snapshot.items():
+        if name.endswith(".hit"):
+            prefix = name.removesuffix(".hit")
+            total = hits + snapshot.get(f"{prefix}.miss", 0)
+            rates[f"{prefix}.hit_rate"] = hits / total if total else 0.0
+
+    return rates
+
+
+def report(rows, file=sys.stdout):
+    """
+    Print the counters of each (label, snapshot) row which recorded any.
+    """
+    rows = [(label, snapshot) for label, snapshot in rows if snapshot]
+
+    if not rows:
+        return
+
+    print("\ncounters", file=file)
+
+    for label, snapshot in rows:
+        print(f"\n{label}", file=file)
+
+        for name, value in snapshot.items():
+            print(f"    {name:<28}{value:>14,}", file=file)
+
+        for name, rate in get_hit_rates(snapshot).items():
+            print(f"    {name:<28}{rate:>14.1%}", file=file)
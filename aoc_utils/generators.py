@@ -0,0 +1,711 @@
+#!/usr/bin/env python3
+
+"""
+Synthetic input generators for every day.
+
+Each generator takes a size and a numpy random Generator and returns the input
+text in the same format as the puzzle input.  The meaning of size depends on
+the day (lines, grid side length, buyers, adder bits, ...) and is documented on
+each generator.  Days whose main() takes arguments tied to the input (grid
+dimensions, step counts) get them from get_kwargs().
+
+usage:
+    python -m aoc_utils.generators 6 1000 > guard_map.txt
+    python -m aoc_utils.generators 24 256 --seed 7 > adder.txt
+"""
+
+import sys
+from argparse import ArgumentParser
+from collections import deque
+from math import isqrt
+
+import numpy as np
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+DELTAS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+
+def grid_text(grid):
+    """
+    Convert a 2-d uint8 array of character codes to newline separated text.
+    """
+    newlines = np.full((grid.shape[0], 1), ord("\n"), dtype=np.uint8)
+    return np.hstack([grid, newlines]).tobytes().decode("ascii")
+
+
+def characters(string):
+    return np.frombuffer(string.encode("ascii"), dtype=np.uint8)
+
+
+def day_1(size, rng):
+    """
+    size:  number of lines
+
+    About half of the right column is drawn from the left column so the
+    similarity score of part 2 is non-trivial.
+    """
+    left = rng.integers(10000, 100000, size)
+    right = rng.integers(10000, 100000, size)
+    shared = rng.random(size) < 0.5
+    right[shared] = rng.choice(left, shared.sum())
+    return "".join(f"{a}   {b}\n" for a, b in zip(left.tolist(), right.tolist()))
+
+
+def day_2(size, rng):
+    """
+    size:  number of reports
+
+    Reports have 5-8 levels which change monotonically by 1-3, and roughly half
+    have a single level perturbed.
+    """
+    lengths = rng.integers(5, 9, size)
+    steps = rng.integers(1, 4, (size, 7)) * rng.choice((-1, 1), (size, 1))
+    levels = rng.integers(20, 80, (size, 1)) + np.hstack(
+        [np.zeros((size, 1), dtype=int), np.cumsum(steps, axis=1)]
+    )
+    perturbed = np.flatnonzero(rng.random(size) < 0.5)
+    levels[perturbed, rng.integers(0, 5, perturbed.size)] += rng.integers(
+        -4, 5, perturbed.size
+    )
+    lines = []
+
+    for report, length in zip(levels.tolist(), lengths.tolist()):
+        lines.append(" ".join(map(str, report[:length])))
+
+    return "\n".join(lines) + "\n"
+
+
+def day_3(size, rng):
+    """
+    size:  number of tokens
+
+    Tokens are valid mul(x,y), do() and don't() instructions mixed with near
+    misses and junk characters.
+    """
+    junk = [
+        "mul(4*",
+        "mul(6,9!",
+        "?(12,34)",
+        "mul ( 2 , 4 )",
+        "how()",
+        "select()",
+        "from()",
+        "mul[3,7]",
+        "don't",
+        "do(",
+        "#",
+        "'",
+        "%",
+        ">",
+        "}",
+    ]
+    kinds = rng.choice(4, size, p=(0.45, 0.05, 0.05, 0.45))
+    operands = rng.integers(1, 1000, (size, 2)).tolist()
+    junk_idx = rng.integers(0, len(junk), size).tolist()
+    tokens = []
+
+    for kind, (x, y), idx in zip(kinds.tolist(), operands, junk_idx):
+        match kind:
+            case 0:
+                tokens.append(f"mul({x},{y})")
+            case 1:
+                tokens.append("do()")
+            case 2:
+                tokens.append("don't()")
+            case _:
+                tokens.append(junk[idx])
+
+    return "".join(tokens) + "\n"
+
+
+def day_4(size, rng):
+    """
+    size:  side length of the letter grid
+    """
+    return grid_text(rng.choice(characters("XMAS"), (size, size)))
+
+
+def day_5(size, rng):
+    """
+    size:  number of updates
+
+    Rules form a cyclic tournament over 49 pages like the puzzle input: each
+    page precedes the next 24 pages in a random cyclic order.  Updates are drawn
+    from a window of consecutive pages so their rules are consistent, and half
+    are shuffled out of order.
+    """
+    pages = rng.choice(np.arange(10, 100), 49, replace=False).tolist()
+    rules = []
+
+    for idx, page in enumerate(pages):
+        for offset in range(1, 25):
+            rules.append(f"{page}|{pages[(idx + offset) % 49]}")
+
+    rules = [rules[idx] for idx in rng.permutation(len(rules))]
+    updates = []
+
+    for _ in range(size):
+        length = int(rng.choice(np.arange(5, 24, 2)))
+        start = int(rng.integers(0, 49))
+        window = [pages[(start + offset) % 49] for offset in range(25)]
+        update = sorted(rng.choice(25, length, replace=False).tolist())
+        update = [window[idx] for idx in update]
+
+        if rng.random() < 0.5:
+            update = [update[idx] for idx in rng.permutation(length)]
+
+        updates.append(",".join(map(str, update)))
+
+    return "\n".join(rules) + "\n\n" + "\n".join(updates) + "\n"
+
+
+def day_6(size, rng, density=0.015):
+    """
+    size:  side length of the map
+
+    Maps where the guard walks in a loop are rejected, since part 1 expects the
+    guard to leave the map.
+    """
+    while True:
+        grid = np.where(rng.random((size, size)) < density, ord("#"), ord("."))
+        grid = grid.astype(np.uint8)
+        start = tuple(rng.integers(0, size, 2).tolist())
+        grid[start] = ord("^")
+
+        if guard_exits(grid, start):
+            return grid_text(grid)
+
+
+def guard_exits(grid, position):
+    """
+    Walk the guard until it leaves the grid or repeats a state.
+    """
+    direction = 0
+    visited = set()
+
+    while (position, direction) not in visited:
+        visited.add((position, direction))
+        y, x = position[0] + DELTAS[direction][0], position[1] + DELTAS[direction][1]
+
+        if not (0 <= y < grid.shape[0] and 0 <= x < grid.shape[1]):
+            return True
+
+        if grid[y, x] == ord("#"):
+            direction = (direction + 1) % 4
+        else:
+            position = (y, x)
+
+    return False
+
+
+def day_7(size, rng):
+    """
+    size:  number of equations
+
+    Results are computed from random +, * and || operators, and a third of the
+    equations are made unsolvable by offsetting the result.
+    """
+    lines = []
+
+    for _ in range(size):
+        operands = rng.integers(1, 100, int(rng.integers(3, 10))).tolist()
+        result = operands[0]
+
+        for operand in operands[1:]:
+            match int(rng.integers(0, 3)):
+                case 0:
+                    result += operand
+                case 1:
+                    result *= operand
+                case 2:
+                    result = int(f"{result}{operand}")
+
+        if rng.random() < 1 / 3:
+            result += int(rng.integers(1, 100))
+
+        lines.append(f"{result}: {' '.join(map(str, operands))}")
+
+    return "\n".join(lines) + "\n"
+
+
+def day_8(size, rng):
+    """
+    size:  side length of the map
+
+    Antennas occupy about 2% of the map across 62 frequencies.
+    """
+    frequencies = characters(
+        "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    )
+    grid = np.full((size, size), ord("."), dtype=np.uint8)
+    antennas = rng.random((size, size)) < 0.02
+    grid[antennas] = rng.choice(frequencies, antennas.sum())
+    return grid_text(grid)
+
+
+def day_9(size, rng):
+    """
+    size:  number of digits in the disk map
+    """
+    size += 1 - size % 2
+    digits = rng.integers(0, 10, size)
+    digits[::2] = rng.integers(1, 10, (size + 1) // 2)
+    return "".join(map(str, digits.tolist())) + "\n"
+
+
+def day_10(size, rng):
+    """
+    size:  side length of the map
+
+    Heights increase along diagonal stripes with 30% noise, so trails are
+    plentiful but the number of distinct trails stays bounded.
+    """
+    y, x = np.indices((size, size))
+    heights = (y + x) % 10
+    noise = rng.random((size, size)) < 0.3
+    heights[noise] = rng.integers(0, 10, noise.sum())
+    return grid_text((heights + ord("0")).astype(np.uint8))
+
+
+def day_11(size, rng):
+    """
+    size:  number of stones
+    """
+    return " ".join(map(str, rng.integers(0, 10**6, size).tolist())) + "\n"
+
+
+def day_12(size, rng):
+    """
+    size:  side length of the garden
+
+    Plots are 4x4 blocks of random plant types with 10% noise, so regions vary
+    from single plots to large irregular areas.
+    """
+    blocks = rng.choice(characters(ALPHABET.upper()), (size // 4 + 1, size // 4 + 1))
+    grid = np.repeat(np.repeat(blocks, 4, axis=0), 4, axis=1)[:size, :size]
+    noise = rng.random((size, size)) < 0.1
+    grid[noise] = rng.choice(characters(ALPHABET.upper()), noise.sum())
+    return grid_text(grid)
+
+
+def day_13(size, rng):
+    """
+    size:  number of claw machines
+
+    Half of the prizes are reachable with at most 100 presses of each button.
+    """
+    machines = []
+
+    for _ in range(size):
+        (ax, ay), (bx, by) = rng.integers(10, 100, (2, 2)).tolist()
+
+        if rng.random() < 0.5:
+            a, b = rng.integers(0, 101, 2).tolist()
+            x, y = ax * a + bx * b, ay * a + by * b
+        else:
+            x, y = rng.integers(1000, 20000, 2).tolist()
+
+        machines.append(
+            f"Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={x}, Y={y}"
+        )
+
+    return "\n\n".join(machines) + "\n"
+
+
+def get_robot_grid(size):
+    """
+    Get the (height, width) of the day 14 grid.  The puzzle grid of 103x101 is
+    grown for large numbers of robots so the picture still fits.
+    """
+    side = max(101, isqrt(4 * size) | 1)
+    return side + 2, side
+
+
+def day_14(size, rng):
+    """
+    size:  number of robots
+
+    60% of the robots are placed into a solid rectangle at a random step, and
+    their starting positions are found by running them backwards.  This gives
+    part 2 a picture to find.
+    """
+    height, width = get_robot_grid(size)
+    step = int(rng.integers(100, height * width))
+    velocities = rng.integers(-100, 101, (size, 2))
+    positions = np.stack(
+        [rng.integers(0, height, size), rng.integers(0, width, size)], axis=1
+    )
+
+    picture = int(size * 0.6)
+    picture_width = isqrt(picture) + 1
+    picture_cells = np.arange(picture)
+    positions[:picture, 0] = height // 4 + picture_cells // picture_width
+    positions[:picture, 1] = width // 4 + picture_cells % picture_width
+    positions[:picture] -= velocities[:picture] * step
+    positions %= (height, width)
+
+    lines = []
+
+    for (y, x), (dy, dx) in zip(positions.tolist(), velocities.tolist()):
+        lines.append(f"p={x},{y} v={dx},{dy}")
+
+    return "\n".join(lines) + "\n"
+
+
+def day_15(size, rng):
+    """
+    size:  side length of the warehouse
+
+    The robot is given 8 * size**2 moves.
+    """
+    grid = rng.choice(characters(".#O"), (size, size), p=(0.75, 0.05, 0.2))
+    grid[[0, -1], :] = ord("#")
+    grid[:, [0, -1]] = ord("#")
+    grid[size // 2, size // 2] = ord("@")
+
+    moves = rng.choice(characters("<>^v"), 8 * size * size)
+    moves = np.pad(moves, (0, -moves.size % 1000), constant_values=ord("<"))
+    return grid_text(grid) + "\n" + grid_text(moves.reshape(-1, 1000))
+
+
+def get_maze(size, rng):
+    """
+    Carve a perfect maze with an iterative randomized DFS.  Cells sit at odd
+    coordinates of a size x size grid of walls (size is rounded up to odd).
+    """
+    size |= 1
+    grid = np.full((size, size), ord("#"), dtype=np.uint8)
+    grid[1, 1] = ord(".")
+    stack = [(1, 1)]
+
+    while len(stack) > 0:
+        y, x = stack[-1]
+        candidates = []
+
+        for dy, dx in DELTAS:
+            ny, nx_ = y + 2 * dy, x + 2 * dx
+
+            if 0 < ny < size - 1 and 0 < nx_ < size - 1 and grid[ny, nx_] == ord("#"):
+                candidates.append((ny, nx_))
+
+        if len(candidates) == 0:
+            stack.pop()
+            continue
+
+        ny, nx_ = candidates[int(rng.integers(0, len(candidates)))]
+        grid[(y + ny) // 2, (x + nx_) // 2] = ord(".")
+        grid[ny, nx_] = ord(".")
+        stack.append((ny, nx_))
+
+    return grid
+
+
+def day_16(size, rng):
+    """
+    size:  side length of the maze (rounded up to odd)
+
+    A perfect maze with 5% of the inner walls removed so there are multiple
+    best paths for part 2.
+    """
+    grid = get_maze(size, rng)
+    inner = np.zeros_like(grid, dtype=bool)
+    inner[1:-1, 1:-1] = True
+    removed = inner & (grid == ord("#")) & (rng.random(grid.shape) < 0.05)
+    grid[removed] = ord(".")
+    grid[-2, 1] = ord("S")
+    grid[1, -2] = ord("E")
+    return grid_text(grid)
+
+
+def day_17(size, rng):
+    """
+    size:  number of octal digits in register A
+
+    The program is the one from the puzzle input, so part 2 is solveable and
+    its runtime doesn't depend on size.
+    """
+    digits = rng.integers(0, 8, size).tolist()
+    digits[-1] = max(digits[-1], 1)
+    a = sum(digit * 8**idx for idx, digit in enumerate(digits))
+    program = "2,4,1,3,7,5,4,2,0,3,1,5,5,5,3,0"
+    return f"Register A: {a}\nRegister B: 0\nRegister C: 0\n\nProgram: {program}\n"
+
+
+def day_18(size, rng):
+    """
+    size:  side length of the memory space
+
+    68% of the cells fall in random order, which blocks the exit well before
+    the last byte.  Part 1 simulates the first 20%.
+    """
+    cells = np.arange(1, size * size - 1)
+    falling = rng.permutation(cells)[: int(size * size * 0.68)]
+    return "".join(f"{cell % size},{cell // size}\n" for cell in falling.tolist())
+
+
+def day_19(size, rng):
+    """
+    size:  number of patterns
+
+    70% of the patterns are concatenations of towels, the rest are random.
+    """
+    colors = list("wubrg")
+    towels = set()
+
+    while len(towels) < 400:
+        towels.add("".join(rng.choice(colors, int(rng.integers(1, 9)))))
+
+    towels = sorted(towels)
+    patterns = []
+
+    for _ in range(size):
+        if rng.random() < 0.7:
+            pattern = "".join(rng.choice(towels, int(rng.integers(4, 12))))
+        else:
+            pattern = "".join(rng.choice(colors, int(rng.integers(20, 60))))
+
+        patterns.append(pattern[:60])
+
+    return ", ".join(towels) + "\n\n" + "\n".join(patterns) + "\n"
+
+
+def day_20(size, rng):
+    """
+    size:  side length of the racetrack (rounded up to odd)
+
+    The track is the unique path between opposite corners of a perfect maze,
+    with every other cell a wall.
+    """
+    maze = get_maze(size, rng)
+    start, end = (maze.shape[0] - 2, 1), (1, maze.shape[1] - 2)
+    parents = {start: None}
+    queue = deque([start])
+
+    while len(queue) > 0:
+        y, x = queue.popleft()
+
+        for dy, dx in DELTAS:
+            adjacency = y + dy, x + dx
+
+            if maze[adjacency] == ord(".") and adjacency not in parents:
+                parents[adjacency] = (y, x)
+                queue.append(adjacency)
+
+    grid = np.full_like(maze, ord("#"))
+    position = end
+
+    while position is not None:
+        grid[position] = ord(".")
+        position = parents[position]
+
+    grid[start] = ord("S")
+    grid[end] = ord("E")
+    return grid_text(grid)
+
+
+def day_21(size, rng):
+    """
+    size:  number of codes
+    """
+    codes = rng.integers(0, 1000, size).tolist()
+    return "".join(f"{code:03}A\n" for code in codes)
+
+
+def day_22(size, rng):
+    """
+    size:  number of buyers
+    """
+    return "".join(f"{number}\n" for number in rng.integers(1, 2**24, size).tolist())
+
+
+def get_names(count, rng, width=2):
+    """
+    Get unique lowercase names, widening them if count exceeds the number of
+    names available at the given width.
+    """
+    while 26**width < count:
+        width += 1
+
+    indices = rng.choice(26**width, count, replace=False).tolist()
+    names = []
+
+    for index in indices:
+        name = []
+
+        for _ in range(width):
+            index, letter = divmod(index, 26)
+            name.append(ALPHABET[letter])
+
+        names.append("".join(name))
+
+    return names
+
+
+def day_23(size, rng):
+    """
+    size:  number of computers
+
+    Each computer links to 13 random others on average, and a clique of 13
+    computers is embedded for part 2.
+    """
+    computers = get_names(size, rng)
+    edges = set()
+
+    for _ in range(size * 13 // 2):
+        src, dst = rng.choice(size, 2, replace=False).tolist()
+        edges.add((min(src, dst), max(src, dst)))
+
+    clique = rng.choice(size, min(13, size), replace=False).tolist()
+
+    for idx, src in enumerate(clique):
+        for dst in clique[idx + 1 :]:
+            edges.add((min(src, dst), max(src, dst)))
+
+    edges = sorted(edges)
+    edges = [edges[idx] for idx in rng.permutation(len(edges))]
+    return "".join(f"{computers[src]}-{computers[dst]}\n" for src, dst in edges)
+
+
+def day_24(size, rng):
+    """
+    size:  number of input bits of the ripple carry adder
+
+    Four pairs of gate outputs are swapped within single bits, as in the puzzle
+    input.  Part 2 assumes 45 bits.
+    """
+    width = max(2, len(str(size)))
+    names = iter(name for name in get_names(6 * size, rng, 3) if name[0] not in "xyz")
+    gates = {}
+    bit_gates = []
+    carry = None
+
+    for bit in range(size):
+        x, y, z = (f"{wire}{bit:0{width}}" for wire in "xyz")
+
+        if carry is None:
+            carry = next(names)
+            gates[z] = ["XOR", x, y]
+            gates[carry] = ["AND", x, y]
+            continue
+
+        half_sum, half_carry, carry_through = next(names), next(names), next(names)
+        gates[half_sum] = ["XOR", x, y]
+        gates[half_carry] = ["AND", x, y]
+        gates[z] = ["XOR", half_sum, carry]
+        gates[carry_through] = ["AND", half_sum, carry]
+        carry = f"z{size:0{width}}" if bit == size - 1 else next(names)
+        gates[carry] = ["OR", half_carry, carry_through]
+        bit_gates.append((half_sum, half_carry, z, carry_through, carry))
+
+    swap_gates(gates, bit_gates, rng)
+    states = [
+        f"{wire}{bit:0{width}}: {rng.integers(0, 2)}"
+        for wire in "xy"
+        for bit in range(size)
+    ]
+    lines = [
+        f"{src_0} {op} {src_1} -> {dst}" for dst, (op, src_0, src_1) in gates.items()
+    ]
+    lines = [lines[idx] for idx in rng.permutation(len(lines))]
+    return "\n".join(states) + "\n\n" + "\n".join(lines) + "\n"
+
+
+def swap_gates(gates, bit_gates, rng, n_swaps=4):
+    """
+    Swap the outputs of a pair of gates in each of n_swaps random bits.  Only
+    pairs which keep the circuit acyclic are used: the sum output with any gate
+    that doesn't feed it, or the two gates driven directly by x and y.
+    """
+    pairs = ((2, 1), (2, 3), (2, 4), (0, 1))
+
+    for idx in rng.choice(len(bit_gates), min(n_swaps, len(bit_gates)), replace=False):
+        idx_0, idx_1 = pairs[int(rng.integers(0, len(pairs)))]
+        dst_0, dst_1 = bit_gates[idx][idx_0], bit_gates[idx][idx_1]
+        gates[dst_0], gates[dst_1] = gates[dst_1], gates[dst_0]
+
+
+def day_25(size, rng):
+    """
+    size:  number of schematics, split evenly between locks and keys
+    """
+    schematics = []
+
+    for idx in range(size):
+        heights = rng.integers(0, 6, 5)
+        rows = np.arange(7)[:, None]
+
+        if idx % 2 == 0:
+            filled = rows <= heights
+        else:
+            filled = rows >= 6 - heights
+
+        grid = np.where(filled, ord("#"), ord(".")).astype(np.uint8)
+        schematics.append(grid_text(grid))
+
+    return "\n".join(schematics)
+
+
+GENERATORS = {
+    1: day_1,
+    2: day_2,
+    3: day_3,
+    4: day_4,
+    5: day_5,
+    6: day_6,
+    7: day_7,
+    8: day_8,
+    9: day_9,
+    10: day_10,
+    11: day_11,
+    12: day_12,
+    13: day_13,
+    14: day_14,
+    15: day_15,
+    16: day_16,
+    17: day_17,
+    18: day_18,
+    19: day_19,
+    20: day_20,
+    21: day_21,
+    22: day_22,
+    23: day_23,
+    24: day_24,
+    25: day_25,
+}
+
+
+def generate(day, size, seed=0):
+    return GENERATORS[day](size, np.random.default_rng(seed))
+
+
+def get_kwargs(day, size):
+    """
+    Get the main() arguments which depend on the generated input size.
+    """
+    match day:
+        case 14:
+            height, width = get_robot_grid(size)
+            return {"height": height, "width": width}
+
+        case 18:
+            return {"size": size - 1, "steps": size * size // 5}
+
+        case _:
+            return {}
+
+
+def get_parser():
+    parser = ArgumentParser(description="Generate a synthetic puzzle input.")
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("size", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    sys.stdout.write(generate(args.day, args.size, args.seed))
+
+
+if __name__ == "__main__":
+    main()
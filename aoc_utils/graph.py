@@ -0,0 +1,166 @@
+"""
+Shortest paths over 2-D grids.
+
+Grids are given as boolean arrays of passable cells and traversed over flat
+cell indices (see aoc_utils.coords) with the orthogonal neighbour offsets
+(-width, +width, -1, +1).  Distances are returned as int32 arrays shaped like
+the grid, with UNREACHED for cells which can't be reached.
+
+bfs and bfs_01 expand a whole frontier per step with numpy, so their python
+overhead scales with the path length rather than the number of cells.
+dijkstra_turns walks (heading, cell) states with a heap for costs which depend
+on the direction of travel, ex. day 16's turning penalty.
+"""
+
+from heapq import heappop, heappush
+
+import numpy as np
+
+from .coords import ORTHOGONALS
+from .counters import COUNTERS
+
+UNREACHED = -1
+
+
+def get_neighbours(frontier, shape):
+    """
+    Get the flat indices of the in-bounds orthogonal neighbours of every index
+    in frontier.  Indices may repeat.
+    """
+    height, width = shape
+    y, x = np.divmod(frontier, width)
+    return np.concatenate(
+        (
+            frontier[y > 0] - width,
+            frontier[y < height - 1] + width,
+            frontier[x > 0] - 1,
+            frontier[x < width - 1] + 1,
+        )
+    )
+
+
+def get_sources(sources, passable):
+    """
+    Pack (y, x) sources into flat indices, dropping impassable ones.
+    """
+    indices = np.unique(
+        np.array([y * passable.shape[1] + x for y, x in sources], dtype=np.int64)
+    )
+    return indices[passable.reshape(-1)[indices]]
+
+
+def bfs(passable, sources):
+    """
+    Multi-source breadth first search.  Return the number of steps from the
+    nearest source to each cell.
+    """
+    passable = np.ascontiguousarray(passable, dtype=bool)
+    flat = passable.reshape(-1)
+    distances = np.full(flat.size, UNREACHED, dtype=np.int32)
+    frontier = get_sources(sources, passable)
+    step = 0
+
+    while frontier.size > 0:
+        distances[frontier] = step
+        step += 1
+        neighbours = get_neighbours(frontier, passable.shape)
+        neighbours = neighbours[flat[neighbours]]
+        frontier = np.unique(neighbours[distances[neighbours] == UNREACHED])
+
+    return distances.reshape(passable.shape)
+
+
+def bfs_01(passable, costs, sources):
+    """
+    Multi-source 0-1 breadth first search, where entering a cell costs
+    costs[y, x] (0 or 1).  Return the least total cost from the nearest source
+    to each cell.  Cells at each cost are flood filled through zero cost cells
+    before the cost 1 cells around them are opened, which visits cells in
+    order of cost like a 0-1 deque.
+    """
+    passable = np.ascontiguousarray(passable, dtype=bool)
+    flat = passable.reshape(-1)
+    free = np.ascontiguousarray(costs).reshape(-1) == 0
+    distances = np.full(flat.size, UNREACHED, dtype=np.int32)
+    frontier = get_sources(sources, passable)
+    cost = 0
+
+    while frontier.size > 0:
+        level = []
+
+        while frontier.size > 0:
+            distances[frontier] = cost
+            level.append(frontier)
+            neighbours = get_neighbours(frontier, passable.shape)
+            neighbours = neighbours[flat[neighbours] & free[neighbours]]
+            frontier = np.unique(neighbours[distances[neighbours] == UNREACHED])
+
+        cost += 1
+        neighbours = get_neighbours(np.concatenate(level), passable.shape)
+        neighbours = neighbours[flat[neighbours]]
+        frontier = np.unique(neighbours[distances[neighbours] == UNREACHED])
+
+    return distances.reshape(passable.shape)
+
+
+def dijkstra_turns(passable, source, heading, step_cost=1, turn_cost=1000):
+    """
+    Dijkstra over (heading, cell) states.  Moving forward costs step_cost and
+    each 90 degree turn costs turn_cost.  heading is a (dy, dx) delta from
+    ORTHOGONALS.  Return a (4, height, width) array of the least cost to stand
+    on each cell facing each heading, in ORTHOGONALS order.
+    """
+    height, width = passable.shape
+    size = height * width
+    flat = np.ascontiguousarray(passable, dtype=bool).reshape(-1).tolist()
+    offsets = [dy * width + dx for dy, dx in ORTHOGONALS]
+
+    # ORTHOGONALS holds opposite headings in adjacent pairs (up/down, left/right)
+    turns = [
+        [0 if a == b else 2 if a ^ 1 == b else 1 for b in range(4)] for a in range(4)
+    ]
+
+    inf = np.iinfo(np.int32).max
+    costs = [inf] * (4 * size)
+    start = ORTHOGONALS.index(heading) * size + source[0] * width + source[1]
+    costs[start] = 0
+    heap = [(0, start)]
+
+    while heap:
+        if COUNTERS.enabled:
+            COUNTERS.peak("dijkstra.queue_peak", len(heap))
+
+        cost, state = heappop(heap)
+
+        if cost > costs[state]:
+            continue
+
+        if COUNTERS.enabled:
+            COUNTERS.count("dijkstra.expanded")
+
+        direction, index = divmod(state, size)
+        y, x = divmod(index, width)
+        bounds = (y > 0, y < height - 1, x > 0, x < width - 1)
+
+        for direction_, offset in enumerate(offsets):
+            adjacency = index + offset
+
+            if not bounds[direction_] or not flat[adjacency]:
+                continue
+
+            cost_ = cost + step_cost + turns[direction][direction_] * turn_cost
+            state_ = direction_ * size + adjacency
+
+            if cost_ < costs[state_]:
+                if COUNTERS.enabled:
+                    COUNTERS.count("dijkstra.relaxed")
+
+                    if costs[state_] < inf:
+                        COUNTERS.count("dijkstra.re_relaxed")
+
+                costs[state_] = cost_
+                heappush(heap, (cost_, state_))
+
+    costs = np.array(costs, dtype=np.int32)
+    costs[costs == inf] = UNREACHED
+    return costs.reshape(4, height, width)
@@ -0,0 +1,102 @@
+"""
+Zero-copy loading of character grids.
+
+Grid inputs are rectangular blocks of single byte characters.  Instead of
+building a list of one character strings per line and converting it to a <U1
+array (4 bytes per cell), the file is memory mapped and viewed as a 2-D uint8
+array with the newline column sliced off.  Cells hold byte values, so they're
+compared with ord(), ex. grid == ord("#").
+
+Solvers importing this module need the repository root on the path when run
+standalone, ex. `PYTHONPATH=.. ./solve.py` from a day directory.
+"""
+
+import mmap
+
+import numpy as np
+
+NEWLINE = ord("\n")
+CARRIAGE_RETURN = ord("\r")
+
+
+def read_grid(filename):
+    """
+    Memory map a grid file as a 2-D uint8 array.  The mapping is copy-on-write,
+    so solvers may modify the grid without touching the file.
+    """
+    with open(filename, "rb") as f_in:
+        buffer = mmap.mmap(f_in.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    return to_grid(buffer)
+
+
+def to_grid(data):
+    """
+    View a grid held in a str or bytes-like object as a 2-D uint8 array.
+    Trailing line endings are ignored.  The result is a view of data unless
+    the last line is missing its line ending, in which case data is copied.
+
+    ex input:
+        "#.#\\n.#.\\n"
+
+    returns:
+        [
+            [35, 46, 35],
+            [46, 35, 46],
+        ]
+    """
+    if isinstance(data, str):
+        data = bytearray(data.encode("utf-8"))
+
+    array = np.frombuffer(data, dtype=np.uint8)
+    size = len(array)
+
+    while size > 0 and array[size - 1] in (NEWLINE, CARRIAGE_RETURN):
+        size -= 1
+
+    width = data.find(b"\n")
+    stride = size + 1 if width == -1 else width + 1
+
+    if width > 0 and array[width - 1] == CARRIAGE_RETURN:
+        width -= 1
+
+    width = size if width == -1 else width
+    rows = (size + stride - width) // stride
+
+    if size != rows * stride - (stride - width):
+        raise ValueError("grid rows have different lengths")
+
+    if len(array) < rows * stride:
+        array = np.append(array[:size], np.full(stride - width, NEWLINE, np.uint8))
+
+    return array[: rows * stride].reshape(rows, stride)[:, :width]
+
+
+def digits(grid):
+    """
+    Convert a grid of digit characters to their values.
+    """
+    return grid - ord("0")
+
+
+def find(grid, char):
+    """
+    Get the (y, x) coordinate of the first occurrence of char.  Raise
+    IndexError if it isn't present.
+    """
+    idx = np.flatnonzero(grid == ord(char))[0]
+    return tuple(int(value) for value in np.unravel_index(idx, grid.shape))
+
+
+def isin(grid, chars):
+    """
+    Get a boolean mask of the cells matching any of chars.
+    """
+    return np.isin(grid, np.frombuffer(chars.encode("utf-8"), dtype=np.uint8))
+
+
+def grid_str(grid):
+    """
+    Return the string representation of a uint8 grid.
+    """
+    return "\n".join(row.tobytes().decode("utf-8") for row in grid)
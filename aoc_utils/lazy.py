@@ -0,0 +1,67 @@
+"""
+Deferred imports for heavy third-party modules.
+
+Solvers import their dependencies at the top of the file so they still run as
+standalone scripts.  When solvers are loaded through aoc_utils the modules in
+LAZY_MODULES are first registered in sys.modules as placeholders, so a plain
+`import networkx as nx` binds the placeholder and the real import only happens
+on first attribute access.  Solvers which never touch the module on a given
+code path never pay for it.
+
+importlib.util.LazyLoader isn't used since the import statement itself reads
+__spec__ from modules found in sys.modules, which triggers a LazyLoader module
+to load immediately.
+"""
+
+import sys
+from importlib import import_module
+from importlib.util import find_spec
+from types import ModuleType
+
+LAZY_MODULES = ("networkx", "z3", "tqdm")
+
+
+class LazyModule(ModuleType):
+    """
+    Placeholder which imports the real module on the first lookup of an
+    attribute it doesn't have.  The real module's namespace is then copied
+    over, so later lookups don't go through __getattr__.
+    """
+
+    def __getattr__(self, name):
+        if sys.modules.get(self.__name__) is self:
+            del sys.modules[self.__name__]
+
+        module = import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, name)
+
+
+def lazy_import(name):
+    """
+    Return the named module, deferring its import until first use.  Modules
+    which are already imported are returned as-is, and missing modules return
+    None so the solver's own import raises the usual ImportError.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = find_spec(name)
+
+    if spec is None:
+        return None
+
+    module = LazyModule(name)
+    module.__spec__ = spec
+    sys.modules[name] = module
+    return module
+
+
+def defer(names=LAZY_MODULES):
+    """
+    Register each of the named modules as lazy.  They stay registered in
+    sys.modules, so every solver loaded afterwards shares the same (possibly
+    still unloaded) module.
+    """
+    for name in names:
+        lazy_import(name)
@@ -0,0 +1,226 @@
+"""
+Content-addressed cache of parsed inputs.
+
+The key is a hash of the parse() input (the file contents returned by
+read_file) together with the solver's source, the source of parse() itself and
+the source of every aoc_utils module the solver uses, so editing a solver, a
+shared helper or an input invalidates its entries.  numpy arrays are
+stored as .npy files and memory mapped copy-on-write when loaded, so solvers
+which modify their grid in place still work.  Anything else is pickled.
+Entries which can't be pickled are simply not cached.
+
+Each hit refreshes the entry's modification time, and the least recently used
+entries are evicted once the cache grows beyond max_bytes.
+
+The cache is opt-in, enabled with --parse-cache in the runner and benchmark.
+"""
+
+import copyreg
+import os
+import pickle
+import sys
+from contextlib import contextmanager
+from functools import wraps
+from hashlib import sha256
+from inspect import getsource
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from types import ModuleType
+
+import numpy as np
+from aoc_data_structures import VectorTuple
+
+from .solvers import ROOT
+
+CACHE_DIR = Path(os.environ.get("AOC_PARSE_CACHE_DIR", ROOT / ".parse_cache"))
+MAX_BYTES = 2**30
+
+
+class ParseCache:
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def get_key(self, source_digest, args, kwargs):
+        digest = sha256(source_digest)
+
+        for value in args + tuple(kwargs.values()):
+            update_digest(digest, value)
+
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        Return (True, value) on a hit and (False, None) on a miss.
+        """
+        for path in (self.directory / f"{key}.npy", self.directory / f"{key}.pkl"):
+            try:
+                if path.suffix == ".npy":
+                    value = np.load(path, mmap_mode="c")
+                else:
+                    with open(path, "rb") as f_in:
+                        value = pickle.load(f_in)
+
+            except FileNotFoundError:
+                continue
+
+            os.utime(path)
+            return True, value
+
+        return False, None
+
+    def put(self, key, value):
+        """
+        Store a value, then evict old entries if the cache is too large.
+        Writes go through a temporary file so concurrent workers never see a
+        partial entry.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        with NamedTemporaryFile(dir=self.directory, delete=False) as f_out:
+            try:
+                if isinstance(value, np.ndarray) and value.dtype != object:
+                    suffix = ".npy"
+                    np.save(f_out, value, allow_pickle=False)
+                else:
+                    suffix = ".pkl"
+                    pickler = pickle.Pickler(f_out, pickle.HIGHEST_PROTOCOL)
+                    pickler.dispatch_table = DISPATCH_TABLE
+                    pickler.dump(value)
+
+            except (pickle.PicklingError, TypeError, AttributeError):
+                os.unlink(f_out.name)
+                return
+
+        os.replace(f_out.name, self.directory / f"{key}{suffix}")
+        self.evict()
+
+    def evict(self):
+        """
+        Remove least recently used entries until the total size fits.
+        """
+        entries = []
+
+        for path in self.directory.iterdir():
+            if path.suffix in (".npy", ".pkl"):
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def cached(self, function, source_digest):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            key = self.get_key(source_digest, args, kwargs)
+            hit, value = self.get(key)
+
+            if not hit:
+                value = function(*args, **kwargs)
+                self.put(key, value)
+
+            return value
+
+        return wrapper
+
+    @contextmanager
+    def patch(self, module):
+        """
+        Replace the module's parse() with a cached version for the duration of
+        the context.  Modules without a parse() are left alone.
+        """
+        parse = getattr(module, "parse", None)
+
+        if parse is None:
+            yield self
+            return
+
+        source_digest = get_source_digest(module, parse)
+        module.parse = self.cached(parse, source_digest)
+
+        try:
+            yield self
+
+        finally:
+            module.parse = parse
+
+
+def reduce_vector_tuple(vector):
+    """
+    VectorTuple.__new__ takes the elements as separate arguments, so the
+    default tuple reduction would unpickle (1, 2) as ((1, 2),).
+    """
+    return VectorTuple, tuple(vector)
+
+
+DISPATCH_TABLE = copyreg.dispatch_table | {VectorTuple: reduce_vector_tuple}
+
+
+def get_source_digest(module, parse):
+    """
+    Hash the solver file, the source of parse(), which covers parsers imported
+    from elsewhere such as aoc_data_structures.grid_helpers, and the aoc_utils
+    modules the solver uses, which parse() may call into.
+    """
+    digest = sha256(Path(module.__file__).read_bytes())
+    digest.update(getsource(parse).encode("utf-8"))
+
+    for path in get_helper_files(module):
+        digest.update(path.read_bytes())
+
+    return digest.digest()
+
+
+def get_helper_files(module):
+    """
+    Find the files of the aoc_utils modules a module uses, directly or through
+    other aoc_utils modules, from the modules, functions and classes in its
+    namespace.
+    """
+    package = __name__.partition(".")[0]
+    seen = set()
+    pending = [module]
+
+    while pending:
+        for value in list(vars(pending.pop()).values()):
+            if isinstance(value, ModuleType):
+                name = value.__name__
+            else:
+                name = getattr(value, "__module__", None)
+
+            if not isinstance(name, str) or name.partition(".")[0] != package:
+                continue
+
+            helper = sys.modules.get(name)
+
+            if helper is not None and helper not in seen:
+                seen.add(helper)
+                pending.append(helper)
+
+    return sorted(
+        Path(helper.__file__) for helper in seen if getattr(helper, "__file__", None)
+    )
+
+
+def update_digest(digest, value):
+    """
+    Hash parse() input.  Strings and lists of lines (the output of read_file)
+    are hashed directly, anything else is pickled first.
+    """
+    if isinstance(value, str):
+        digest.update(value.encode("utf-8"))
+
+    elif isinstance(value, list) and all(isinstance(item, str) for item in value):
+        for item in value:
+            digest.update(item.encode("utf-8"))
+            digest.update(b"\0")
+
+    else:
+        digest.update(pickle.dumps(value))
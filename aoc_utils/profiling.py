@@ -0,0 +1,146 @@
+"""
+Profile solver cases with cProfile.
+
+With --profile the runner profiles every case and writes <stem>.pstats,
+loadable with pstats or snakeviz, and <stem>.collapsed in the collapsed stack
+format read by flamegraph.pl and speedscope.  The most expensive functions of
+each case are printed after the run.
+
+cProfile records caller/callee pairs rather than full stacks, so the collapsed
+stacks are rebuilt from the call graph.  A function's time is split across its
+callers in proportion to the time it spent under each of them, which is exact
+for functions with a single caller and an estimate otherwise.
+"""
+
+import cProfile
+import pstats
+import sys
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+from .solvers import ROOT
+
+PROFILE_DIR = ROOT / "profile_output"
+
+# stop following call paths which account for less than this many seconds
+MIN_STACK_TIME = 1e-6
+
+
+def get_stem(solver, case):
+    """
+    Get a file stem for a case, ex. "20_1_input_2_100".
+    """
+    parts = [str(solver.day), str(solver.part), Path(case.filename).stem]
+    parts.extend(str(value) for _, value in case.kwargs)
+    return "_".join(parts)
+
+
+@contextmanager
+def profiled(solver, case, directory):
+    """
+    Profile the body of the context and write the stats when it exits, even if
+    the case raised or timed out.  Does nothing if directory is None.
+    """
+    if directory is None:
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+
+    try:
+        yield
+
+    finally:
+        profiler.disable()
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        stem = get_stem(solver, case)
+        profiler.dump_stats(directory / f"{stem}.pstats")
+        write_collapsed(pstats.Stats(profiler), directory / f"{stem}.collapsed")
+
+
+def get_label(function):
+    """
+    Format a pstats function key, ex. "is_loop (solve_2.py:33)".
+    """
+    filename, lineno, name = function
+
+    if filename == "~":
+        return name
+
+    return f"{name} ({Path(filename).name}:{lineno})"
+
+
+def get_collapsed(stats):
+    """
+    Rebuild call stacks from the caller/callee pairs of a pstats.Stats.  Return
+    a dict mapping each stack, as a tuple of functions from the root, to the
+    time spent in its last function.
+    """
+    entries = stats.stats
+    callees = defaultdict(list)
+
+    for function, (_, _, _, _, callers) in entries.items():
+        for caller, (_, _, _, cumtime) in callers.items():
+            callees[caller].append((function, cumtime))
+
+    # each item is (function, stack, share of function's time on this stack)
+    queue = [
+        (function, (function,), 1.0)
+        for function, entry in entries.items()
+        if not any(caller in entries for caller in entry[4])
+    ]
+    stacks = defaultdict(float)
+
+    while queue:
+        function, stack, share = queue.pop()
+        stacks[stack] += entries[function][2] * share
+
+        for callee, cumtime in callees[function]:
+            total = entries[callee][3]
+
+            if callee in stack or total <= 0 or share * cumtime < MIN_STACK_TIME:
+                continue
+
+            queue.append((callee, stack + (callee,), share * cumtime / total))
+
+    return stacks
+
+
+def write_collapsed(stats, path):
+    """
+    Write stacks in the collapsed format, one "frame;frame;frame count" line
+    per stack with the count in microseconds.
+    """
+    with open(path, "w", encoding="utf-8") as f_out:
+        for stack, seconds in get_collapsed(stats).items():
+            microseconds = round(seconds * 1e6)
+
+            if microseconds > 0:
+                frames = ";".join(get_label(f).replace(";", ",") for f in stack)
+                f_out.write(f"{frames} {microseconds}\n")
+
+
+def report(tasks, directory=PROFILE_DIR, count=20, file=sys.stdout):
+    """
+    Print the count functions with the most internal time for each profiled
+    (solver, case) pair.
+    """
+    for solver, case in tasks:
+        path = Path(directory) / f"{get_stem(solver, case)}.pstats"
+
+        if not path.exists():
+            continue
+
+        stats = pstats.Stats(str(path))
+        print(f"\n{solver.name}:{case.filename}  {stats.total_tt:.3f}s", file=file)
+        print(f"{'ncalls':>12}{'tottime':>10}{'cumtime':>10}  function", file=file)
+        ranked = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)
+
+        for function, (_, ncalls, tottime, cumtime, _) in ranked[:count]:
+            print(
+                f"{ncalls:>12}{tottime:>10.3f}{cumtime:>10.3f}  {get_label(function)}",
+                file=file,
+            )
@@ -0,0 +1,72 @@
+"""
+Bulk parsing of ragged rows of integers.
+
+Inputs like day 2 have one list of whitespace separated integers per line, with
+lines of different lengths.  Instead of splitting each line into a python list,
+every number is parsed in one pass and scattered into a 2-D int64 array padded
+to the longest row, with the length of each row alongside.  Row-wise checks
+then run over the whole input at once, masking columns past each row's length.
+
+Solvers importing this module need the repository root on the path when run
+standalone, ex. `PYTHONPATH=.. ./solve.py` from a day directory.
+"""
+
+import numpy as np
+
+WHITESPACE = np.frombuffer(b" \t\r\n", dtype=np.uint8)
+NEWLINE = ord("\n")
+
+
+def to_ragged(data, fill=0):
+    """
+    Parse lines of whitespace separated integers held in a str or bytes-like
+    object.  Return a (rows, longest row) int64 array padded with fill, and the
+    length of each row.  Blank lines are skipped rather than returned as empty
+    rows.
+
+    ex input:
+        "1 2 3\\n4 5\\n"
+
+    returns:
+        (
+            [
+                [1, 2, 3],
+                [4, 5, 0],
+            ],
+            [3, 2],
+        )
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    space = np.isin(buffer, WHITESPACE)
+
+    # a number starts at every non-space byte following a space
+    starts = np.flatnonzero(~space & np.concatenate(([True], space[:-1])))
+
+    # fromstring doesn't return an empty array for input which is all space
+    if starts.size == 0:
+        return np.full((0, 0), fill, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    numbers = np.fromstring(data, dtype=np.int64, sep=" ")
+
+    if numbers.size != starts.size:
+        raise ValueError("expected whitespace separated integers")
+
+    # number the lines holding numbers, a trailing line without a newline
+    # falls past the last newline
+    lines = np.searchsorted(np.flatnonzero(buffer == NEWLINE), starts)
+    rows = np.cumsum(np.diff(lines, prepend=-1) > 0) - 1
+    lengths = np.bincount(rows)
+    columns = np.arange(numbers.size) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    array = np.full((lengths.size, lengths.max(initial=0)), fill, dtype=np.int64)
+    array[rows, columns] = numbers
+    return array, lengths
+
+
+def get_mask(lengths, width):
+    """
+    Get a (rows, width) mask of the columns within each row's length.
+    """
+    return np.arange(width) < np.asarray(lengths)[:, np.newaxis]
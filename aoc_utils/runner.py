@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+
+"""
+Run every solver case across a process pool and report per-case results and
+wall time.
+
+Each main() call from a solver's __main__ block is a separate task, so the
+total wall time is bounded by the slowest case rather than the sum.  Puzzle
+inputs are submitted before test files since they dominate the runtime.
+
+usage:
+    python -m aoc_utils.runner
+    python -m aoc_utils.runner --days 6 20 --inputs-only --timeout 120
+    python -m aoc_utils.runner --parse-cache
+    python -m aoc_utils.runner --days 6 --profile --top 10
+    python -m aoc_utils.runner --days 16 19 --counters
+"""
+
+import os
+import signal
+import sys
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import (
+    ExitStack,
+    contextmanager,
+    nullcontext,
+    redirect_stderr,
+    redirect_stdout,
+)
+from dataclasses import dataclass, field
+from io import StringIO
+from pathlib import Path
+from time import perf_counter
+
+from . import counters, profiling
+from .parse_cache import ParseCache
+from .solvers import discover
+
+
+@dataclass
+class Outcome:
+    """
+    Status is one of:
+        pass:     result matched the expected value
+        fail:     result didn't match the expected value
+        solved:   no expected value, the result is reported as-is
+        missing:  the input file doesn't exist
+        timeout:  the case exceeded the time limit
+        error:    the solver raised, result holds the exception
+
+    counters holds the solver's aoc_utils.counters when counting is enabled.
+    """
+
+    solver: object
+    case: object
+    status: str
+    result: object = None
+    elapsed: float = 0.0
+    counters: dict = field(default_factory=dict)
+
+    @property
+    def ok(self):
+        return self.status in ("pass", "solved", "missing")
+
+
+@contextmanager
+def time_limit(seconds):
+    """
+    Raise TimeoutError in the current process after the given number of
+    seconds.  Pool workers execute tasks on their main thread, so an interval
+    timer can interrupt a runaway solver without killing the worker.
+    """
+    if seconds is None:
+        yield
+        return
+
+    def handler(signum, frame):
+        raise TimeoutError
+
+    previous = signal.signal(signal.SIGALRM, handler)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+
+    try:
+        yield
+
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def run_case(
+    solver, case, timeout=None, parse_cache=None, profile_dir=None, count=False
+):
+    """
+    Run a single case, discarding anything the solver prints.  parse() results
+    are read from and stored in parse_cache if one is given, the case is
+    profiled into profile_dir if one is given, and counters are collected if
+    count is set.
+    """
+    if not solver.filename(case).exists():
+        return Outcome(solver, case, "missing")
+
+    counts = {}
+    start = perf_counter()
+
+    try:
+        with ExitStack() as stack:
+            stack.enter_context(time_limit(timeout))
+            stack.enter_context(redirect_stdout(StringIO()))
+            stack.enter_context(redirect_stderr(StringIO()))
+            stack.enter_context(cache_parse(solver, parse_cache))
+            stack.enter_context(counters.counting(count, counts))
+            solver.module()  # keep the import out of the profile
+            stack.enter_context(profiling.profiled(solver, case, profile_dir))
+            result = solver.run(case)
+
+    except TimeoutError:
+        return Outcome(
+            solver, case, "timeout", elapsed=perf_counter() - start, counters=counts
+        )
+
+    except Exception as error:  # pylint: disable=broad-except
+        return Outcome(
+            solver, case, "error", repr(error), perf_counter() - start, counts
+        )
+
+    return Outcome(
+        solver, case, get_status(case, result), result, perf_counter() - start, counts
+    )
+
+
+def cache_parse(solver, parse_cache):
+    if parse_cache is None:
+        return nullcontext()
+
+    return parse_cache.patch(solver.module())
+
+
+def get_status(case, result):
+    if case.expected is None:
+        return "solved"
+
+    return "pass" if result == case.expected else "fail"
+
+
+def get_tasks(solvers, tests=True, inputs=True):
+    """
+    Gather (solver, case) pairs with puzzle inputs ordered ahead of test files.
+    """
+    tasks = []
+
+    for solver in solvers:
+        for case in solver.cases:
+            if (case.is_test and tests) or (not case.is_test and inputs):
+                tasks.append((solver, case))
+
+    return sorted(tasks, key=lambda task: task[1].is_test)
+
+
+def run(
+    solvers,
+    tests=True,
+    inputs=True,
+    workers=None,
+    timeout=None,
+    parse_cache=None,
+    profile_dir=None,
+    count=False,
+):
+    """
+    Run the selected cases across a process pool.  Outcomes are returned in
+    day/part order.
+    """
+    tasks = get_tasks(solvers, tests, inputs)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                run_case, solver, case, timeout, parse_cache, profile_dir, count
+            )
+            for solver, case in tasks
+        ]
+        outcomes = [future.result() for future in futures]
+
+    return sorted(outcomes, key=get_order)
+
+
+def get_order(outcome):
+    return (
+        outcome.solver.day,
+        outcome.solver.part,
+        outcome.solver.cases.index(outcome.case),
+    )
+
+
+def report(outcomes, wall_time, file=sys.stdout):
+    print(f"{'solver':<14}{'file':<14}{'status':<9}{'time':>10}  result", file=file)
+
+    for outcome in outcomes:
+        print(
+            f"{outcome.solver.name:<14}"
+            f"{outcome.case.filename:<14}"
+            f"{outcome.status:<9}"
+            f"{outcome.elapsed:>9.3f}s"
+            f"  {'' if outcome.result is None else outcome.result}",
+            file=file,
+        )
+
+    total = sum(outcome.elapsed for outcome in outcomes)
+    print(f"\nwall time:  {wall_time:.3f}s", file=file)
+    print(f"case time:  {total:.3f}s", file=file)
+
+
+def get_parser():
+    parser = ArgumentParser(description="Run every solver in a process pool.")
+    parser.add_argument("--days", type=int, nargs="+", help="days to run")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count(), help="worker processes"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=600, help="per-case time limit in seconds"
+    )
+    parser.add_argument(
+        "--parse-cache", action="store_true", help="reuse cached parse() results"
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="profile each case with cProfile"
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=profiling.PROFILE_DIR,
+        help="where to write .pstats and .collapsed files",
+    )
+    parser.add_argument(
+        "--top", type=int, default=20, help="functions to list per profiled case"
+    )
+    parser.add_argument(
+        "--counters", action="store_true", help="report search counters"
+    )
+    selection = parser.add_mutually_exclusive_group()
+    selection.add_argument("--tests-only", action="store_true")
+    selection.add_argument("--inputs-only", action="store_true")
+    return parser
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    solvers = discover(args.days)
+
+    start = perf_counter()
+    outcomes = run(
+        solvers,
+        tests=not args.inputs_only,
+        inputs=not args.tests_only,
+        workers=args.workers,
+        timeout=args.timeout,
+        parse_cache=ParseCache() if args.parse_cache else None,
+        profile_dir=args.profile_dir if args.profile else None,
+        count=args.counters,
+    )
+    report(outcomes, perf_counter() - start)
+
+    if args.counters:
+        counters.report(
+            (f"{outcome.solver.name}:{outcome.case.filename}", outcome.counters)
+            for outcome in outcomes
+        )
+
+    if args.profile:
+        tasks = [(outcome.solver, outcome.case) for outcome in outcomes]
+        profiling.report(tasks, args.profile_dir, args.top)
+
+    return 0 if all(outcome.ok for outcome in outcomes) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+
+"""
+Measure how each solver scales with the size of its input.
+
+Inputs are produced by the generators for a ladder of sizes per day and each
+puzzle input case is timed on them.  Once a case times out the larger sizes are
+skipped.  Timeouts and errors, including generator errors, are reported
+separately from the measurements.  The growth exponent k of runtime ~ bytes**k
+is estimated from a log-log fit, results are written to scaling.json and, when
+matplotlib is installed, plotted to scaling.png.
+
+usage:
+    python -m aoc_utils.scaling
+    python -m aoc_utils.scaling --days 6 12 --sizes 100 300 1000 --timeout 120
+"""
+
+import json
+import sys
+from argparse import ArgumentParser
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import replace
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import numpy as np
+
+from .bench import get_key
+from .generators import generate, get_kwargs
+from .runner import time_limit
+from .solvers import ROOT, discover
+
+OUTPUT_DIR = ROOT / "scaling_output"
+
+SIZES = {
+    1: (10**4, 10**5, 10**6),
+    2: (10**4, 10**5, 10**6),
+    3: (10**4, 10**5, 10**6),
+    4: (100, 300, 1000, 3000),
+    5: (10**3, 10**4, 10**5),
+    6: (30, 100, 300, 1000),
+    7: (10**3, 10**4, 10**5),
+    8: (100, 300, 1000, 3000),
+    9: (10**4, 10**5, 10**6),
+    10: (100, 300, 1000, 3000),
+    11: (10, 100, 1000, 10**4),
+    12: (100, 300, 1000, 5000),
+    13: (100, 1000, 10**4),
+    14: (500, 1000, 10**4),
+    15: (50, 100, 200, 400),
+    16: (101, 201, 401, 801),
+    17: (10, 100, 1000),
+    18: (71, 141, 281, 561),
+    19: (400, 4000, 40000),
+    20: (101, 201, 401, 801),
+    21: (10, 100, 1000, 10**4),
+    22: (10**3, 10**4, 10**5),
+    23: (520, 2000, 8000),
+    24: (45, 90, 180, 256),
+    25: (500, 2000, 8000),
+}
+
+
+def time_case(solver, case, filename, timeout):
+    """
+    Time a single run of a case on a generated input.  Return the seconds
+    taken and None, or None and "timeout" or the repr of the exception raised.
+    """
+    start = perf_counter()
+
+    try:
+        with time_limit(timeout), redirect_stdout(StringIO()), redirect_stderr(
+            StringIO()
+        ):
+            solver.run(case, filename)
+
+    except TimeoutError:
+        return None, "timeout"
+
+    except Exception as error:  # pylint: disable=broad-except
+        return None, repr(error)
+
+    return perf_counter() - start, None
+
+
+def write_input(filename, day, size, seed):
+    """
+    Generate an input unless an earlier solver of the day already did.  Return
+    the repr of the exception if the generator raised.
+    """
+    if filename.exists():
+        return None
+
+    try:
+        filename.write_text(generate(day, size, seed), "utf-8")
+
+    except Exception as error:  # pylint: disable=broad-except
+        return f"generator: {error!r}"
+
+    return None
+
+
+def scale(solvers, sizes=None, timeout=60, seed=0):
+    """
+    Time the puzzle input cases of each solver on generated inputs of
+    increasing size.  Returns a dict mapping case keys to a list of
+    {size, bytes, seconds} measurements, and a dict mapping case keys to the
+    {size, error} which ended their ladder.
+    """
+    results = {}
+    failures = {}
+
+    with TemporaryDirectory() as directory:
+        for solver in solvers:
+            cases = [case for case in solver.cases if not case.is_test]
+            exhausted = set()
+            solver.module()  # keep the import out of the first measurement
+
+            for size in sizes or SIZES[solver.day]:
+                filename = Path(directory) / f"{solver.day}_{size}.txt"
+
+                error = write_input(filename, solver.day, size, seed)
+
+                if error is not None:
+                    for key in {get_key(solver, case) for case in cases} - exhausted:
+                        exhausted.add(key)
+                        failures[key] = {"size": size, "error": error}
+
+                    continue
+
+                for case in cases:
+                    key = get_key(solver, case)
+
+                    if key in exhausted:
+                        continue
+
+                    kwargs = dict(case.kwargs) | get_kwargs(solver.day, size)
+                    seconds, error = time_case(
+                        solver,
+                        replace(case, kwargs=tuple(kwargs.items())),
+                        filename,
+                        timeout,
+                    )
+
+                    if error is not None:
+                        exhausted.add(key)
+                        failures[key] = {"size": size, "error": error}
+                        continue
+
+                    results.setdefault(key, []).append(
+                        {
+                            "size": size,
+                            "bytes": filename.stat().st_size,
+                            "seconds": seconds,
+                        }
+                    )
+
+    return results, failures
+
+
+def get_exponent(measurements):
+    """
+    Fit runtime ~ bytes**k and return k, or None with fewer than 2 points.
+    """
+    if len(measurements) < 2:
+        return None
+
+    x = np.log([measurement["bytes"] for measurement in measurements])
+    y = np.log([measurement["seconds"] for measurement in measurements])
+    return float(np.polyfit(x, y, 1)[0])
+
+
+def plot(results, path):
+    """
+    Plot runtime against input bytes on log-log axes.  matplotlib is optional,
+    return False if it isn't installed.
+    """
+    try:
+        import matplotlib  # pylint: disable=import-outside-toplevel
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
+    except ImportError:
+        return False
+
+    figure, axes = plt.subplots(figsize=(12, 8))
+
+    for key, measurements in results.items():
+        axes.loglog(
+            [measurement["bytes"] for measurement in measurements],
+            [measurement["seconds"] for measurement in measurements],
+            marker="o",
+            label=key,
+        )
+
+    axes.set_xlabel("input bytes")
+    axes.set_ylabel("seconds")
+    axes.legend(fontsize="x-small", ncol=2)
+    figure.savefig(path, dpi=150)
+    plt.close(figure)
+    return True
+
+
+def report(results, failures=None, file=sys.stdout):
+    print(f"{'case':<40}{'sizes':>24}{'max seconds':>14}{'exponent':>10}", file=file)
+
+    for key, measurements in results.items():
+        exponent = get_exponent(measurements)
+        sizes = ",".join(str(measurement["size"]) for measurement in measurements)
+        print(
+            f"{key:<40}{sizes:>24}{measurements[-1]['seconds']:>14.3f}"
+            f"{'' if exponent is None else f'{exponent:.2f}':>10}",
+            file=file,
+        )
+
+    failures = failures or {}
+
+    for title, timed_out in (("timeouts", True), ("errors", False)):
+        rows = [
+            (key, failure)
+            for key, failure in failures.items()
+            if (failure["error"] == "timeout") == timed_out
+        ]
+
+        if rows:
+            print(f"\n{title}", file=file)
+
+        for key, failure in rows:
+            print(f"{key:<40}{failure['size']:>10}  {failure['error']}", file=file)
+
+
+def get_parser():
+    parser = ArgumentParser(description="Time solvers on generated inputs.")
+    parser.add_argument("--days", type=int, nargs="+", help="days to measure")
+    parser.add_argument("--sizes", type=int, nargs="+", help="override size ladders")
+    parser.add_argument(
+        "--timeout", type=float, default=60, help="per-run time limit in seconds"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    return parser
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    results, failures = scale(discover(args.days), args.sizes, args.timeout, args.seed)
+    report(results, failures)
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+
+    with open(args.output_dir / "scaling.json", "w", encoding="utf-8") as f_out:
+        json.dump(
+            {
+                key: {
+                    "exponent": get_exponent(results.get(key, [])),
+                    "runs": results.get(key, []),
+                    "failure": failures.get(key),
+                }
+                for key in dict.fromkeys([*results, *failures])
+            },
+            f_out,
+            indent=2,
+        )
+
+    if not plot(results, args.output_dir / "scaling.png"):
+        print("matplotlib not installed, skipping plot")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Discovery and loading of the daily solver modules.
+
+Each day lives in a numbered directory containing a solve.py and usually a
+solve2.py or solve_2.py for part 2.  Every solver follows the
+read_file/parse/solve/main contract of the root solve.py template, and its
+__main__ block lists the main() calls used to check the test files and to solve
+the puzzle input.  Those calls are read from the source, so the expected values
+stay in one place.
+"""
+
+import ast
+import re
+import sys
+from dataclasses import dataclass
+from functools import cache
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+from .lazy import defer
+
+ROOT = Path(__file__).resolve().parent.parent
+SOLVER_PATTERN = re.compile(r"solve_?(?P<part>2)?\.py")
+
+
+@dataclass(frozen=True)
+class Case:
+    """
+    A single main() call from a solver's __main__ block.  kwargs holds the
+    day-specific arguments (steps, size, depth, ...) as (name, value) pairs.
+    """
+
+    filename: str
+    kwargs: tuple = ()
+    expected: object = None
+
+    @property
+    def is_test(self):
+        return self.filename.startswith("test")
+
+
+@dataclass(frozen=True)
+class Solver:
+    day: int
+    part: int
+    path: Path
+    cases: tuple = ()
+
+    @property
+    def name(self):
+        return f"{self.day}/{self.path.name}"
+
+    def module(self):
+        return load_module(self.path)
+
+    def filename(self, case):
+        """
+        Resolve a case filename relative to the day directory so the solver
+        doesn't depend on the current working directory.
+        """
+        return self.path.parent / case.filename
+
+    def run(self, case, filename=None):
+        """
+        Call main() for the case and return the result as a builtin type.
+        """
+        filename = self.filename(case) if filename is None else filename
+        result = self.module().main(str(filename), **dict(case.kwargs))
+        return to_builtin(result)
+
+
+def discover(days=None, root=ROOT):
+    """
+    Find every solver below root, optionally restricted to the given days.
+    Solvers are ordered by day then part.
+    """
+    solvers = []
+
+    for path in root.glob("*/solve*.py"):
+        match = SOLVER_PATTERN.fullmatch(path.name)
+
+        if not path.parent.name.isdigit() or match is None:
+            continue
+
+        day = int(path.parent.name)
+
+        if days is not None and day not in days:
+            continue
+
+        part = 2 if match.group("part") else 1
+        solvers.append(Solver(day, part, path, get_cases(path)))
+
+    return sorted(solvers, key=lambda solver: (solver.day, solver.part))
+
+
+def get_cases(path):
+    """
+    Read the main() calls from the __main__ block of a solver.  Positional
+    arguments are bound to the parameter names of main().
+    """
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    parameters = get_main_parameters(tree)
+    cases = []
+
+    for call in get_main_calls(tree):
+        arguments = dict(zip(parameters, map(ast.literal_eval, call.args)))
+
+        for keyword in call.keywords:
+            arguments[keyword.arg] = ast.literal_eval(keyword.value)
+
+        filename = arguments.pop("filename")
+        expected = arguments.pop("expected", None)
+        cases.append(Case(filename, tuple(arguments.items()), expected))
+
+    return tuple(cases)
+
+
+def get_main_parameters(tree):
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == "main":
+            return [argument.arg for argument in node.args.args]
+
+    return []
+
+
+def get_main_calls(tree):
+    for node in tree.body:
+        if not is_main_guard(node):
+            continue
+
+        for statement in node.body:
+            if (
+                isinstance(statement, ast.Expr)
+                and isinstance(statement.value, ast.Call)
+                and isinstance(statement.value.func, ast.Name)
+                and statement.value.func.id == "main"
+            ):
+                yield statement.value
+
+
+def is_main_guard(node):
+    return (
+        isinstance(node, ast.If)
+        and isinstance(node.test, ast.Compare)
+        and isinstance(node.test.left, ast.Name)
+        and node.test.left.id == "__name__"
+    )
+
+
+@cache
+def load_module(path):
+    """
+    Import a solver by path.  The day directories aren't packages, so each
+    module gets a unique name based on its day and filename.  Modules are
+    cached so worker processes only pay the import cost once, and heavy
+    dependencies are deferred until first use.  Modules are registered in
+    sys.modules so objects of classes they define can be pickled.
+    """
+    defer()
+    name = f"aoc_day_{path.parent.name}_{path.stem}"
+    spec = spec_from_file_location(name, path)
+    module = module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def to_builtin(result):
+    """
+    Convert numpy scalars to the equivalent python type.  numpy is only looked
+    up if a solver already imported it, which keeps aoc_utils cheap to import.
+    """
+    numpy = sys.modules.get("numpy")
+
+    if numpy is not None and isinstance(result, numpy.generic):
+        return result.item()
+
+    return result
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+
+"""
+Measure the cold-start cost of every solver module and enforce a budget.
+
+Each solver is loaded in a fresh interpreter running with -X importtime.  The
+probe writes a marker to stderr before loading the solver, so only the imports
+made by the solver itself are attributed to it.  The load time (imports plus
+module body) is compared with the budget, and the run fails if any solver
+exceeds it.  By default solvers are loaded like a standalone script, so every
+import counts against the budget.  --lazy loads them the way the runner does,
+with the heavy modules in aoc_utils.lazy deferred; their cost then moves into
+solve() and is no longer measured here.
+
+usage:
+    python -m aoc_utils.startup
+    python -m aoc_utils.startup --days 13 23 24 --budget 0.3 --lazy
+"""
+
+import subprocess
+import sys
+from argparse import ArgumentParser
+from dataclasses import dataclass, field
+from time import perf_counter
+
+from .solvers import ROOT, discover
+
+MARKER = "-- aoc_utils.startup --"
+PROBE = """
+import sys
+from time import perf_counter
+from importlib.util import module_from_spec, spec_from_file_location
+{setup}
+sys.stderr.write({marker!r} + "\\n")
+start = perf_counter()
+spec = spec_from_file_location("solver", {path!r})
+module = module_from_spec(spec)
+spec.loader.exec_module(module)
+print(perf_counter() - start)
+"""
+LAZY_SETUP = "from aoc_utils.lazy import defer\ndefer()"
+
+
+@dataclass
+class Startup:
+    """
+    wall:     process wall time including interpreter startup
+    load:     time to execute the solver module, including its imports
+    imports:  (cumulative seconds, module) for each top-level import
+    """
+
+    wall: float
+    load: float
+    imports: list = field(default_factory=list)
+
+
+def probe(path, lazy=False):
+    """
+    Load a solver in a fresh interpreter and parse its import times.
+    """
+    code = PROBE.format(setup=LAZY_SETUP if lazy else "", marker=MARKER, path=str(path))
+    start = perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        cwd=ROOT,
+        text=True,
+    )
+    wall = perf_counter() - start
+    return Startup(
+        wall, float(process.stdout.strip()), parse_importtime(process.stderr)
+    )
+
+
+def parse_importtime(stderr):
+    """
+    Parse -X importtime output following the marker.  Only top-level imports
+    are kept, nested imports are included in their parent's cumulative time.
+
+    ex line:
+        import time:      2630 |     292898 | numpy
+    """
+    imports = []
+    _, _, stderr = stderr.partition(MARKER)
+
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+
+        if name.startswith("  "):
+            continue
+
+        imports.append((int(cumulative) / 1e6, name.strip()))
+
+    return sorted(imports, reverse=True)
+
+
+def measure(solvers, lazy=False, repeat=3):
+    """
+    Probe each solver repeat times, keeping the fastest run to reduce the noise
+    from a cold filesystem cache.
+    """
+    startups = {}
+
+    for solver in solvers:
+        runs = [probe(solver.path, lazy) for _ in range(repeat)]
+        startups[solver.name] = min(runs, key=lambda startup: startup.load)
+
+    return startups
+
+
+def get_interpreter_time(repeat=3):
+    """
+    Get the wall time of an interpreter which does nothing, for reference.
+    """
+    times = []
+
+    for _ in range(repeat):
+        start = perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        times.append(perf_counter() - start)
+
+    return min(times)
+
+
+def report(startups, budget, interpreter, file=sys.stdout):
+    print(f"interpreter:  {interpreter:.3f}s\n", file=file)
+    print(f"{'solver':<16}{'wall':>8}{'load':>8}  top imports", file=file)
+
+    for name, startup in startups.items():
+        imports = ", ".join(
+            f"{module} {seconds:.3f}" for seconds, module in startup.imports[:3]
+        )
+        flag = "  OVER BUDGET" if startup.load > budget else ""
+        print(
+            f"{name:<16}{startup.wall:>8.3f}{startup.load:>8.3f}  {imports}{flag}",
+            file=file,
+        )
+
+
+def get_parser():
+    parser = ArgumentParser(description="Measure solver import times.")
+    parser.add_argument("--days", type=int, nargs="+", help="days to measure")
+    parser.add_argument(
+        "--budget", type=float, default=0.5, help="maximum load time in seconds"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="probes per solver")
+    parser.add_argument(
+        "--lazy", action="store_true", help="defer heavy imports like the runner"
+    )
+    return parser
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    startups = measure(discover(args.days), args.lazy, args.repeat)
+    report(startups, args.budget, get_interpreter_time(args.repeat))
+
+    over = [name for name, startup in startups.items() if startup.load > args.budget]
+
+    if over:
+        print(f"\n{len(over)} solver(s) over the {args.budget:.3f}s budget")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+"""
+Helpers for tests which need solvers of their own.
+"""
+
+import tempfile
+import textwrap
+from pathlib import Path
+
+from ..solvers import Solver, get_cases
+
+
+def make_solver(directory, source, day=1, name="solve.py"):
+    """
+    Write a solver into a numbered day directory below directory and return
+    it.  The day directory is made unique, so each solver is a fresh module.
+    """
+    day_dir = Path(tempfile.mkdtemp(dir=directory)) / str(day)
+    day_dir.mkdir()
+    path = day_dir / name
+    path.write_text(textwrap.dedent(source), "utf-8")
+    part = 2 if "2" in path.stem else 1
+    return Solver(day, part, path, get_cases(path))
@@ -0,0 +1,69 @@
+import json
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from .. import batch
+
+INPUTS = ("3 4\n4 3\n2 5\n1 3\n3 9\n3 3\n", "1 1\n")
+ANSWERS = {
+    (1, "0.txt"): 11,
+    (2, "0.txt"): 31,
+    (1, "1.txt"): 0,
+    (2, "1.txt"): 1,
+}
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        for idx, data in enumerate(INPUTS):
+            (Path(self.directory.name) / f"{idx}.txt").write_text(data, "utf-8")
+
+    def run_main(self, *argv):
+        stdout = StringIO()
+
+        with redirect_stdout(stdout), redirect_stderr(StringIO()):
+            status = batch.main(["1", self.directory.name, "--workers", "1", *argv])
+
+        return status, stdout
+
+    def check_records(self, lines):
+        records = [json.loads(line) for line in lines]
+        self.assertEqual(
+            {
+                (record["part"], Path(record["file"]).name): record["result"]
+                for record in records
+            },
+            ANSWERS,
+        )
+
+    def test_stdout(self):
+        status, stdout = self.run_main()
+        self.assertEqual(status, 0)
+        self.assertFalse(stdout.closed)
+        self.check_records(stdout.getvalue().splitlines())
+
+    def test_output(self):
+        output = Path(self.directory.name) / "results.jsonl"
+        status, stdout = self.run_main("--output", str(output))
+        self.assertEqual(status, 0)
+        self.assertEqual(stdout.getvalue(), "")
+        self.check_records(output.read_text("utf-8").splitlines())
+
+    def test_parse_kwargs(self):
+        self.assertEqual(
+            batch.parse_kwargs(["depth=25", "name='a'"]), {"depth": 25, "name": "a"}
+        )
+
+    def test_get_inputs(self):
+        inputs = batch.get_inputs([self.directory.name, f"{self.directory.name}/0*"])
+        self.assertEqual([path.name for path in inputs], ["0.txt", "1.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from .. import bench
+from .support import make_solver
+
+SOURCE = """
+    def solve(numbers):
+        return sum(numbers)
+
+
+    def parse(data):
+        return [int(line) for line in data.split()]
+
+
+    def read_file(filename):
+        with open(filename, encoding="utf-8") as f_in:
+            return f_in.read()
+
+
+    def main(filename, expected=None):
+        result = solve(parse(read_file(filename)))
+        if expected is not None:
+            assert result == expected
+        return result
+
+
+    if __name__ == "__main__":
+        main("test_0.txt", 6)
+        main("missing.txt")
+"""
+
+SLOW_SOURCE = """
+    import time
+
+
+    def main(filename, expected=None):
+        time.sleep(0.1)
+        return 1
+
+
+    if __name__ == "__main__":
+        main("test_0.txt")
+"""
+
+
+def get_run(seconds):
+    return {
+        "results": {
+            "1/solve.py:test_0.txt": {
+                stage: {"best": seconds} for stage in bench.STAGES + ("main",)
+            }
+        }
+    }
+
+
+class TestBench(unittest.TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.solver = make_solver(self.directory.name, SOURCE)
+        (self.solver.path.parent / "test_0.txt").write_text("1\n2\n3\n", "utf-8")
+
+    def test_bench(self):
+        results = bench.bench([self.solver], tests=True, repeat=2, warmup=0)
+        self.assertEqual(results["1/solve.py:missing.txt"], {"error": "missing"})
+        timings = results["1/solve.py:test_0.txt"]
+        self.assertEqual(set(timings), {*bench.STAGES, "main"})
+
+        for stage, timing in timings.items():
+            self.assertEqual(len(timing["samples"]), 2, stage)
+            self.assertLessEqual(timing["best"], timing["median"])
+
+    def test_timeout_per_run(self):
+        """
+        The timeout applies to each run, so a case whose runs together take
+        longer than the timeout is still timed.
+        """
+        solver = make_solver(self.directory.name, SLOW_SOURCE)
+        (solver.path.parent / "test_0.txt").write_text("", "utf-8")
+        results = bench.bench([solver], tests=True, repeat=3, warmup=1, timeout=0.3)
+        timings = results["1/solve.py:test_0.txt"]
+        self.assertNotIn("error", timings)
+        self.assertEqual(len(timings["main"]["samples"]), 3)
+
+        results = bench.bench([solver], tests=True, repeat=1, warmup=0, timeout=0.05)
+        self.assertEqual(results["1/solve.py:test_0.txt"], {"error": "timeout"})
+
+    def test_inputs_only(self):
+        self.assertEqual(list(bench.bench([self.solver])), ["1/solve.py:missing.txt"])
+
+    def test_patch_restores(self):
+        module = self.solver.module()
+        parse = module.parse
+
+        with bench.StageTimer().patch(module) as timer:
+            self.assertEqual(module.parse("1 2"), [1, 2])
+
+        self.assertIs(module.parse, parse)
+        self.assertEqual(set(timer.times), {"parse"})
+
+    def test_get_key(self):
+        case = self.solver.cases[0]
+        self.assertEqual(bench.get_key(self.solver, case), "1/solve.py:test_0.txt")
+
+    def test_history(self):
+        path = Path(self.directory.name) / "history.json"
+        history = bench.load_history(path)
+        self.assertEqual(history, {})
+
+        bench.record(history, "a", get_run(1.0)["results"])
+        bench.record(history, "b", get_run(2.0)["results"])
+        bench.record(history, "a", {})
+        bench.save_history(history, path)
+        history = bench.load_history(path)
+
+        # a rerun moves its commit to the end and keeps earlier results
+        self.assertEqual(list(history), ["b", "a"])
+        self.assertIn("1/solve.py:test_0.txt", history["a"]["results"])
+        self.assertEqual(bench.get_previous(history, "a")[0], "b")
+        self.assertEqual(bench.get_previous({}, "a"), (None, None))
+
+    def test_regressions(self):
+        results = get_run(1.5)["results"]
+        regressions = bench.get_regressions(results, get_run(1.0), threshold=0.1)
+        self.assertEqual(len(regressions), len(bench.STAGES) + 1)
+        self.assertEqual(bench.get_regressions(results, get_run(1.45), 0.1), [])
+
+        # changes below the noise floor are ignored however large relatively
+        tiny = get_run(bench.NOISE_FLOOR / 10)
+        self.assertEqual(bench.get_regressions(tiny["results"], get_run(0), 0.1), [])
+
+    def test_report(self):
+        results = get_run(1.5)["results"] | {"1/solve.py:x.txt": {"error": "timeout"}}
+        regressions = bench.get_regressions(results, get_run(1.0), 0.1)
+        output = StringIO()
+        bench.report("b", results, "a", regressions, 0.1, output)
+        self.assertIn("timeout", output.getvalue())
+        self.assertIn(
+            f"{len(regressions)} regression(s) beyond 10% versus a", output.getvalue()
+        )
+
+    def test_main(self):
+        """
+        A second run at the same commit has no previous run to compare with.
+        """
+        directory = Path(self.directory.name)
+        argv = ["--days", "1", "--tests", "--repeat", "1", "--warmup", "0"]
+        argv += ["--history", str(directory / "history.json")]
+        argv += ["--output", str(directory / "output.txt")]
+
+        for _ in range(2):
+            with redirect_stdout(StringIO()):
+                self.assertEqual(bench.main(argv), 0)
+
+        self.assertEqual(len(bench.load_history(directory / "history.json")), 1)
+        self.assertIn("no previous run", (directory / "output.txt").read_text("utf-8"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+from itertools import product
+
+import numpy as np
+from aoc_data_structures import VectorTuple
+
+from ..coords import DIAGONALS, ORTHOGONALS, PackedGrid
+
+SHAPES = ((1, 1), (1, 5), (5, 1), (3, 4), (4, 3))
+
+
+def get_coords(shape):
+    return list(product(range(shape[0]), range(shape[1])))
+
+
+class TestPackedGrid(unittest.TestCase):
+    def test_round_trip(self):
+        for shape in SHAPES:
+            packed = PackedGrid(shape)
+            indices = [packed.pack(coord) for coord in get_coords(shape)]
+            self.assertEqual(indices, list(range(packed.size)))
+
+            for index in indices:
+                self.assertEqual(packed.pack(packed.unpack(index)), index)
+
+    def test_flatten(self):
+        """
+        Cells keep the grid's item size, so large uint8 grids stay at a byte
+        per cell, and are a copy.
+        """
+        values = np.arange(12).reshape(3, 4)
+        grids = (
+            (values.astype(np.uint8), 1),
+            (values % 2 == 0, 1),
+            ((values - 6).astype(np.int32), 4),
+            (values - 6, 8),
+        )
+
+        for grid, itemsize in grids:
+            packed = PackedGrid(grid.shape)
+            cells = packed.flatten(grid)
+            self.assertEqual(memoryview(cells).itemsize, itemsize)
+
+            for coord in get_coords(grid.shape):
+                self.assertEqual(cells[packed.pack(coord)], grid[coord])
+
+            original = grid.copy()
+            cells[0] = 1
+            np.testing.assert_array_equal(grid, original)
+
+    def test_step(self):
+        for shape in SHAPES:
+            packed = PackedGrid(shape)
+
+            for coord, delta in product(get_coords(shape), ORTHOGONALS + DIAGONALS):
+                target = (coord[0] + delta[0], coord[1] + delta[1])
+                expected = packed.pack(target) if packed.valid(target) else -1
+                self.assertEqual(packed.step(packed.pack(coord), delta), expected)
+
+    def test_neighbours(self):
+        """
+        The neighbours match VectorTuple's, in the same order, and never wrap
+        onto the neighbouring row.
+        """
+        for shape in SHAPES:
+            grid = np.zeros(shape)
+            packed = PackedGrid(shape)
+
+            for coord in get_coords(shape):
+                index = packed.pack(coord)
+                vector = VectorTuple(*coord)
+
+                for name in ("orthogonals", "diagonals"):
+                    self.assertEqual(
+                        [packed.unpack(item) for item in getattr(packed, name)(index)],
+                        [tuple(item) for item in getattr(vector, name)(grid)],
+                    )
+
+    def test_table(self):
+        for shape in SHAPES:
+            packed = PackedGrid(shape)
+            table = packed.get_table(ORTHOGONALS + DIAGONALS)
+
+            for index, row in enumerate(table.tolist()):
+                self.assertEqual(
+                    row,
+                    [packed.step(index, delta) for delta in ORTHOGONALS + DIAGONALS],
+                )
+
+    def test_manhattan(self):
+        packed = PackedGrid((4, 5))
+        self.assertEqual(packed.manhattan(packed.pack((0, 4)), packed.pack((3, 0))), 7)
+        self.assertEqual(packed.manhattan(6, 6), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
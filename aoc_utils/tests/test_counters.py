@@ -0,0 +1,130 @@
+import unittest
+from io import StringIO
+from tempfile import TemporaryDirectory
+
+from .. import counters
+from ..counters import COUNTERS, counting, get_hit_rates
+from ..runner import run_case
+from ..solvers import discover
+from .support import make_solver
+
+SOURCE = """
+    from aoc_utils.counters import COUNTERS
+
+
+    def main(filename, expected=None):
+        if COUNTERS.enabled:
+            for size in (3, 7, 5):
+                COUNTERS.count("search.expanded")
+                COUNTERS.peak("search.queue_peak", size)
+
+            COUNTERS.count("memo.hit", 3)
+            COUNTERS.count("memo.miss")
+
+        return 1
+
+
+    if __name__ == "__main__":
+        main("input.txt")
+"""
+
+EXPECTED = {
+    "memo.hit": 3,
+    "memo.miss": 1,
+    "search.expanded": 3,
+    "search.queue_peak": 7,
+}
+
+
+class TestCounters(unittest.TestCase):
+    def test_snapshot(self):
+        instance = counters.Counters()
+        instance.count("a.expanded", 2)
+        instance.peak("a.queue_peak", 4)
+        instance.peak("a.queue_peak", 2)
+        self.assertEqual(instance.snapshot(), {"a.expanded": 2, "a.queue_peak": 4})
+
+        instance.reset()
+        self.assertEqual(instance.snapshot(), {})
+
+    def test_counting(self):
+        """
+        Counts start from zero in each context, and nothing is recorded
+        outside of one.
+        """
+        snapshots = []
+
+        for _ in range(2):
+            snapshot = {}
+
+            with counting(True, snapshot):
+                self.assertTrue(COUNTERS.enabled)
+                COUNTERS.count("a.expanded")
+
+            snapshots.append(snapshot)
+
+        self.assertFalse(COUNTERS.enabled)
+        self.assertEqual(snapshots, [{"a.expanded": 1}] * 2)
+
+        snapshot = {}
+
+        with counting(False, snapshot):
+            self.assertFalse(COUNTERS.enabled)
+
+        self.assertEqual(snapshot, {})
+
+    def test_hit_rates(self):
+        self.assertEqual(
+            get_hit_rates({"memo.hit": 3, "memo.miss": 1, "other.hit": 0}),
+            {"memo.hit_rate": 0.75, "other.hit_rate": 0.0},
+        )
+
+    def test_report(self):
+        output = StringIO()
+        counters.report([("empty", {}), ("case", EXPECTED)], output)
+        self.assertEqual(
+            output.getvalue().splitlines(),
+            [
+                "",
+                "counters",
+                "",
+                "case",
+                f"    {'memo.hit':<28}{3:>14}",
+                f"    {'memo.miss':<28}{1:>14}",
+                f"    {'search.expanded':<28}{3:>14}",
+                f"    {'search.queue_peak':<28}{7:>14}",
+                f"    {'memo.hit_rate':<28}{'75.0%':>14}",
+            ],
+        )
+
+        output = StringIO()
+        counters.report([("empty", {})], output)
+        self.assertEqual(output.getvalue(), "")
+
+    def test_run_case(self):
+        with TemporaryDirectory() as directory:
+            solver = make_solver(directory, SOURCE)
+            (solver.path.parent / "input.txt").write_text("", "utf-8")
+
+            for _ in range(2):
+                outcome = run_case(solver, solver.cases[0], count=True)
+                self.assertEqual(outcome.counters, EXPECTED)
+
+            self.assertEqual(run_case(solver, solver.cases[0]).counters, {})
+
+    def test_day_16(self):
+        """
+        The day 16 search counts are reproducible from run to run.
+        """
+        (solver,) = [solver for solver in discover([16]) if solver.part == 1]
+        case = solver.cases[0]
+        snapshots = [run_case(solver, case, count=True).counters for _ in range(2)]
+        self.assertEqual(snapshots[0], snapshots[1])
+        self.assertGreater(snapshots[0]["dijkstra.expanded"], 0)
+        self.assertGreaterEqual(
+            snapshots[0]["dijkstra.relaxed"], snapshots[0]["dijkstra.re_relaxed"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+from contextlib import redirect_stdout
+from dataclasses import replace
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from .. import generators
+from ..runner import run_case
+from ..solvers import discover
+
+# small sizes, so every part 1 solver finishes in well under a second
+SIZES = {
+    1: 100,
+    2: 100,
+    3: 100,
+    4: 20,
+    5: 20,
+    6: 20,
+    7: 20,
+    8: 20,
+    9: 100,
+    10: 20,
+    11: 10,
+    12: 20,
+    13: 10,
+    14: 50,
+    15: 20,
+    16: 21,
+    17: 5,
+    18: 21,
+    19: 20,
+    20: 21,
+    21: 5,
+    22: 20,
+    23: 60,
+    24: 8,
+    25: 20,
+}
+
+
+class TestGenerators(unittest.TestCase):
+    def test_every_day(self):
+        self.assertEqual(sorted(generators.GENERATORS), sorted(SIZES))
+
+    def test_seed(self):
+        for day, size in SIZES.items():
+            with self.subTest(day=day):
+                self.assertEqual(
+                    generators.generate(day, size, seed=1),
+                    generators.generate(day, size, seed=1),
+                )
+
+    def test_solvable(self):
+        """
+        Part 1 of every day solves its generated input without raising.
+        """
+        with TemporaryDirectory() as directory:
+            for solver in discover():
+                cases = [case for case in solver.cases if not case.is_test]
+
+                if solver.part != 1 or not cases:
+                    continue
+
+                size = SIZES[solver.day]
+                filename = Path(directory) / f"{solver.day}.txt"
+                filename.write_text(generators.generate(solver.day, size), "utf-8")
+                kwargs = dict(cases[0].kwargs) | generators.get_kwargs(solver.day, size)
+                case = replace(
+                    cases[0],
+                    filename=str(filename),
+                    kwargs=tuple(kwargs.items()),
+                    expected=None,
+                )
+
+                with self.subTest(solver=solver.name):
+                    outcome = run_case(solver, case, timeout=30)
+                    self.assertEqual(outcome.status, "solved", outcome.result)
+
+    def test_main(self):
+        stdout = StringIO()
+
+        with redirect_stdout(stdout):
+            generators.main(["1", "5", "--seed", "3"])
+
+        self.assertEqual(stdout.getvalue(), generators.generate(1, 5, seed=3))
+        self.assertEqual(len(stdout.getvalue().splitlines()), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+import unittest
+from heapq import heappop, heappush
+
+import numpy as np
+
+from ..coords import ORTHOGONALS
+from ..graph import UNREACHED, bfs, bfs_01, dijkstra_turns
+
+
+def get_grids(count=20, seed=0):
+    """
+    Random passable masks of assorted shapes, including single rows and
+    columns.
+    """
+    rng = np.random.default_rng(seed)
+    shapes = [(1, 1), (1, 7), (7, 1)] + [
+        tuple(rng.integers(2, 12, size=2)) for _ in range(count)
+    ]
+    return [rng.random(shape) < 0.7 for shape in shapes]
+
+
+def dijkstra(passable, sources, get_edges):
+    """
+    Textbook Dijkstra over arbitrary states.  get_edges(state) yields
+    (cost, next state) pairs.  Return a dict of the least cost to each state.
+    """
+    costs = {}
+    heap = [(0, source) for source in sources]
+
+    while heap:
+        cost, state = heappop(heap)
+
+        if state in costs:
+            continue
+
+        costs[state] = cost
+
+        for step, state_ in get_edges(state):
+            if state_ not in costs:
+                heappush(heap, (cost + step, state_))
+
+    return costs
+
+
+def get_step(passable, y, x, dy, dx):
+    y_, x_ = y + dy, x + dx
+    height, width = passable.shape
+
+    if 0 <= y_ < height and 0 <= x_ < width and passable[y_, x_]:
+        return y_, x_
+
+    return None
+
+
+def turn_in_place(costs, turn_cost):
+    """
+    Get the least cost to face each heading on each cell, turning after
+    arriving.  Opposite headings are adjacent pairs in ORTHOGONALS.
+    """
+    unreached = np.iinfo(np.int64).max // 2
+    costs = np.where(costs == UNREACHED, unreached, costs.astype(np.int64))
+    turned = np.stack(
+        [
+            np.min(
+                [
+                    costs[a] + turn_cost * (0 if a == b else 2 if a ^ 1 == b else 1)
+                    for a in range(4)
+                ],
+                axis=0,
+            )
+            for b in range(4)
+        ]
+    )
+    return np.where(turned >= unreached, UNREACHED, turned)
+
+
+class TestBfs(unittest.TestCase):
+    def test_reference(self):
+        for passable in get_grids():
+            sources = [tuple(coord) for coord in np.argwhere(passable)[:2]]
+
+            def get_edges(state):
+                for delta in ORTHOGONALS:
+                    if (state_ := get_step(passable, *state, *delta)) is not None:
+                        yield 1, state_
+
+            expected = np.full(passable.shape, UNREACHED)
+
+            for coord, cost in dijkstra(passable, sources, get_edges).items():
+                expected[coord] = cost
+
+            np.testing.assert_array_equal(bfs(passable, sources), expected)
+
+    def test_impassable_source(self):
+        passable = np.array([[False, True]])
+        np.testing.assert_array_equal(bfs(passable, [(0, 0)]), [[UNREACHED] * 2])
+
+
+class TestBfs01(unittest.TestCase):
+    def test_reference(self):
+        """
+        Entering a cell costs its random 0 or 1 cost.
+        """
+        rng = np.random.default_rng(1)
+
+        for passable in get_grids(seed=1):
+            costs = rng.integers(0, 2, passable.shape)
+            sources = [tuple(coord) for coord in np.argwhere(passable)[:2]]
+
+            def get_edges(state):
+                for delta in ORTHOGONALS:
+                    if (state_ := get_step(passable, *state, *delta)) is not None:
+                        yield int(costs[state_]), state_
+
+            expected = np.full(passable.shape, UNREACHED)
+
+            for coord, cost in dijkstra(passable, sources, get_edges).items():
+                expected[coord] = cost
+
+            np.testing.assert_array_equal(bfs_01(passable, costs, sources), expected)
+
+    def test_unit_costs(self):
+        """
+        With every cell costing 1 it's a plain breadth first search.
+        """
+        for passable in get_grids(seed=2):
+            sources = [tuple(coord) for coord in np.argwhere(passable)[:1]]
+            np.testing.assert_array_equal(
+                bfs_01(passable, np.ones(passable.shape, dtype=int), sources),
+                bfs(passable, sources),
+            )
+
+
+class TestDijkstraTurns(unittest.TestCase):
+    def test_reference(self):
+        """
+        Compare against the usual formulation where turning in place is an
+        edge of its own.  dijkstra_turns only records the heading a cell was
+        entered with, so turn its costs in place before comparing.
+        """
+        step_cost, turn_cost = 1, 1000
+
+        for passable in get_grids():
+            source = tuple(np.argwhere(passable)[0])
+
+            def get_edges(state):
+                heading, (y, x) = state
+                dy, dx = ORTHOGONALS[heading]
+
+                for turn in ((dx, -dy), (-dx, dy)):
+                    yield turn_cost, (ORTHOGONALS.index(turn), (y, x))
+
+                if (coord := get_step(passable, y, x, dy, dx)) is not None:
+                    yield step_cost, (heading, coord)
+
+            expected = np.full((4, *passable.shape), UNREACHED)
+
+            for (heading, coord), cost in dijkstra(
+                passable, [(ORTHOGONALS.index((0, 1)), source)], get_edges
+            ).items():
+                expected[(heading, *coord)] = cost
+
+            costs = dijkstra_turns(passable, source, (0, 1), step_cost, turn_cost)
+            self.assertEqual(costs[(ORTHOGONALS.index((0, 1)), *source)], 0)
+            np.testing.assert_array_equal(turn_in_place(costs, turn_cost), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import os
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import numpy as np
+from aoc_data_structures import VectorTuple
+
+from .. import parse_cache
+from ..parse_cache import ParseCache, get_helper_files, get_source_digest
+from .support import make_solver
+
+SOURCE = """
+    from aoc_utils.grid import read_grid
+
+
+    def parse(lines):
+        return len(lines)
+
+
+    def main(filename, expected=None):
+        return parse(read_grid(filename))
+
+
+    if __name__ == "__main__":
+        main("input.txt")
+"""
+
+
+class TestParseCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.cache = ParseCache(Path(self.directory.name) / "cache")
+
+    def test_array_round_trip(self):
+        array = np.arange(12, dtype=np.uint8).reshape(3, 4)
+        self.cache.put("key", array)
+        hit, value = self.cache.get("key")
+        self.assertTrue(hit)
+        np.testing.assert_array_equal(value, array)
+
+        # loaded copy-on-write, so in place edits don't reach the cache
+        value[0, 0] = 100
+        np.testing.assert_array_equal(self.cache.get("key")[1], array)
+
+    def test_pickle_round_trip(self):
+        value = {VectorTuple(1, 2): [VectorTuple(3, 4)]}
+        self.cache.put("key", value)
+        hit, loaded = self.cache.get("key")
+        self.assertTrue(hit)
+        self.assertEqual(loaded, value)
+        self.assertIsInstance(next(iter(loaded)), VectorTuple)
+
+    def test_miss(self):
+        self.assertEqual(self.cache.get("key"), (False, None))
+
+    def test_unpicklable(self):
+        self.cache.put("key", lambda: None)
+        self.assertEqual(self.cache.get("key"), (False, None))
+
+    def test_evict(self):
+        self.cache.max_bytes = 3000
+        self.cache.put("old", np.zeros(2000, dtype=np.uint8))
+        os.utime(self.cache.directory / "old.npy", (0, 0))
+        self.cache.put("new", np.zeros(2000, dtype=np.uint8))
+        self.assertFalse(self.cache.get("old")[0])
+        self.assertTrue(self.cache.get("new")[0])
+
+    def test_patch(self):
+        module = make_solver(self.directory.name, SOURCE).module()
+        parse = module.parse
+        calls = []
+
+        def counted(lines):
+            calls.append(lines)
+            return parse(lines)
+
+        module.parse = counted
+
+        with self.cache.patch(module):
+            self.assertEqual(module.parse(["ab", "cd"]), 2)
+            self.assertEqual(module.parse(["ab", "cd"]), 2)
+            self.assertEqual(module.parse(["ab"]), 1)
+
+        self.assertIs(module.parse, counted)
+        self.assertEqual(len(calls), 2)
+
+    def test_helper_files(self):
+        module = make_solver(self.directory.name, SOURCE).module()
+        names = [path.name for path in get_helper_files(module)]
+        self.assertIn("grid.py", names)
+        self.assertNotIn("parse_cache.py", names)
+
+    def test_helper_change(self):
+        module = make_solver(self.directory.name, SOURCE).module()
+        helper = Path(self.directory.name) / "helper.py"
+        helper.write_text("A = 1\n", "utf-8")
+
+        with patch.object(parse_cache, "get_helper_files", return_value=[helper]):
+            before = get_source_digest(module, module.parse)
+            helper.write_text("A = 2\n", "utf-8")
+            after = get_source_digest(module, module.parse)
+
+        self.assertNotEqual(before, after)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+
+from .. import profiling
+from ..runner import run_case
+from .support import make_solver
+
+SOURCE = """
+    def leaf(n):
+        return sum(range(n))
+
+
+    def branch(n):
+        return leaf(n) + leaf(n)
+
+
+    def main(filename, expected=None):
+        return branch(10**5)
+
+
+    if __name__ == "__main__":
+        main("input.txt")
+"""
+
+
+def function(name):
+    return ("calls.py", 1, name)
+
+
+def entry(tottime, cumtime, callers):
+    """
+    A pstats entry, (primitive calls, calls, tottime, cumtime, callers), with
+    callers mapping each caller to the cumtime spent under it.
+    """
+    return (
+        1,
+        1,
+        tottime,
+        cumtime,
+        {function(caller): (1, 1, 0, time) for caller, time in callers.items()},
+    )
+
+
+# main calls a and b, which both call c for 3s each, and main calls d, which
+# recurses into itself
+STATS = SimpleNamespace(
+    stats={
+        function("main"): entry(1, 11, {}),
+        function("a"): entry(2, 5, {"main": 5}),
+        function("b"): entry(1, 4, {"main": 4}),
+        function("c"): entry(6, 6, {"a": 3, "b": 3}),
+        function("d"): entry(1, 1, {"main": 1, "d": 0.5}),
+    }
+)
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_collapsed(self):
+        """
+        c's time is split between its callers, and d's recursion is cut off.
+        """
+        path = Path(self.directory.name) / "calls.collapsed"
+        profiling.write_collapsed(STATS, path)
+        self.assertEqual(
+            sorted(path.read_text("utf-8").splitlines()),
+            sorted(
+                [
+                    "main (calls.py:1) 1000000",
+                    "main (calls.py:1);a (calls.py:1) 2000000",
+                    "main (calls.py:1);a (calls.py:1);c (calls.py:1) 3000000",
+                    "main (calls.py:1);b (calls.py:1) 1000000",
+                    "main (calls.py:1);b (calls.py:1);c (calls.py:1) 3000000",
+                    "main (calls.py:1);d (calls.py:1) 1000000",
+                ]
+            ),
+        )
+
+    def test_label(self):
+        self.assertEqual(profiling.get_label(function("a")), "a (calls.py:1)")
+        self.assertEqual(profiling.get_label(("~", 0, "<built-in>")), "<built-in>")
+
+    def test_profile_case(self):
+        """
+        Profiling a case through the runner writes both files, with the solver
+        import kept out of the profile, and the report lists its functions.
+        """
+        solver = make_solver(self.directory.name, SOURCE)
+        (solver.path.parent / "input.txt").write_text("", "utf-8")
+        directory = Path(self.directory.name) / "profile"
+        case = solver.cases[0]
+        outcome = run_case(solver, case, profile_dir=directory)
+        self.assertEqual(outcome.status, "solved")
+
+        stem = profiling.get_stem(solver, case)
+        self.assertEqual(stem, "1_1_input")
+        lines = (directory / f"{stem}.collapsed").read_text("utf-8").splitlines()
+        stacks = [line.rpartition(" ")[0].split(";") for line in lines]
+        names = [[frame.partition(" ")[0] for frame in stack] for stack in stacks]
+        self.assertIn(["main", "branch", "leaf"], [stack[-3:] for stack in names])
+        self.assertFalse(any("find_spec" in line for line in lines))
+
+        output = StringIO()
+        profiling.report([(solver, case)], directory, count=50, file=output)
+        self.assertIn("1/solve.py:input.txt", output.getvalue())
+        self.assertIn("leaf (solve.py:", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
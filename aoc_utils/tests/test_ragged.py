@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+
+from ..ragged import get_mask, to_ragged
+
+
+def parse_lines(text):
+    """
+    Reference parser, one list per non-blank line.
+    """
+    return [[int(word) for word in line.split()] for line in text.splitlines()]
+
+
+class TestRagged(unittest.TestCase):
+    def check(self, text, fill=0):
+        rows = [row for row in parse_lines(text) if row]
+        array, lengths = to_ragged(text, fill)
+        self.assertEqual(lengths.tolist(), [len(row) for row in rows])
+        self.assertEqual(array.shape, (len(rows), max(map(len, rows), default=0)))
+
+        for row, values, length in zip(rows, array.tolist(), lengths.tolist()):
+            self.assertEqual(values[:length], row)
+            self.assertEqual(values[length:], [fill] * (len(values) - length))
+
+    def test_random(self):
+        rng = np.random.default_rng(0)
+
+        for _ in range(50):
+            lines = [
+                " ".join(map(str, rng.integers(-99, 100, rng.integers(0, 6))))
+                for _ in range(rng.integers(0, 8))
+            ]
+            text = "\n".join(lines) + ("\n" if rng.random() < 0.5 else "")
+            self.check(text, fill=int(rng.integers(-5, 5)))
+
+    def test_blank_lines(self):
+        """
+        Blank lines, including whitespace only and trailing ones, aren't
+        reports.
+        """
+        array, lengths = to_ragged("1 2\n\n \t\n3\n\n")
+        self.assertEqual(array.tolist(), [[1, 2], [3, 0]])
+        self.assertEqual(lengths.tolist(), [2, 1])
+
+    def test_empty(self):
+        for text in ("", "\n", " \n\n"):
+            array, lengths = to_ragged(text)
+            self.assertEqual(array.shape, (0, 0))
+            self.assertEqual(lengths.size, 0)
+
+    def test_bytes(self):
+        array, lengths = to_ragged(b"7 6 4\r\n1 2")
+        self.assertEqual(array.tolist(), [[7, 6, 4], [1, 2, 0]])
+        self.assertEqual(lengths.tolist(), [3, 2])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            to_ragged("1 2\n3 x\n")
+
+    def test_mask(self):
+        self.assertEqual(
+            get_mask([3, 1, 0], 3).tolist(),
+            [[True, True, True], [True, False, False], [False, False, False]],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
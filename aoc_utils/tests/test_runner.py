@@ -0,0 +1,162 @@
+import unittest
+from dataclasses import replace
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from .. import runner
+from .support import make_solver
+
+SOURCE = """
+    import time
+
+
+    def main(filename, mode="ok", expected=None):
+        if mode == "raise":
+            raise ValueError("bad input")
+
+        if mode == "sleep":
+            time.sleep(10)
+
+        with open(filename, encoding="utf-8") as f_in:
+            result = int(f_in.read())
+
+        print(result)
+        if expected is not None:
+            assert result == expected
+        return result
+
+
+    if __name__ == "__main__":
+        main("test_0.txt", "ok", 1)
+        main("test_1.txt", "ok", 5)
+        main("input.txt", "{mode}")
+        main("missing.txt")
+"""
+
+
+class TestRunner(unittest.TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def make_solver(self, mode, day=1):
+        solver = make_solver(
+            self.directory.name, SOURCE.replace("{mode}", mode), day=day
+        )
+
+        for name, value in (("test_0.txt", 1), ("test_1.txt", 2), ("input.txt", 3)):
+            (solver.path.parent / name).write_text(f"{value}\n", "utf-8")
+
+        return solver
+
+    def get_statuses(self, outcomes):
+        return {outcome.case.filename: outcome.status for outcome in outcomes}
+
+    def test_run_case(self):
+        solver = self.make_solver("ok")
+        self.assertEqual(
+            self.get_statuses(
+                runner.run_case(solver, case, timeout=5) for case in solver.cases
+            ),
+            {
+                "test_0.txt": "pass",
+                "test_1.txt": "fail",
+                "input.txt": "solved",
+                "missing.txt": "missing",
+            },
+        )
+
+    def test_timeout(self):
+        solver = self.make_solver("sleep")
+        outcome = runner.run_case(solver, solver.cases[2], timeout=0.1)
+        self.assertEqual(outcome.status, "timeout")
+        self.assertFalse(outcome.ok)
+        self.assertLess(outcome.elapsed, 5)
+
+    def test_error(self):
+        solver = self.make_solver("raise")
+        outcome = runner.run_case(solver, solver.cases[2], timeout=5)
+        self.assertEqual(outcome.status, "error")
+        self.assertEqual(outcome.result, "ValueError('bad input')")
+
+    def test_get_tasks(self):
+        solvers = [self.make_solver("ok", day=1), self.make_solver("ok", day=2)]
+        tasks = runner.get_tasks(solvers)
+        self.assertEqual(
+            [(solver.day, case.filename) for solver, case in tasks],
+            [
+                (1, "input.txt"),
+                (1, "missing.txt"),
+                (2, "input.txt"),
+                (2, "missing.txt"),
+                (1, "test_0.txt"),
+                (1, "test_1.txt"),
+                (2, "test_0.txt"),
+                (2, "test_1.txt"),
+            ],
+        )
+        self.assertTrue(
+            all(case.is_test for _, case in runner.get_tasks(solvers, inputs=False))
+        )
+        self.assertFalse(
+            any(case.is_test for _, case in runner.get_tasks(solvers, tests=False))
+        )
+
+    def test_run(self):
+        """
+        Outcomes come back in day, part and case order whatever order they ran
+        in.
+        """
+        solvers = [self.make_solver("raise", day=2), self.make_solver("ok", day=1)]
+        outcomes = runner.run(solvers, workers=2, timeout=5)
+        self.assertEqual(
+            [(outcome.solver.day, outcome.status) for outcome in outcomes],
+            [
+                (1, "pass"),
+                (1, "fail"),
+                (1, "solved"),
+                (1, "missing"),
+                (2, "pass"),
+                (2, "fail"),
+                (2, "error"),
+                (2, "missing"),
+            ],
+        )
+
+    def test_report(self):
+        solver = self.make_solver("ok")
+        outcomes = [runner.run_case(solver, case) for case in solver.cases]
+        output = StringIO()
+        runner.report(outcomes, 1.5, output)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), len(outcomes) + 4)
+        self.assertIn("1/solve.py", lines[1])
+        self.assertIn("pass", lines[1])
+        self.assertEqual(lines[-2], "wall time:  1.500s")
+
+    def test_main(self):
+        """
+        The exit code is 1 when a case fails and 0 once only passing cases are
+        run.
+        """
+        solver = self.make_solver("ok")
+        passing = replace(solver, cases=(solver.cases[0], *solver.cases[2:]))
+
+        for solvers, status in (([solver], 1), ([passing], 0)):
+            with patch.object(runner, "discover", return_value=solvers), patch.object(
+                runner, "report"
+            ) as report:
+                self.assertEqual(
+                    runner.main(["--workers", "1", "--timeout", "5"]), status
+                )
+
+            outcomes = report.call_args.args[0]
+            self.assertEqual(len(outcomes), len(solvers[0].cases))
+            self.assertEqual(
+                any(outcome.status == "fail" for outcome in outcomes), bool(status)
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
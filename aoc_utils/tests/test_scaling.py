@@ -0,0 +1,82 @@
+import unittest
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from .. import scaling
+from .support import make_solver
+
+SOURCE = """
+    import time
+
+
+    def main(filename, mode="ok", expected=None):
+        if mode == "raise":
+            raise ValueError("bad input")
+
+        if mode == "sleep":
+            time.sleep(10)
+
+        return 1
+
+
+    if __name__ == "__main__":
+        main("input.txt", "{mode}")
+"""
+
+
+class TestScaling(unittest.TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def scale(self, mode, generate=lambda day, size, seed: "1\n"):
+        solver = make_solver(self.directory.name, SOURCE.replace("{mode}", mode))
+
+        with patch.object(scaling, "generate", generate):
+            return scaling.scale([solver], sizes=(10, 20), timeout=0.2)
+
+    def test_measurements(self):
+        results, failures = self.scale("ok")
+        self.assertEqual(failures, {})
+        (measurements,) = results.values()
+        self.assertEqual([run["size"] for run in measurements], [10, 20])
+
+    def test_timeout(self):
+        results, failures = self.scale("sleep")
+        self.assertEqual(results, {})
+        self.assertEqual(list(failures.values()), [{"size": 10, "error": "timeout"}])
+
+    def test_solver_error(self):
+        _, failures = self.scale("raise")
+        (failure,) = failures.values()
+        self.assertEqual(failure["error"], "ValueError('bad input')")
+
+    def test_generator_error(self):
+        def generate(day, size, seed):
+            raise RuntimeError("no generator")
+
+        _, failures = self.scale("ok", generate)
+        (failure,) = failures.values()
+        self.assertEqual(failure["size"], 10)
+        self.assertIn("RuntimeError", failure["error"])
+
+    def test_report_separates_timeouts_and_errors(self):
+        failures = {
+            "a": {"size": 10, "error": "timeout"},
+            "b": {"size": 20, "error": "ValueError()"},
+        }
+        output = StringIO()
+        scaling.report({}, failures, output)
+        timeouts, errors = output.getvalue().split("\nerrors\n")
+        self.assertIn("a", timeouts)
+        self.assertIn("ValueError()", errors)
+        self.assertNotIn("timeout", errors)
+
+    def test_exponent(self):
+        measurements = [
+            {"bytes": 10, "seconds": 1.0},
+            {"bytes": 100, "seconds": 100.0},
+        ]
+        self.assertAlmostEqual(scaling.get_exponent(measurements), 2.0)
+        self.assertIsNone(scaling.get_exponent(measurements[:1]))
@@ -0,0 +1,96 @@
+import unittest
+from io import BytesIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from ..solvers import ROOT, load_module
+
+scan = load_module(ROOT / "3" / "scan.py")
+solve2 = load_module(ROOT / "3" / "solve2.py")
+
+TOKENS = (b"mul(2,4)", b"mul(123,45)", b"do()", b"don't()", b"mul(9,", b"x", b"(")
+
+
+def get_expected(data):
+    """
+    The sum of every mul instruction and of the enabled ones, from the
+    single pass solver.
+    """
+    total = sum(
+        int(x) * int(y)
+        for x, y, _ in (match.groups() for match in solve2.PATTERN.finditer(data))
+        if x is not None
+    )
+    return total, solve2.scan(data)[0]
+
+
+def get_inputs(count=30, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        b"".join(TOKENS[idx] for idx in rng.integers(0, len(TOKENS), 20))
+        for _ in range(count)
+    ]
+
+
+class TestScan(unittest.TestCase):
+    def combine_chunks(self, data, chunk_size):
+        partials = [
+            scan.scan_chunk(data, start, start + chunk_size)
+            for start in range(0, len(data), chunk_size)
+        ]
+        return scan.combine(partials)[:2]
+
+    def test_chunks(self):
+        """
+        Every chunk size, so instructions cross boundaries at every offset.
+        """
+        for data in get_inputs():
+            expected = get_expected(data)
+
+            for chunk_size in range(1, scan.MAX_LENGTH + 3):
+                self.assertEqual(self.combine_chunks(data, chunk_size), expected)
+
+    def test_crossing(self):
+        data = b"xmul(123,456)x"
+
+        for chunk_size in range(1, len(data) + 1):
+            self.assertEqual(
+                self.combine_chunks(data, chunk_size), (123 * 456, 123 * 456)
+            )
+
+    def test_state(self):
+        """
+        A chunk without do() or don't() inherits the state of the chunks before
+        it, and one which only toggles contributes nothing itself.
+        """
+        data = b"don't()" + b"." * 20 + b"mul(2,3)" + b"." * 20 + b"do()mul(4,5)"
+        self.assertEqual(self.combine_chunks(data, 10), (26, 20))
+
+        partials = [scan.Partial(0, (0, 0), False), scan.Partial(6, (0, 6), None)]
+        self.assertEqual(scan.combine(partials), (6, 0, False))
+        self.assertEqual(scan.combine(partials[1:], enabled=False), (6, 0, False))
+
+    def test_stream(self):
+        for data in get_inputs(10):
+            expected = get_expected(data)
+
+            for block_size in (1, 2, 5, 13, 1000):
+                self.assertEqual(scan.solve_stream(BytesIO(data), block_size), expected)
+
+    def test_solve(self):
+        data = b"".join(get_inputs(5))
+
+        with TemporaryDirectory() as directory:
+            filename = Path(directory) / "input.txt"
+            filename.write_bytes(data)
+            self.assertEqual(
+                scan.solve(filename, chunk_size=17, workers=2), get_expected(data)
+            )
+            filename.write_bytes(b"")
+            self.assertEqual(scan.solve(filename), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
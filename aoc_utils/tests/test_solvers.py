@@ -0,0 +1,118 @@
+"""
+Golden-answer regression tests for the solvers.
+
+Every test file case is checked against the expected value in its solver's
+__main__ block, and every puzzle input case against the answer recorded in
+golden.json.
+
+Wall-clock budgets vary too much between machines to fail a run by default, so
+each puzzle input case is only stopped once it takes several times its day's
+budget in golden.json, which catches hangs.  Set AOC_ENFORCE_BUDGETS=1 to also
+require each day to finish within its budget, so a rewrite which keeps the
+answers but regresses the runtime fails too.
+
+The puzzle inputs take several minutes in total, set AOC_SKIP_INPUTS=1 to only
+run the test files.
+
+usage:
+    python -m unittest aoc_utils.tests.test_solvers
+    python -m unittest aoc_utils.tests.test_solvers.TestInputs.test_day_06
+"""
+
+import json
+import os
+import unittest
+from dataclasses import replace
+from pathlib import Path
+from time import perf_counter
+
+from ..runner import run_case
+from ..solvers import discover
+
+GOLDEN = json.loads((Path(__file__).parent / "golden.json").read_text("utf-8"))
+SOLVERS = discover()
+DAYS = sorted({solver.day for solver in SOLVERS})
+ENFORCE_BUDGETS = bool(os.environ.get("AOC_ENFORCE_BUDGETS"))
+
+# multiple of the day's budget allowed per case when budgets aren't enforced
+HEADROOM = 10
+
+
+def get_golden(solver, case):
+    """
+    Get the case with its expected value set to the recorded answer, or None if
+    no answer is recorded.
+    """
+    for golden in GOLDEN["answers"].get(solver.name, []):
+        if golden["kwargs"] == dict(case.kwargs):
+            return replace(case, expected=golden["answer"])
+
+    return None
+
+
+class TestExamples(unittest.TestCase):
+    def test_examples(self):
+        for solver in SOLVERS:
+            for case in solver.cases:
+                if not case.is_test or case.expected is None:
+                    continue
+
+                with self.subTest(solver=solver.name, case=case):
+                    outcome = run_case(solver, case, timeout=60)
+                    self.assertEqual(outcome.status, "pass", outcome.result)
+
+
+@unittest.skipIf(os.environ.get("AOC_SKIP_INPUTS"), "AOC_SKIP_INPUTS is set")
+class TestInputs(unittest.TestCase):
+    def check_day(self, day):
+        """
+        Check the answers to the day's puzzle inputs.  When budgets are
+        enforced each case may only use what is left of the day's budget, so a
+        slow case times out rather than holding up the run.
+        """
+        budget = GOLDEN["budgets"].get(str(day))
+        cases = [
+            (solver, case)
+            for solver in SOLVERS
+            if solver.day == day
+            for case in solver.cases
+            if not case.is_test and solver.filename(case).exists()
+        ]
+
+        if budget is None or not cases:
+            self.skipTest(f"no golden answers or inputs for day {day}")
+
+        start = perf_counter()
+
+        for solver, case in cases:
+            golden = get_golden(solver, case)
+
+            with self.subTest(solver=solver.name, case=case):
+                self.assertIsNotNone(golden, "no golden answer recorded")
+
+                if ENFORCE_BUDGETS:
+                    timeout = max(budget - (perf_counter() - start), 0.001)
+                else:
+                    timeout = budget * HEADROOM
+
+                outcome = run_case(solver, golden, timeout=timeout)
+                self.assertEqual(outcome.status, "pass", outcome.result)
+
+        if ENFORCE_BUDGETS:
+            self.assertLessEqual(perf_counter() - start, budget)
+
+
+def add_day(day):
+    def test(self):
+        self.check_day(day)
+
+    test.__doc__ = f"Day {day} puzzle inputs."
+    setattr(TestInputs, f"test_day_{day:02}", test)
+
+
+for day_ in DAYS:
+    add_day(day_)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from importlib.util import find_spec
+from tempfile import TemporaryDirectory
+
+from .. import startup
+from .support import make_solver
+
+SOURCE = """
+    import networkx as nx
+
+
+    def main(filename, expected=None):
+        return nx.Graph()
+"""
+
+
+class TestStartup(unittest.TestCase):
+    def test_parse_importtime(self):
+        stderr = "\n".join(
+            [
+                "import time: self [us] | cumulative | imported package",
+                "import time:       100 |        100 | before",
+                startup.MARKER,
+                "import time:        50 |         50 |   nested",
+                "import time:       200 |       2000 | numpy",
+                "import time:       300 |        300 | json",
+            ]
+        )
+        self.assertEqual(
+            startup.parse_importtime(stderr), [(0.002, "numpy"), (0.0003, "json")]
+        )
+
+    @unittest.skipIf(find_spec("networkx") is None, "networkx isn't installed")
+    def test_eager_by_default(self):
+        with TemporaryDirectory() as directory:
+            solver = make_solver(directory, SOURCE)
+            eager = startup.probe(solver.path)
+            lazy = startup.probe(solver.path, lazy=True)
+
+        self.assertIn("networkx", [name for _, name in eager.imports])
+        self.assertNotIn("networkx", [name for _, name in lazy.imports])
+        self.assertGreater(eager.load, lazy.load)
+
+    def test_budget(self):
+        with TemporaryDirectory() as directory:
+            solver = make_solver(directory, "def main(filename):\n    pass\n")
+            startups = startup.measure([solver], repeat=1)
+
+        self.assertEqual(list(startups), [solver.name])
+        self.assertLess(startups[solver.name].load, 0.5)
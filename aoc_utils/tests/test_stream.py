@@ -0,0 +1,105 @@
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from ..solvers import ROOT, discover, load_module
+
+stream = load_module(ROOT / "1" / "stream.py")
+
+
+def get_runs(rng, count=4):
+    """
+    Sorted runs of assorted lengths with many repeated values, including an
+    empty run.
+    """
+    return [
+        np.sort(rng.integers(0, 20, size)) for size in rng.integers(0, 30, count)
+    ] + [np.empty(0, dtype=np.int64)]
+
+
+class TestStream(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def test_merge(self):
+        for _ in range(20):
+            runs = get_runs(self.rng)
+            expected = np.sort(np.concatenate(runs))
+
+            for block_size in (1, 2, 3, 100):
+                blocks = list(stream.merge(runs, block_size))
+                np.testing.assert_array_equal(np.concatenate(blocks), expected)
+
+    def test_run_lengths(self):
+        for _ in range(20):
+            values = np.sort(self.rng.integers(0, 10, self.rng.integers(1, 40)))
+            expected = np.unique(values, return_counts=True)
+
+            for block_size in (1, 2, 5):
+                blocks = [
+                    values[idx : idx + block_size]
+                    for idx in range(0, values.size, block_size)
+                ]
+                pairs = list(stream.run_lengths(iter(blocks)))
+                np.testing.assert_array_equal(
+                    np.concatenate([pair[0] for pair in pairs]), expected[0]
+                )
+                np.testing.assert_array_equal(
+                    np.concatenate([pair[1] for pair in pairs]), expected[1]
+                )
+
+    def test_similarity(self):
+        for _ in range(20):
+            runs_0, runs_1 = get_runs(self.rng), get_runs(self.rng)
+            column_0, column_1 = np.concatenate(runs_0), np.concatenate(runs_1)
+            expected = sum(
+                int(value) * int((column_1 == value).sum()) for value in column_0
+            )
+
+            for block_size in (1, 2, 7):
+                similarity = stream.get_similarity(
+                    stream.run_lengths(stream.merge(runs_0, block_size)),
+                    stream.run_lengths(stream.merge(runs_1, block_size)),
+                )
+                self.assertEqual(similarity, expected)
+
+    def test_main(self):
+        """
+        Tiny chunks and blocks give the same answers as the in-memory solvers.
+        """
+        solvers = {solver.part: solver for solver in discover([1])}
+
+        with TemporaryDirectory() as directory:
+            filename = Path(directory) / "input.txt"
+
+            for lines in (1, 5, 50):
+                columns = self.rng.integers(1, 10, (lines, 2))
+                filename.write_text(
+                    "".join(f"{a}   {b}\n" for a, b in columns.tolist()), "utf-8"
+                )
+
+                with redirect_stdout(StringIO()):
+                    expected = tuple(
+                        solvers[part].module().main(str(filename)) for part in (1, 2)
+                    )
+
+                    for chunk_size, block_size in (
+                        (1, 1),
+                        (7, 2),
+                        (30, 3),
+                        (10**6, 10),
+                    ):
+                        self.assertEqual(
+                            stream.main(
+                                str(filename), chunk_size, block_size, directory
+                            ),
+                            expected,
+                        )
+
+
+if __name__ == "__main__":
+    unittest.main()
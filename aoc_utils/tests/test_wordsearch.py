@@ -0,0 +1,118 @@
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from itertools import product
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from ..coords import DIAGONALS, ORTHOGONALS
+from ..solvers import ROOT
+from ..wordsearch import WordSearch, main
+
+
+def brute_force(board, words):
+    """
+    Try every word from every cell in every direction.
+    """
+    height, width = board.shape
+    positions = {word: [] for word in words}
+
+    for word in positions:
+        encoded = word.encode("utf-8") if isinstance(word, str) else bytes(word)
+
+        for (y, x), (dy, dx) in product(
+            product(range(height), range(width)), ORTHOGONALS + DIAGONALS
+        ):
+            cells = [(y + idx * dy, x + idx * dx) for idx in range(len(encoded))]
+
+            if (
+                all(0 <= y_ < height and 0 <= x_ < width for y_, x_ in cells)
+                and bytes(board[y_, x_] for y_, x_ in cells) == encoded
+            ):
+                positions[word].append(((y, x), (dy, dx)))
+
+    return positions
+
+
+def get_board(rng, shape, letters=b"AB"):
+    return rng.choice(np.frombuffer(letters, dtype=np.uint8), shape)
+
+
+class TestWordSearch(unittest.TestCase):
+    def check(self, board, words):
+        search = WordSearch(words)
+        expected = brute_force(board, words)
+        positions = search.search(board)
+        self.assertEqual(set(positions), set(expected))
+
+        for word, found in positions.items():
+            self.assertEqual(sorted(found), sorted(expected[word]), word)
+
+        self.assertEqual(
+            search.count(board), {word: len(found) for word, found in expected.items()}
+        )
+
+    def test_random(self):
+        rng = np.random.default_rng(0)
+
+        for _ in range(20):
+            shape = tuple(rng.integers(1, 8, size=2))
+            self.check(get_board(rng, shape), ["AB", "ABB", "BAAB", "B"])
+
+    def test_palindromes(self):
+        """
+        A palindrome matches both ways along its line, as the brute force does.
+        """
+        rng = np.random.default_rng(1)
+
+        for _ in range(10):
+            self.check(get_board(rng, (5, 6)), ["ABA", "AA", "BAAB"])
+
+    def test_word_and_reverse(self):
+        rng = np.random.default_rng(2)
+
+        for _ in range(10):
+            self.check(get_board(rng, (5, 5)), ["AAB", "BAA", "AB", "BA"])
+
+    def test_lines(self):
+        rng = np.random.default_rng(3)
+
+        for shape in ((1, 1), (1, 9), (9, 1)):
+            self.check(get_board(rng, shape), ["A", "AB", "ABA", "BBB"])
+
+    def test_positions(self):
+        board = np.frombuffer(b"XMAS.SAMX", dtype=np.uint8).reshape(1, 9)
+        self.assertEqual(
+            WordSearch(["XMAS"]).search(board),
+            {"XMAS": [((0, 0), (0, 1)), ((0, 8), (0, -1))]},
+        )
+
+    def test_too_long(self):
+        board = get_board(np.random.default_rng(4), (3, 3))
+        self.assertEqual(WordSearch(["AAAA"]).count(board), {"AAAA": 0})
+
+    def test_bytes_and_duplicates(self):
+        rng = np.random.default_rng(5)
+        self.check(get_board(rng, (4, 4)), [b"AB", "AB", "AB"])
+
+    def test_empty_word(self):
+        with self.assertRaises(ValueError):
+            WordSearch(["XMAS", ""])
+
+    def test_day_4(self):
+        stdout = StringIO()
+
+        with TemporaryDirectory() as directory:
+            words = Path(directory) / "words.txt"
+            words.write_text("XMAS\n\nSAMX\n", "utf-8")
+
+            with redirect_stdout(stdout):
+                main([str(ROOT / "4" / "test_0.txt"), "--words-file", str(words)])
+
+        self.assertEqual(stdout.getvalue(), "XMAS 18\nSAMX 18\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
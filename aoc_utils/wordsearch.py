@@ -0,0 +1,224 @@
+"""
+Search a letter grid for many words at once in all 8 directions.
+
+The words are compiled into an Aho-Corasick automaton, a trie whose failure
+links let a single left to right pass over a line find every occurrence of
+every word, so the cost is linear in the grid size however many words there
+are.  Only the four forward line families (rows, columns, diagonals and
+anti-diagonals) are scanned; each word is also added reversed, and a match of
+a reversed word is reported as the word read in the opposite direction.
+
+Positions are reported as the (y, x) of the first letter and the (dy, dx)
+direction of reading, with directions from aoc_utils.coords.
+
+usage:
+    python -m aoc_utils.wordsearch 4/input.txt XMAS
+    python -m aoc_utils.wordsearch grid.txt --words-file words.txt --positions
+"""
+
+import sys
+from argparse import ArgumentParser
+from collections import deque
+
+import numpy as np
+
+from .grid import read_grid
+
+# the forward line families, the other 4 directions are their reverses
+LINES = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+class WordSearch:
+    """
+    An Aho-Corasick automaton over a set of words and their reverses.  Words
+    may be str or bytes, and are reported as given.  An empty word would match
+    between every pair of letters, so it's rejected.
+    """
+
+    def __init__(self, words):
+        self.words = list(dict.fromkeys(words))
+        self.patterns = []
+
+        if any(len(word) == 0 for word in self.words):
+            raise ValueError("words must not be empty")
+
+        for word in self.words:
+            encoded = word.encode("utf-8") if isinstance(word, str) else bytes(word)
+            self.patterns.append((word, encoded, False))
+            self.patterns.append((word, encoded[::-1], True))
+
+        self.build()
+
+    def build(self):
+        """
+        Build the trie, then complete it into a transition table with a
+        breadth first pass over the failure links.  Letters which don't occur
+        in any word share symbol 0, which always falls back to the root.
+        """
+        letters = sorted(
+            {letter for _, pattern, _ in self.patterns for letter in pattern}
+        )
+        self.symbols = bytearray(256)
+
+        for symbol, letter in enumerate(letters, 1):
+            self.symbols[letter] = symbol
+
+        size = len(letters) + 1
+        self.table = [[0] * size]
+        self.outputs = [[]]
+
+        for idx, (_, pattern, _) in enumerate(self.patterns):
+            state = 0
+
+            for letter in pattern:
+                symbol = self.symbols[letter]
+
+                if self.table[state][symbol] == 0:
+                    self.table[state][symbol] = len(self.table)
+                    self.table.append([0] * size)
+                    self.outputs.append([])
+
+                state = self.table[state][symbol]
+
+            self.outputs[state].append(idx)
+
+        failures = [0] * len(self.table)
+        queue = deque(state for state in self.table[0] if state)
+
+        while queue:
+            state = queue.popleft()
+            failure = failures[state]
+            self.outputs[state] = self.outputs[state] + self.outputs[failure]
+
+            for symbol, child in enumerate(self.table[state]):
+                if child:
+                    failures[child] = self.table[failure][symbol]
+                    queue.append(child)
+                else:
+                    self.table[state][symbol] = self.table[failure][symbol]
+
+    def scan(self, line):
+        """
+        Yield (pattern index, end index) for every match in a line of bytes.
+        """
+        table = self.table
+        outputs = self.outputs
+        state = 0
+
+        for end, symbol in enumerate(line.translate(self.symbols)):
+            state = table[state][symbol]
+
+            for idx in outputs[state]:
+                yield idx, end
+
+    def search(self, board):
+        """
+        Find every occurrence of every word in a uint8 board.  Return a dict
+        mapping each word to a list of ((y, x), (dy, dx)) positions.
+        """
+        positions = {word: [] for word in self.words}
+
+        for direction, ys, xs in get_lines(board.shape):
+            line = board[ys, xs].tobytes()
+
+            for idx, end in self.scan(line):
+                word, pattern, reverse = self.patterns[idx]
+
+                # a reversed word starts at the end of its match
+                if reverse:
+                    first, delta = end, (-direction[0], -direction[1])
+                else:
+                    first, delta = end - len(pattern) + 1, direction
+
+                positions[word].append(((int(ys[first]), int(xs[first])), delta))
+
+        return positions
+
+    def count(self, board):
+        """
+        Count the occurrences of every word in a uint8 board.
+        """
+        counts = [0] * len(self.patterns)
+
+        for _, ys, xs in get_lines(board.shape):
+            for idx, _ in self.scan(board[ys, xs].tobytes()):
+                counts[idx] += 1
+
+        totals = dict.fromkeys(self.words, 0)
+
+        for (word, _, _), count in zip(self.patterns, counts):
+            totals[word] += count
+
+        return totals
+
+
+def get_lines(shape):
+    """
+    Yield (direction, ys, xs) for every line of a grid in the forward line
+    families, each starting at a cell on the top, left or right edge whose
+    predecessor is off the grid.
+    """
+    height, width = shape
+    top = [(0, x) for x in range(width)]
+    left = [(y, 0) for y in range(height)]
+    right = [(y, width - 1) for y in range(1, height)]
+    starts = {
+        (0, 1): left,
+        (1, 0): top,
+        (1, 1): top + left[1:],
+        (1, -1): top + right,
+    }
+
+    for dy, dx in LINES:
+        for y, x in starts[dy, dx]:
+            steps = np.arange(get_length(shape, (y, x), (dy, dx)))
+            yield (dy, dx), y + dy * steps, x + dx * steps
+
+
+def get_length(shape, start, direction):
+    """
+    Get the number of cells from start to the edge of the grid, inclusive.
+    """
+    (height, width), (y, x), (dy, dx) = shape, start, direction
+    limits = []
+
+    if dy:
+        limits.append(height - y if dy > 0 else y + 1)
+
+    if dx:
+        limits.append(width - x if dx > 0 else x + 1)
+
+    return min(limits)
+
+
+def get_parser():
+    parser = ArgumentParser(description="Search a letter grid for words.")
+    parser.add_argument("grid")
+    parser.add_argument("words", nargs="*")
+    parser.add_argument("--words-file", help="file with one word per line")
+    parser.add_argument("--positions", action="store_true", help="list positions")
+    return parser
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    words = list(args.words)
+
+    if args.words_file is not None:
+        with open(args.words_file, encoding="utf-8") as f_in:
+            words.extend(line.strip() for line in f_in if line.strip())
+
+    board = read_grid(args.grid)
+    search = WordSearch(words)
+
+    if args.positions:
+        for word, positions in search.search(board).items():
+            for (y, x), (dy, dx) in positions:
+                print(f"{word} {y} {x} {dy} {dx}")
+    else:
+        for word, count in search.count(board).items():
+            print(f"{word} {count}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,8 @@
 #!/usr/bin/env python3
 
 import re
-import math
 import itertools
 import numpy as np
-import networkx as nx
 
 
 def solve(parsed):
@@ -30,6 +28,7 @@ def main(filename, expected=None):
     print(result)
     if expected is not None:
         assert result == expected
+    return result
 
 
 if __name__ == "__main__":